@@ -0,0 +1,245 @@
+"""SceneBenchmark.py
+
+Created on 2025-11-02
+
+Per-scene update and render timing.
+Each scenario builds one scene and steps it on the SDL dummy drivers
+with a synthetic fixed-step clock and scripted input, timing the update
+and the render of every tick separately. Results are summarized as
+percentiles, so runs can be compared between commits.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import glob
+import math
+import os
+import random
+import re
+import time
+import numpy as np
+import pygame
+from src.GameClock import GameClock
+from src.InputState import InputState
+from src.FrameContext import FrameContext
+from src.HeadlessRunner import HeadlessRunner, autopilot
+from src.SoundManager import SoundManager
+
+
+def summarize(samples):
+    """Summarize timing samples.
+
+    Args:
+        samples (list): Durations in seconds.
+
+    Returns:
+        dict: p50, p95, p99, mean and max, in milliseconds.
+    """
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    ms = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99),
+            "mean": float(ms.mean()), "max": float(ms.max())}
+
+
+def menu_script(tick, scene, previous):
+    """Input for menus: sweep the mouse over the buttons, browse with keys.
+
+    Never clicks nor presses RETURN, so the menu stays on screen.
+
+    Args:
+        tick (int): Index of the tick about to be simulated.
+        scene (Scene): The menu being benchmarked.
+        previous (InputState): Snapshot of the previous tick.
+
+    Returns:
+        InputState: The snapshot for this tick.
+    """
+    frame = FrameContext.current()
+    angle = tick / 60.0
+    mouse_pos = (int(frame.width / 2 + math.cos(angle) * frame.width / 4),
+                 int(frame.height / 2 + math.sin(angle) * frame.height / 3))
+    # Tap DOWN every half second to move the keyboard selection
+    keys = (pygame.K_DOWN,) if tick % 60 < 2 else ()
+    return InputState.from_keys(keys, previous, mouse_pos)
+
+
+def level_script(tick, scene, previous):
+    """Input for levels: the headless runner's autopilot."""
+    return InputState.from_keys(autopilot(tick, scene), previous)
+
+
+def build_stress_level(bricks, balls, seed=0):
+    """Build a Brick Breaker level with a generated layout.
+
+    Args:
+        bricks (int): Number of bricks, packed in a grid at the top of
+            the screen.
+        balls (int): Number of balls in play from the first tick (capped
+            by the level's ball pool).
+        seed (int): Random seed for the brick types and ball positions.
+
+    Returns:
+        BrickBreakerLevel: The level.
+    """
+    from src.BrickBreakerLevel import BrickBreakerLevel
+    from src.BrickField import BrickField
+
+    width, height = FrameContext.current().size
+    rng = np.random.default_rng(seed)
+    cols = max(1, math.ceil(math.sqrt(bricks * 2)))
+    rows = max(1, math.ceil(bricks / cols))
+    pitch_x = max(2, (width - 20) // cols)
+    pitch_y = max(2, min(35, (height // 2) // rows))
+    grid = np.full(rows * cols, -1, dtype=np.int8)
+    grid[:bricks] = rng.integers(0, len(BrickField.TYPE_NAMES), bricks)
+    field = BrickField.from_grid(
+        grid.reshape(rows, cols), (width - cols * pitch_x) // 2, 10,
+        pitch_x - 1, pitch_y - 1, 1, 1)
+
+    scene = BrickBreakerLevel(players=1, level_number=0, brick_field=field)
+    top = 10 + rows * pitch_y + 10
+    for _ in range(balls - 1):
+        position = (rng.uniform(20, width - 40),
+                    rng.uniform(top, max(top + 1, height - 200)))
+        if scene.balls.spawn(has_to_wait=False, position=position) is None:
+            break
+    return scene
+
+
+class Scenario:
+    """One scene to benchmark.
+
+    Attributes:
+        name (str): Name used in the reports.
+        build (callable): Creates the scene.
+        script (callable): Called as script(tick, scene, previous) before
+            each tick; returns the InputState of that tick.
+    """
+
+    def __init__(self, name, build, script):
+        self.name = name
+        self.build = build
+        self.script = script
+
+
+def default_scenarios(stress=((500, 16), (2000, 64), (5000, 256))):
+    """Scenarios for every scene, level file and stress layout.
+
+    Args:
+        stress (iterable): (bricks, balls) pairs of generated levels.
+
+    Returns:
+        list: Scenario objects.
+    """
+    from src.MainMenu import MainMenu
+    from src.SettingsMenu import SettingsMenu
+    from src.PongLevel import PongLevel
+    from src.BrickBreakerLevel import BrickBreakerLevel
+
+    scenarios = [
+        Scenario("MainMenu", MainMenu, menu_script),
+        Scenario("SettingsMenu", lambda: SettingsMenu((240, True, 120)),
+                 menu_script),
+        Scenario("PongLevel[ai-vs-ai]",
+                 lambda: PongLevel(players=0, difficulty="HARD"),
+                 level_script),
+    ]
+    for path in sorted(glob.glob("levels/level_*.txt")):
+        number = int(re.search(r"(\d+)", os.path.basename(path)).group(1))
+        scenarios.append(Scenario(
+            f"BrickBreakerLevel[{os.path.basename(path)}]",
+            lambda number=number: BrickBreakerLevel(
+                players=1, level_number=number),
+            level_script))
+    for bricks, balls in stress:
+        scenarios.append(Scenario(
+            f"BrickBreakerLevel[stress {bricks} bricks {balls} balls]",
+            lambda bricks=bricks, balls=balls: build_stress_level(
+                bricks, balls),
+            level_script))
+    return scenarios
+
+
+class SceneBenchmark:
+    """Times scenes tick by tick on a synthetic clock.
+
+    Attributes:
+        ticks (int): Ticks measured per scenario.
+        warmup (int): Ticks run before measuring (caches, first renders).
+        tick_rate (int): Simulation ticks per second.
+        size (tuple): Virtual screen size (width, height).
+        seed (int): Random seed, reset before every scenario.
+    """
+
+    def __init__(self, ticks=600, warmup=60, tick_rate=120,
+                 size=(1280, 720), seed=0):
+        """Initialize the benchmark.
+
+        Args:
+            ticks (int): Ticks measured per scenario.
+            warmup (int): Ticks run before measuring.
+            tick_rate (int): Simulation ticks per second.
+            size (tuple): Virtual screen size (width, height).
+            seed (int): Random seed.
+        """
+        self.ticks = ticks
+        self.warmup = warmup
+        self.tick_rate = tick_rate
+        self.size = size
+        self.seed = seed
+
+    def run(self, scenario):
+        """Benchmark one scenario.
+
+        The scene is rebuilt if it ends (level cleared, game over) before
+        every tick has been measured; the rebuild is not timed.
+
+        Args:
+            scenario (Scenario): The scene to time.
+
+        Returns:
+            dict: name, ticks measured, rebuilds, and the "update" and
+                "render" summaries (see summarize()).
+        """
+        screen = (pygame.display.get_surface()
+                  or HeadlessRunner.init_display(self.size))
+        random.seed(self.seed)
+        clock = GameClock(self.tick_rate).install()
+        state = InputState().install()
+        scene = scenario.build()
+        sounds = SoundManager()
+        update_times = []
+        render_times = []
+        rebuilds = 0
+
+        perf_counter = time.perf_counter
+        for tick in range(self.warmup + self.ticks):
+            pygame.event.pump()
+            state = scenario.script(tick, scene, state).install()
+
+            start = perf_counter()
+            clock.advance()
+            result = scene.update()
+            sounds.flush()
+            updated = perf_counter()
+            screen.fill("BLACK")
+            scene.render(screen)
+            rendered = perf_counter()
+
+            if tick >= self.warmup:
+                update_times.append(updated - start)
+                render_times.append(rendered - updated)
+            if result is not None:
+                scene = scenario.build()
+                rebuilds += 1
+
+        return {
+            "name": scenario.name,
+            "ticks": len(update_times),
+            "rebuilds": rebuilds,
+            "update": summarize(update_times),
+            "render": summarize(render_times),
+        }
@@ -0,0 +1,9 @@
+"""benchmarks
+
+Created on 2025-11-02
+
+Frame-time benchmarks of the game scenes.
+Run with ``python -m benchmarks``; see benchmarks/__main__.py.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
@@ -0,0 +1,159 @@
+"""__main__.py
+
+Created on 2025-11-02
+
+Command line entry point of the scene benchmarks:
+
+    python -m benchmarks
+    python -m benchmarks --only Brick --ticks 1200 --output base.json
+    python -m benchmarks --compare base.json
+
+Prints update and render p50/p95/p99 per scene, and optionally saves
+them as JSON or compares them with a previous run.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import pygame
+from .SceneBenchmark import SceneBenchmark, default_scenarios
+from src.HeadlessRunner import HeadlessRunner
+
+
+def git_commit():
+    """Short hash of the checked out commit (None outside a git tree)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_stress(value):
+    """Parse a BRICKSxBALLS stress layout, e.g. 2000x64."""
+    bricks, balls = value.lower().split("x")
+    return int(bricks), int(balls)
+
+
+def parse_args(argv=None):
+    """Parse the command line options.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the update and render of every scene.")
+    parser.add_argument("--ticks", type=int, default=600,
+                        help="ticks measured per scene")
+    parser.add_argument("--warmup", type=int, default=60,
+                        help="ticks run before measuring")
+    parser.add_argument("--tick-rate", type=int, default=120,
+                        help="simulation ticks per second")
+    parser.add_argument("--size", default="1280x720",
+                        help="virtual screen size")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--only", action="append", default=[],
+                        help="only run scenes whose name contains this text "
+                             "(repeatable)")
+    parser.add_argument("--stress", action="append", type=parse_stress,
+                        help="generated level as BRICKSxBALLS, e.g. 2000x64 "
+                             "(repeatable; replaces the default layouts)")
+    parser.add_argument("--output", help="save the results to a JSON file")
+    parser.add_argument("--compare",
+                        help="JSON file of a previous run to compare with")
+    return parser.parse_args(argv)
+
+
+def print_results(results, baseline=None):
+    """Print a table of the results.
+
+    Args:
+        results (list): Scenario results from SceneBenchmark.run().
+        baseline (dict): Previous results keyed by scenario name; adds the
+            relative change of each p50/p99.
+    """
+    print(f"{'scene':<52} {'update p50/p95/p99 ms':>24} "
+          f"{'render p50/p95/p99 ms':>24}")
+    for result in results:
+        line = f"{result['name']:<52}"
+        for phase in ("update", "render"):
+            times = result[phase]
+            line += (f" {times['p50']:>7.3f} {times['p95']:>7.3f} "
+                     f"{times['p99']:>7.3f}")
+        print(line)
+        previous = (baseline or {}).get(result["name"])
+        if previous is not None:
+            changes = []
+            for phase in ("update", "render"):
+                for key in ("p50", "p99"):
+                    before = previous[phase][key]
+                    after = result[phase][key]
+                    change = (after - before) / before * 100 if before else 0
+                    changes.append(f"{phase} {key} {change:+.1f}%")
+            print(f"{'':<4}vs baseline: " + ", ".join(changes))
+
+
+def main(argv=None):
+    """Run the benchmarks.
+
+    Args:
+        argv (list): Command line arguments (defaults to sys.argv).
+
+    Returns:
+        dict: The report, as saved with --output.
+    """
+    args = parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    HeadlessRunner.init_display((width, height))
+
+    benchmark = SceneBenchmark(ticks=args.ticks, warmup=args.warmup,
+                               tick_rate=args.tick_rate,
+                               size=(width, height), seed=args.seed)
+    scenarios = (default_scenarios(args.stress) if args.stress
+                 else default_scenarios())
+    if args.only:
+        scenarios = [scenario for scenario in scenarios
+                     if any(text in scenario.name for text in args.only)]
+
+    results = [benchmark.run(scenario) for scenario in scenarios]
+    report = {
+        "commit": git_commit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "ticks": args.ticks,
+        "warmup": args.warmup,
+        "tick_rate": args.tick_rate,
+        "size": [width, height],
+        "seed": args.seed,
+        "results": results,
+    }
+    pygame.quit()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {result["name"]: result
+                        for result in json.load(f)["results"]}
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,86 @@ __author__ = "carras_a"
 __version__ = "1.0"
 
 
+import time
+# Reference point of the --startup-profile report
+STARTUP_START = time.perf_counter()
+
+import argparse
 import pygame
 from src.game import Game
+from src.FrameContext import FrameContext
+from src.AssetManager import AssetManager
+from src.TextCache import TextCache
+from src.Tracer import Tracer
+from src.SoundManager import SoundManager
+
+IMPORTS_DONE = time.perf_counter()
+
 
+def print_asset_report():
+    """Print the memory kept resident by every loaded asset, and the
+    text cache counters."""
+    report = AssetManager().memory_report()
+    for asset in report["assets"]:
+        size = "x".join(map(str, asset["size"])) if asset["size"] else "-"
+        print(f"{asset['kind']:<8} {asset['bytes']:>10} B  {size:>10}  "
+              f"{asset['key']}")
+    print(f"Total: {report['total_bytes'] / 1024:.1f} KiB "
+          f"in {len(report['assets'])} assets")
+    text = TextCache().get_stats()
+    print(f"Text cache: {text['surfaces']}/{text['capacity']} surfaces, "
+          f"{text['fonts']} fonts, {text['hits']} hits, {text['misses']} "
+          f"misses ({text['hit_rate']:.0%}), {text['evictions']} evictions")
 
-def main():
+
+def print_startup_report(marks):
+    """Print how long each startup step took.
+
+    Args:
+        marks (list): (step, time.perf_counter() at its end) pairs, in
+            order; the first step started at STARTUP_START.
+    """
+    previous = STARTUP_START
+    for step, end in marks:
+        print(f"{step:<14} {(end - previous) * 1000:8.1f} ms")
+        previous = end
+    print(f"{'first frame at':<14} {(previous - STARTUP_START) * 1000:8.1f} ms")
+
+
+def main(dirty_rects=False, asset_report=False, trace=None,
+         audio_buffer=None, audio_frequency=None, startup_profile=False,
+         preload=False):
     """Initialize and run the main game loop.
 
     This function initializes pygame, sets up the display with fullscreen mode,
     creates the game instance, and runs the main game loop handling events,
-    updates, and rendering.
+    updates, and rendering. The simulation advances in fixed ticks
+    (game.tick_rate) while rendering runs at game.fps_limit and
+    interpolates between the last two ticks.
+
+    Args:
+        dirty_rects (bool): Redraw and present only the screen areas that
+            changed each frame instead of the whole screen.
+        asset_report (bool): Print the memory used by each loaded asset
+            when the game exits.
+        trace (str): Write a Chrome trace of the session to this file.
+        audio_buffer (int): Mixer buffer size in samples (defaults to
+            SoundManager.BUFFER).
+        audio_frequency (int): Mixer sample rate in Hz (defaults to
+            SoundManager.FREQUENCY).
+        startup_profile (bool): Print the time taken by each startup step,
+            up to the first frame on screen.
+        preload (bool): Load the images and fonts of AssetManager.MANIFEST
+            before the first frame instead of on first use.
     """
+    startup = [("imports", IMPORTS_DONE)]
+    tracer = Tracer(trace).install() if trace else Tracer.current()
+    # Small mixer buffer so sounds play right on the hit
+    SoundManager.pre_init(audio_frequency, audio_buffer)
     pygame.init()
+    # Sound effects are decoded in the background meanwhile
+    SoundManager()
+    startup.append(("pygame.init", time.perf_counter()))
     # Try to get the desktop resolution reliably
     sizes = pygame.display.get_desktop_sizes()
     # get_desktop_sizes returns a list of (w,h) tuples; use first/primary
@@ -46,44 +114,152 @@ def main():
         else:
             screen = pygame.display.set_mode(windowed_size, flags)
         pygame.display.set_caption("BrickTok")
+        # The resolution may have changed: rebuild the frame context
+        FrameContext.invalidate()
         # If game exists in outer scope, update its screen reference
         try:
             game.setScreen(screen)
         except Exception:
             pass
 
+    # Scenes and their images and fonts are loaded on first use
+    game = Game()
+    game.dirty_rects_enabled = dirty_rects
+    startup.append(("game", time.perf_counter()))
+
     # Initialize display
     screen = None
     set_display_mode(True)
-
-    game = Game()
-    game.setScreen(screen)
+    startup.append(("display", time.perf_counter()))
+    if preload:
+        AssetManager().preload()
+        startup.append(("preload", time.perf_counter()))
     game.start()
+    startup.append(("main menu", time.perf_counter()))
 
     clock = pygame.time.Clock()
     # Attach the clock to the game so the game can display FPS
     game.clock = clock
 
+    # Wall-clock time not yet consumed by fixed simulation ticks
+    accumulator = 0.0
+    previous = time.perf_counter()
+
+    profiler = game.profiler
     while game.is_running:
-        for event in pygame.event.get():
+        profiler.begin_frame()
+        frame_start = tracer.start()
+        now = time.perf_counter()
+        frame_time = min(now - previous, 0.25)
+        previous = now
+
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 game.stop()
-            # Toggle FPS overlay with F3
+            # Toggle the FPS / frame profiler overlay with F3
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
                 game.toggle_fps_display()
+            # Simulation clock debug keys: pause, single step, time scale
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F6:
+                    game.game_clock.toggle_pause()
+                elif event.key == pygame.K_F7:
+                    game.game_clock.step()
+                elif event.key == pygame.K_F8:
+                    game.game_clock.cycle_time_scale()
 
-        game.update()
+        game.begin_frame(events)
+        profiler.mark("input")
+        accumulator = game.advance(frame_time, accumulator)
+        profiler.mark("update")
         game.render()
+        profiler.mark("render")
 
-        pygame.display.flip()
+        if game.dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(game.dirty_rects)
         # Ensure fps_limit is a positive integer
         fps = int(game.fps_limit) if getattr(game, 'fps_limit', 60) else 60
         if fps <= 0:
             fps = 60
         clock.tick(fps)
+        profiler.mark("flip")
+        profiler.end_frame()
+        tracer.complete("frame", "frame", frame_start)
+        if startup is not None:
+            startup.append(("first frame", time.perf_counter()))
+            tracer.instant("first_frame", "frame", {
+                "ms": (time.perf_counter() - STARTUP_START) * 1000})
+            if startup_profile:
+                print_startup_report(startup)
+            startup = None
 
+    if asset_report:
+        print_asset_report()
+    tracer.close()
     pygame.quit()
 
 
+def parse_args(argv=None):
+    """Parse the command line options.
+
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="BrickTok")
+    parser.add_argument(
+        "--headless", choices=["pong", "brick"],
+        help="simulate a level without a window, as fast as possible")
+    parser.add_argument("--level", type=int, default=1,
+                        help="brick breaker level for --headless brick")
+    parser.add_argument("--ticks", type=int, default=10000,
+                        help="number of simulation ticks for --headless")
+    parser.add_argument("--tick-rate", type=int, default=120,
+                        help="simulation ticks per second for --headless")
+    parser.add_argument("--size", default="1280x720",
+                        help="virtual screen size for --headless")
+    parser.add_argument("--render", action="store_true",
+                        help="also render every tick in --headless mode")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="random seed for --headless")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only redraw the parts of the screen that changed")
+    parser.add_argument("--audio-buffer", type=int, metavar="SAMPLES",
+                        help="mixer buffer size (default: "
+                             f"{SoundManager.BUFFER}; raise it if the sound "
+                             "crackles)")
+    parser.add_argument("--audio-frequency", type=int, metavar="HZ",
+                        help="mixer sample rate (default: "
+                             f"{SoundManager.FREQUENCY})")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="write a Chrome/Perfetto trace of the session")
+    parser.add_argument("--asset-report", action="store_true",
+                        help="print the memory used by each asset on exit")
+    parser.add_argument("--preload", action="store_true",
+                        help="load every image and font before the first "
+                             "frame instead of on first use")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print the time taken by each startup step")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    options = parse_args()
+    if options.headless:
+        from src.HeadlessRunner import main as run_headless
+        if options.trace:
+            Tracer(options.trace).install()
+        run_headless(options)
+        Tracer.current().close()
+    else:
+        main(dirty_rects=options.dirty_rects,
+             asset_report=options.asset_report, trace=options.trace,
+             audio_buffer=options.audio_buffer,
+             audio_frequency=options.audio_frequency,
+             startup_profile=options.startup_profile,
+             preload=options.preload)
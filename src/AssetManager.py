@@ -0,0 +1,197 @@
+"""AssetManager.py
+
+Created on 2025-10-30
+
+Loads every image once and keeps its transformed variants.
+Surfaces are converted to the display format, scaled and rotated once
+per (path, size, rotation) and shared by every object that uses them.
+Assets load on first use; a manifest of the game's assets can be
+preloaded instead (python main.py --preload), trading startup time for
+no loading hitches on the first menus. The manager also reports how
+much memory each asset keeps resident.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+import pygame
+from .TextCache import TextCache
+from .SoundManager import SoundManager
+from .Tracer import Tracer
+
+
+class AssetManager:
+    """Singleton cache of images, their variants and the game's fonts.
+
+    Attributes:
+        images (dict): Loaded images keyed by path.
+        variants (dict): Transformed images keyed by (path, size,
+            rotation).
+        failures (dict): Paths that could not be loaded, with the error,
+            so missing files are only tried once.
+
+    Class Attributes:
+        MANIFEST (dict): Assets loaded by preload(): "images" lists
+            (path, scale, rotation) variants, "fonts" lists (path, size)
+            pairs (None for pygame's default font).
+    """
+
+    MANIFEST = {
+        "images": [
+            ("assets/images/Button_01.png", 1.0, 0),
+            ("assets/images/Button_02.png", 1.0, 0),
+            ("assets/images/Button_03.png", 1.0, 0),
+            ("assets/images/Raquette.png", 0.1, 0),
+            ("assets/images/Raquette.png", 0.1, 90),
+        ],
+        "fonts": [
+            (TextCache.MENU_FONT, 14),
+            (TextCache.MENU_FONT, 80),
+            (None, 36),
+            (None, 48),
+            (None, 74),
+        ],
+    }
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not AssetManager._initialized:
+            self.images = {}
+            self.variants = {}
+            self.failures = {}
+            AssetManager._initialized = True
+
+    def load_image(self, path):
+        """Load an image file once, converted to the display format.
+
+        Surfaces are only kept once a display exists to convert them to.
+
+        Args:
+            path (str): Image file path.
+
+        Returns:
+            pygame.Surface: The shared image (must not be drawn on).
+
+        Raises:
+            Exception: If the file cannot be loaded (also on later calls).
+        """
+        image = self.images.get(path)
+        if image is not None:
+            return image
+        if path in self.failures:
+            raise self.failures[path]
+        try:
+            with Tracer.current().span("load_image", "asset", {"path": path}):
+                image = pygame.image.load(path)
+        except Exception as e:
+            self.failures[path] = e
+            raise
+        if pygame.display.get_surface():
+            image = image.convert_alpha()
+            self.images[path] = image
+        return image
+
+    def get_image(self, path, scale=1.0, rotation=0, size=None):
+        """Return a scaled and rotated variant of an image.
+
+        Args:
+            path (str): Image file path.
+            scale (float): Scale factor (ignored when size is given).
+            rotation (int): Rotation in degrees, counterclockwise.
+            size (tuple): Exact (width, height) before rotation.
+
+        Returns:
+            pygame.Surface: The shared variant (must not be drawn on).
+
+        Raises:
+            Exception: If the file cannot be loaded.
+        """
+        image = self.load_image(path)
+        if size is None:
+            size = (max(1, int(image.get_width() * scale)),
+                    max(1, int(image.get_height() * scale)))
+        if tuple(size) == image.get_size() and not rotation:
+            return image
+        key = (path, tuple(size), rotation)
+        variant = self.variants.get(key)
+        if variant is not None:
+            return variant
+
+        variant = image
+        if variant.get_size() != tuple(size):
+            variant = pygame.transform.smoothscale(variant, tuple(size))
+        if rotation:
+            variant = pygame.transform.rotate(variant, rotation)
+        if path in self.images:
+            self.variants[key] = variant
+        return variant
+
+    def get_font(self, path=None, size=24):
+        """Return a shared font (see TextCache.get_font)."""
+        return TextCache().get_font(path, size)
+
+    def preload(self, manifest=None):
+        """Load every asset listed in a manifest.
+
+        Args:
+            manifest (dict): Assets to load (defaults to MANIFEST).
+
+        Returns:
+            int: Number of assets loaded or already resident.
+        """
+        manifest = manifest or self.MANIFEST
+        start = Tracer.current().start()
+        loaded = 0
+        for path, scale, rotation in manifest.get("images", ()):
+            try:
+                self.get_image(path, scale, rotation)
+                loaded += 1
+            except Exception as e:
+                print(f"Warning: could not preload image {path}: {e}")
+        for path, size in manifest.get("fonts", ()):
+            self.get_font(path, size)
+            loaded += 1
+        # Sound effects are decoded in the background by the SoundManager
+        SoundManager()
+        Tracer.current().complete("preload", "asset", start,
+                                  {"assets": loaded})
+        return loaded
+
+    @staticmethod
+    def surface_bytes(surface):
+        """Memory held by a surface's pixels, in bytes."""
+        return surface.get_pitch() * surface.get_height()
+
+    def memory_report(self):
+        """List the memory kept resident by every cached asset.
+
+        Fonts are listed without a size: pygame does not expose it.
+
+        Returns:
+            dict: "assets", a list of {kind, key, size, bytes} entries
+                sorted from largest to smallest, and "total_bytes".
+        """
+        assets = []
+        for path, image in self.images.items():
+            assets.append({"kind": "image", "key": path,
+                           "size": image.get_size(),
+                           "bytes": self.surface_bytes(image)})
+        for key, variant in self.variants.items():
+            assets.append({"kind": "variant", "key": key,
+                           "size": variant.get_size(),
+                           "bytes": self.surface_bytes(variant)})
+        for name, sound in list(SoundManager().sounds.items()):
+            assets.append({"kind": "sound", "key": name, "size": None,
+                           "bytes": len(sound.get_raw())})
+        for key in TextCache().fonts:
+            assets.append({"kind": "font", "key": key, "size": None,
+                           "bytes": 0})
+        assets.sort(key=lambda asset: asset["bytes"], reverse=True)
+        return {"assets": assets,
+                "total_bytes": sum(asset["bytes"] for asset in assets)}
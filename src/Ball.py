@@ -15,6 +15,13 @@ import random
 import math
 from .GameObject import GameObject
 from .SoundManager import SoundManager
+from .GameClock import GameClock
+from .Collision import sweep_aabb
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .TextCache import TextCache
+from .AssetManager import AssetManager
+from .FrameProfiler import FrameProfiler
 
 
 class Ball(GameObject):
@@ -34,8 +41,15 @@ class Ball(GameObject):
         waiting (bool): True if waiting for spacebar to launch.
         last_bounce_time (int): Time of last bounce in milliseconds.
         bounce_cooldown (int): Minimum time between bounces in milliseconds.
+        paddles (list): Paddles the ball is swept against while moving.
+        max_impacts (int): Maximum impacts resolved per step.
+
+    Class Attributes:
+        SPRITE (pygame.Surface): Sprite shared by every ball.
     """
 
+    SPRITE = None
+
     def __init__(self, game_mode="PONG", has_to_wait=True):
         """Initialize the ball.
 
@@ -69,34 +83,46 @@ class Ball(GameObject):
         self.last_bounce_time = 0
         self.bounce_cooldown = 100  # milliseconds
 
-        # Delta time tracking
-        self.last_time = pygame.time.get_ticks()
+        # Swept collision
+        self.paddles = []
+        self.max_impacts = 4
 
         # Initial position
         self.reset()
         self.waiting = has_to_wait
 
     def load_sprite(self):
-        """Load and scale the ball sprite from assets.
+        """Use the ball sprite shared by every ball."""
+        self.background = self.get_sprite()
+
+    @classmethod
+    def get_sprite(cls):
+        """Return the ball sprite shared by every ball.
 
         Loads Ball.png from assets/images and scales it to 50% of original
-        size. If the image cannot be loaded, creates a white circle as
-        fallback.
+        size the first time it is needed. If the image cannot be loaded,
+        creates a white circle as fallback.
+
+        Returns:
+            pygame.Surface: The scaled ball sprite (must not be drawn on).
         """
+        if cls.SPRITE is not None:
+            return cls.SPRITE
         try:
-            original = pygame.image.load(
-                r"assets/images/Ball.png").convert_alpha()
+            # Scale to 50%
+            sprite = AssetManager().get_image(r"assets/images/Ball.png", 0.5)
         except Exception:
             # Create white circle fallback
             size = 20
             original = pygame.Surface((size, size), pygame.SRCALPHA)
             pygame.draw.circle(original, (255, 255, 255),
                                (size // 2, size // 2), size // 2)
-
-        # Scale to 50%
-        w = max(1, int(original.get_width() * 0.5))
-        h = max(1, int(original.get_height() * 0.5))
-        self.background = pygame.transform.smoothscale(original, (w, h))
+            sprite = pygame.transform.smoothscale(
+                original, (size // 2, size // 2))
+        if pygame.display.get_surface():
+            # Only keep it once the image could be loaded and converted
+            cls.SPRITE = sprite
+        return sprite
 
     def reset(self):
         """Reset ball to center position with random initial direction.
@@ -111,9 +137,9 @@ class Ball(GameObject):
         self.waiting = True
 
         # Center on screen
-        screen = pygame.display.get_surface()
-        if screen:
-            sw, sh = screen.get_size()
+        frame = FrameContext.current()
+        if frame.surface:
+            sw, sh = frame.size
             x = (sw - self.rect.width) // 2
 
             # Different starting positions based on game mode
@@ -126,6 +152,7 @@ class Ball(GameObject):
             x, y = 400, 300  # Fallback
 
         self.setPosition((x, y))
+        self.save_state()  # No interpolation across a reset
         self.rect.topleft = (x, y)
 
         # Set initial velocity based on game mode
@@ -151,9 +178,17 @@ class Ball(GameObject):
         Checks for spacebar press and disables waiting mode when pressed,
         allowing the ball to start moving.
         """
-        if pygame.key.get_pressed()[pygame.K_SPACE]:
+        if InputState.current()[pygame.K_SPACE]:
             self.waiting = False
 
+    def set_paddles(self, paddles):
+        """Set the paddles the ball is swept against.
+
+        Args:
+            paddles (iterable): Raquette objects to bounce off.
+        """
+        self.paddles = list(paddles)
+
     def bounce_paddle(self, raquette):
         """Handle ball collision and bounce off paddle.
 
@@ -169,19 +204,14 @@ class Ball(GameObject):
             raquette (Raquette): The paddle object that was hit.
         """
         # Cooldown check
-        now = pygame.time.get_ticks()
+        now = GameClock.current().get_ticks()
         if now - self.last_bounce_time < self.bounce_cooldown:
             return
         self.last_bounce_time = now
 
-        if self.game_mode == "PONG":
-            # Pong: reverse horizontal direction
-            self.velocity[0] = -self.velocity[0]
-
-            # Add paddle's vertical velocity (50% influence)
-            if hasattr(raquette, 'velocity_y'):
-                self.velocity[1] += raquette.velocity_y * 0.5
+        self.deflect(raquette)
 
+        if self.game_mode == "PONG":
             # Position ball outside paddle
             if self.velocity[0] > 0:
                 self.rect.left = raquette.rect.right
@@ -189,14 +219,6 @@ class Ball(GameObject):
                 self.rect.right = raquette.rect.left
 
         elif self.game_mode == "BRICK":
-            # Brick breaker: reverse vertical direction (bounce up)
-            self.velocity[1] = -abs(self.velocity[1])  # Always bounce upward
-
-            # Add paddle's horizontal velocity influence for angle control
-            if hasattr(raquette, 'velocity_x'):
-                # In brick breaker, paddle moves horizontally
-                self.velocity[0] += raquette.velocity_x * 0.5
-
             # Position ball on top of paddle
             self.rect.bottom = raquette.rect.top
 
@@ -205,70 +227,10 @@ class Ball(GameObject):
         # Sound effect
         self.sound_manager.play("paddle_hit", 0.5)
 
-    def bounce_brick(self, brick):
-        """Handle ball collision and bounce off a brick.
-
-        Calculates which side of the brick was hit by comparing overlap
-        distances on all four sides. Bounces ball in appropriate direction
-        (horizontal for left/right hits, vertical for top/bottom hits).
-
-        Uses cooldown to prevent multiple rapid bounces. Plays wall hit
-        sound effect.
-
-        Args:
-            brick: The brick object that was hit (must have rect attribute).
-        """
-        # Cooldown check to prevent multiple bounces
-        now = pygame.time.get_ticks()
-        if now - self.last_bounce_time < self.bounce_cooldown:
-            return
-        self.last_bounce_time = now
-
-        # Calculate overlap on each side to determine which side was hit
-        ball_rect = self.rect
-        brick_rect = brick.rect
-
-        # Calculate how much the ball overlaps the brick on each side
-        overlap_left = ball_rect.right - brick_rect.left
-        overlap_right = brick_rect.right - ball_rect.left
-        overlap_top = ball_rect.bottom - brick_rect.top
-        overlap_bottom = brick_rect.bottom - ball_rect.top
-
-        # Find the smallest overlap to determine collision side
-        min_overlap = min(
-            overlap_left,
-            overlap_right,
-            overlap_top,
-            overlap_bottom)
-
-        if min_overlap == overlap_left or min_overlap == overlap_right:
-            # Hit left or right side - reverse horizontal velocity
-            self.velocity[0] = -self.velocity[0]
-
-            # Position ball outside brick
-            if min_overlap == overlap_left:
-                self.rect.right = brick_rect.left
-            else:
-                self.rect.left = brick_rect.right
-        else:
-            # Hit top or bottom side - reverse vertical velocity
-            self.velocity[1] = -self.velocity[1]
-
-            # Position ball outside brick
-            if min_overlap == overlap_top:
-                self.rect.bottom = brick_rect.top
-            else:
-                self.rect.top = brick_rect.bottom
-
-        self.setPosition(self.rect.topleft)
-
-        # Sound effect
-        self.sound_manager.play("wall_hit", 0.4)
-
     def update(self):
         """Update ball position and handle wall collisions.
 
-        Handles waiting state, calculates delta time for smooth movement,
+        Handles waiting state, advances by the fixed simulation timestep,
         moves ball based on velocity, and handles collisions with screen
         boundaries. Behavior differs by game mode:
         - Pong: Scores when ball goes off left/right edges
@@ -283,24 +245,23 @@ class Ball(GameObject):
             self.handle_event()
             return None
 
-        # Calculate delta time
-        now = pygame.time.get_ticks()
-        dt = (now - self.last_time) / 1000.0
-        dt = min(dt, 0.5)  # Cap at 0.5s to avoid huge jumps
-        self.last_time = now
-
-        # Move ball
-        x, y = self.position
-        x += self.velocity[0] * dt
-        y += self.velocity[1] * dt
+        # Fixed simulation timestep
+        dt = GameClock.current().dt
 
         # Get screen dimensions
-        screen = pygame.display.get_surface()
-        if not screen:
+        frame = FrameContext.current()
+        if not frame.surface:
             return None
-        sw, sh = screen.get_size()
+        sw, sh = frame.size
 
-        # Vertical wall bounces (top/bottom)
+        # Move ball, bouncing at every impact along the way
+        profiler = FrameProfiler.current()
+        start = profiler.start()
+        x, y = self.sweep(dt, sw, sh)
+        profiler.stop("collision", start)
+
+        # Bounds checks: scoring, plus a safety net for a ball that was
+        # already outside the walls before the sweep
         if y < 0:
             y = 0
             self.velocity[1] = abs(self.velocity[1])
@@ -343,10 +304,128 @@ class Ball(GameObject):
 
         return None
 
+    def sweep(self, dt, sw, sh):
+        """Move the ball for one step with swept collision.
+
+        Finds the earliest impact against the walls it bounces off and
+        the paddles, bounces there and continues with the remaining time,
+        up to max_impacts times, so a fast ball cannot tunnel through a
+        paddle between two ticks.
+
+        Args:
+            dt (float): Step duration in seconds.
+            sw (int): Screen width.
+            sh (int): Screen height.
+
+        Returns:
+            tuple: (x, y) position after the step.
+        """
+        x, y = self.position
+        w, h = self.rect.size
+        remaining = 1.0
+
+        for _ in range(self.max_impacts):
+            dx = self.velocity[0] * dt * remaining
+            dy = self.velocity[1] * dt * remaining
+
+            # Walls the ball bounces off: (axis, position, delta, limit,
+            # direction), as in Collision.wall_time
+            walls = [(1, y, dy, 0, -1)]
+            if self.game_mode == "BRICK":
+                walls += [(0, x, dx, 0, -1), (0, x, dx, sw - w, 1)]
+            else:
+                walls += [(1, y, dy, sh - h, 1)]
+
+            # Earliest impact: (t, axis, paddle or None for a wall)
+            best = None
+            for axis, start, delta, limit, direction in walls:
+                # Only walls the ball moves towards: a ball resting on a
+                # wall after bouncing off it must not hit it again
+                if delta * direction <= 0 or (limit - start) * delta < 0:
+                    continue
+                t = (limit - start) / delta
+                if t <= 1 and (best is None or t < best[0]):
+                    best = (t, axis, None)
+            for paddle in self.paddles:
+                hit = sweep_aabb(x, y, w, h, dx, dy, *paddle.rect)
+                if hit and (best is None or hit[0] < best[0]):
+                    best = (hit[0], hit[1], paddle)
+
+            if best is None:
+                x += dx
+                y += dy
+                break
+
+            t, axis, paddle = best
+            x += dx * t
+            y += dy * t
+            remaining *= 1 - t
+            if paddle is None:
+                self.velocity[axis] = -self.velocity[axis]
+                self.sound_manager.play("wall_hit", 0.3)
+            else:
+                self.deflect(paddle, axis)
+                self.last_bounce_time = GameClock.current().get_ticks()
+                self.sound_manager.play("paddle_hit", 0.5)
+
+        return x, y
+
+    def deflect(self, raquette, axis=None):
+        """Change velocity after a paddle hit.
+
+        Behavior differs by game mode:
+        - Pong: Reverses horizontal direction, adds 50% of the paddle's
+          vertical velocity
+        - Brick Breaker: Always bounces upward, adds 50% of the paddle's
+          horizontal velocity for angle control
+
+        These rules only apply to the paddle's main face (its side in
+        Pong, its top in Brick Breaker); off any other face the ball is
+        simply reflected, so it cannot keep moving into the paddle.
+
+        Args:
+            raquette (Raquette): The paddle that was hit.
+            axis (int): Face that was hit, as returned by sweep_aabb (0
+                left/right, 1 top/bottom), or None for the main face.
+        """
+        if axis is not None:
+            if self.game_mode == "PONG":
+                main = axis == 0
+            else:
+                main = axis == 1 and self.velocity[1] > 0
+            if not main:
+                self.velocity[axis] = -self.velocity[axis]
+                return
+        if self.game_mode == "PONG":
+            self.velocity[0] = -self.velocity[0]
+            if hasattr(raquette, 'velocity_y'):
+                self.velocity[1] += raquette.velocity_y * 0.5
+        elif self.game_mode == "BRICK":
+            self.velocity[1] = -abs(self.velocity[1])  # Always bounce upward
+            if hasattr(raquette, 'velocity_x'):
+                self.velocity[0] += raquette.velocity_x * 0.5
+
+    def get_prompt(self):
+        """Return the rendered "PRESS SPACE" prompt surface."""
+        text_cache = TextCache()
+        return text_cache.render(text_cache.get_font(None, 36),
+                                 "PRESS SPACE", (255, 255, 255))
+
+    def get_draw_rects(self):
+        """Areas covered by the ball and, while waiting, its prompt."""
+        x, y = self.get_render_position()
+        w, h = self.background.get_size()
+        rects = [pygame.Rect(int(x), int(y), w + 1, h + 1)]
+        if self.waiting:
+            rects.append(self.get_prompt().get_rect(center=(
+                FrameContext.current().width // 2, self.position[1] - 30)))
+        return rects
+
     def render(self, screen):
         """Render the ball and waiting prompt to the screen.
 
-        Draws the ball sprite at its current position. If in waiting mode,
+        Draws the ball sprite at its position interpolated between the
+        last two simulation ticks. If in waiting mode,
         also displays "PRESS SPACE" text above the ball.
 
         Args:
@@ -355,12 +434,11 @@ class Ball(GameObject):
         Returns:
             The result of the parent class render method.
         """
-        screen.blit(self.background, self.position)
+        screen.blit(self.background, self.get_render_position())
 
         # Show "PRESS SPACE" text when waiting
         if self.waiting:
-            font = pygame.font.Font(None, 36)
-            text = font.render("PRESS SPACE", True, (255, 255, 255))
+            text = self.get_prompt()
             text_rect = text.get_rect(
                 center=(screen.get_width() // 2, self.position[1] - 30)
             )
@@ -0,0 +1,564 @@
+"""BallSystem.py
+
+Created on 2025-10-22
+
+Batched ball physics for many balls at once.
+Positions and velocities live in NumPy arrays and every step
+(integration, wall bounces, scoring, paddle and brick hits) runs as
+vector operations over all balls.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import math
+import random
+import numpy as np
+import pygame
+from .GameObject import GameObject
+from .Ball import Ball
+from .SoundManager import SoundManager
+from .GameClock import GameClock
+from .Collision import sweep_aabb_many, wall_time
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .TextCache import TextCache
+from .FrameProfiler import FrameProfiler
+
+
+class BallSystem(GameObject):
+    """A set of balls sharing one sprite and one physics step.
+
+    Follows the same rules as Ball in both game modes:
+    - Pong: bounces off top/bottom, scores off the left/right edges
+    - Brick Breaker: bounces off top/left/right, scores off the bottom
+
+    Movement is swept: each step finds the earliest impact against walls,
+    paddles and bricks, bounces there and continues with the remaining
+    time, up to max_impacts times, so fast balls cannot tunnel.
+
+    The system is also the ball pool: every slot is allocated up front,
+    spawning reuses a free slot and never loads assets, and at most
+    max_balls balls exist at once.
+
+    Attributes:
+        game_mode (str): "PONG" or "BRICK" game mode.
+        sound_manager (SoundManager): Handles sound effects.
+        background (pygame.Surface): Sprite shared by every ball.
+        width (int): Ball width in pixels.
+        height (int): Ball height in pixels.
+        speed (int): Ball speed in pixels per second.
+        bounce_cooldown (int): Minimum time between bounces in milliseconds.
+        max_impacts (int): Maximum impacts resolved per ball per step.
+        brick_field (BrickField): Bricks the balls are swept against.
+        paddles (list): Paddles the balls are swept against.
+        count (int): Number of balls in the system.
+        max_balls (int): Pool size; spawns beyond it are refused.
+        spawned (int): Balls spawned since creation.
+        rejected (int): Spawns refused because the pool was full.
+        peak (int): Highest number of balls alive at once.
+        pos (numpy.ndarray): (n, 2) ball positions (top-left).
+        prev_pos (numpy.ndarray): (n, 2) positions at the previous tick.
+        vel (numpy.ndarray): (n, 2) ball velocities in pixels per second.
+        waiting (numpy.ndarray): True for balls waiting for spacebar.
+        last_bounce_time (numpy.ndarray): Time of last bounce per ball.
+        scored_left (numpy.ndarray): Ball went off left edge (Pong).
+        scored_right (numpy.ndarray): Ball went off right edge (Pong).
+        scored_bottom (numpy.ndarray): Ball fell off bottom (Brick Breaker).
+    """
+
+    def __init__(self, game_mode="BRICK", max_balls=256):
+        """Initialize an empty ball system.
+
+        Args:
+            game_mode (str): "PONG" or "BRICK" to determine physics behavior.
+            max_balls (int): Number of ball slots in the pool.
+        """
+        super().__init__()
+        self.game_mode = game_mode
+        self.sound_manager = SoundManager()
+
+        # One sprite for every ball
+        self.background = Ball.get_sprite()
+        self.width, self.height = self.background.get_size()
+
+        self.speed = 400  # pixels per second
+        self.bounce_cooldown = 100  # milliseconds
+        self.max_impacts = 4
+
+        # Obstacles for swept collision
+        self.brick_field = None
+        self.paddles = []
+        self._brick_hits = []
+
+        # Pool: every per-ball array is allocated once, for max_balls
+        self.max_balls = max(1, max_balls)
+        self.count = 0
+        self.spawned = 0
+        self.rejected = 0
+        self.peak = 0
+        self._pos = np.zeros((self.max_balls, 2), dtype=np.float64)
+        self._prev = np.zeros((self.max_balls, 2), dtype=np.float64)
+        self._vel = np.zeros((self.max_balls, 2), dtype=np.float64)
+        self._waiting = np.zeros(self.max_balls, dtype=bool)
+        self._last_bounce = np.zeros(self.max_balls, dtype=np.int64)
+        self._scored_left = np.zeros(self.max_balls, dtype=bool)
+        self._scored_right = np.zeros(self.max_balls, dtype=bool)
+        self._scored_bottom = np.zeros(self.max_balls, dtype=bool)
+
+    # Views over the live part of the arrays
+    @property
+    def pos(self):
+        return self._pos[:self.count]
+
+    @property
+    def prev_pos(self):
+        return self._prev[:self.count]
+
+    @property
+    def vel(self):
+        return self._vel[:self.count]
+
+    @property
+    def waiting(self):
+        return self._waiting[:self.count]
+
+    @property
+    def last_bounce_time(self):
+        return self._last_bounce[:self.count]
+
+    @property
+    def scored_left(self):
+        return self._scored_left[:self.count]
+
+    @property
+    def scored_right(self):
+        return self._scored_right[:self.count]
+
+    @property
+    def scored_bottom(self):
+        return self._scored_bottom[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, has_to_wait=True, position=None):
+        """Take a ball from the pool, reset as Ball.reset() would.
+
+        Args:
+            has_to_wait (bool): If True, ball waits for spacebar to launch.
+            position (tuple): Optional (x, y) overriding the reset position.
+
+        Returns:
+            int or None: Index of the new ball, or None if the pool is
+                full.
+        """
+        if self.count == self.max_balls:
+            self.rejected += 1
+            return None
+        index = self.count
+        self.count += 1
+        self.spawned += 1
+        self.peak = max(self.peak, self.count)
+        self.reset(index)
+        self._waiting[index] = has_to_wait
+        self._last_bounce[index] = 0
+        if position is not None:
+            self._pos[index] = position
+        self._prev[index] = self._pos[index]
+        return index
+
+    def reset(self, index):
+        """Reset one ball to its start position with a random direction.
+
+        Args:
+            index (int): Index of the ball to reset.
+        """
+        self._scored_left[index] = False
+        self._scored_right[index] = False
+        self._scored_bottom[index] = False
+        self._waiting[index] = True
+
+        frame = FrameContext.current()
+        if frame.surface:
+            sw, sh = frame.size
+            x = (sw - self.width) // 2
+            if self.game_mode == "BRICK":
+                y = sh - 100
+            else:
+                y = (sh - self.height) // 2
+        else:
+            x, y = 400, 300  # Fallback
+        self._pos[index] = (x, y)
+        self._prev[index] = (x, y)  # No interpolation across a reset
+
+        if self.game_mode == "BRICK":
+            angle = random.uniform(-60, -120)  # Upward angles
+        else:
+            angle = random.uniform(-45, 45)
+            if random.random() < 0.5:
+                angle += 180
+        rad = math.radians(angle)
+        self._vel[index] = (math.cos(rad) * self.speed,
+                            math.sin(rad) * self.speed)
+
+    def get_stats(self):
+        """Return pool usage counters.
+
+        Returns:
+            dict: active, free, max_balls, spawned, rejected and peak.
+        """
+        return {
+            "active": self.count,
+            "free": self.max_balls - self.count,
+            "max_balls": self.max_balls,
+            "spawned": self.spawned,
+            "rejected": self.rejected,
+            "peak": self.peak,
+        }
+
+    def remove(self, mask):
+        """Return every ball selected by a boolean mask to the pool.
+
+        Args:
+            mask (numpy.ndarray): True for balls to remove.
+        """
+        keep = np.nonzero(~np.asarray(mask, dtype=bool))[0]
+        kept = len(keep)
+        for array in (self._pos, self._prev, self._vel, self._waiting,
+                      self._last_bounce, self._scored_left,
+                      self._scored_right, self._scored_bottom):
+            array[:kept] = array[keep]
+        self.count = kept
+
+    def set_colliders(self, brick_field=None, paddles=()):
+        """Set the bricks and paddles the balls are swept against.
+
+        Args:
+            brick_field (BrickField): The level's bricks, or None.
+            paddles (iterable): Paddles (Raquette) to bounce off.
+        """
+        self.brick_field = brick_field
+        self.paddles = list(paddles)
+
+    def take_brick_hits(self):
+        """Return and clear the brick indices hit since the last call.
+
+        Returns:
+            numpy.ndarray: One brick index per impact.
+        """
+        if not self._brick_hits:
+            return np.empty(0, dtype=np.intp)
+        hits = np.concatenate(self._brick_hits)
+        self._brick_hits = []
+        return hits
+
+    def save_state(self):
+        """Remember the current positions before a simulation tick."""
+        self.prev_pos[:] = self.pos
+
+    def get_rects(self):
+        """Return the integer collision rects of every ball.
+
+        Returns:
+            tuple: (left, top, right, bottom) int32 arrays.
+        """
+        left = self.pos[:, 0].astype(np.int32)
+        top = self.pos[:, 1].astype(np.int32)
+        return left, top, left + self.width, top + self.height
+
+    def update(self):
+        """Move every ball and handle wall collisions.
+
+        Waiting balls launch when spacebar is pressed. Balls that score
+        keep their last position so the level can react to the flag.
+
+        Returns:
+            str or None: "SCORE" if any ball scored this frame.
+        """
+        n = self.count
+        dt = GameClock.current().dt
+        if n == 0:
+            return None
+
+        frame = FrameContext.current()
+        if not frame.surface:
+            return None
+        sw, sh = frame.size
+
+        waiting = self.waiting
+        moving = ~waiting
+        if waiting.any() and InputState.current()[pygame.K_SPACE]:
+            waiting[:] = False
+
+        pos = self.pos
+        vel = self.vel
+        self.prev_pos[:] = pos
+        profiler = FrameProfiler.current()
+        start = profiler.start()
+        x, y = self._sweep(np.nonzero(moving)[0], dt, sw, sh)
+        profiler.stop("collision", start)
+        bounced = False
+
+        # Bounds checks: scoring, plus a safety net for balls that were
+        # already outside the walls before the sweep
+        hit_top = moving & (y < 0)
+        y[hit_top] = 0
+        vel[hit_top, 1] = np.abs(vel[hit_top, 1])
+        bounced |= hit_top.any()
+
+        past_bottom = moving & ~hit_top & (y + self.height > sh)
+        scored = np.zeros(n, dtype=bool)
+        if self.game_mode == "BRICK":
+            self.scored_bottom[past_bottom] = True
+            scored |= past_bottom
+        else:
+            y[past_bottom] = sh - self.height
+            vel[past_bottom, 1] = -np.abs(vel[past_bottom, 1])
+            bounced |= past_bottom.any()
+
+        # Horizontal bounds
+        active = moving & ~scored
+        if self.game_mode == "PONG":
+            off_left = active & (x < 0)
+            off_right = active & ~off_left & (x + self.width > sw)
+            self.scored_left[off_left] = True
+            self.scored_right[off_right] = True
+            scored |= off_left | off_right
+        else:
+            hit_left = active & (x < 0)
+            hit_right = active & ~hit_left & (x + self.width > sw)
+            x[hit_left] = 0
+            vel[hit_left, 0] = np.abs(vel[hit_left, 0])
+            x[hit_right] = sw - self.width
+            vel[hit_right, 0] = -np.abs(vel[hit_right, 0])
+            bounced |= hit_left.any() or hit_right.any()
+
+        # Scoring balls keep their previous position, like Ball.update
+        commit = moving & ~scored
+        pos[commit, 0] = x[commit]
+        pos[commit, 1] = y[commit]
+
+        if bounced:
+            self.sound_manager.play("wall_hit", 0.3)
+        return "SCORE" if scored.any() else None
+
+    def _sweep(self, active, dt, sw, sh):
+        """Move balls along their velocity, bouncing at each impact.
+
+        Args:
+            active (numpy.ndarray): Indices of the balls to move.
+            dt (float): Step duration in seconds.
+            sw (int): Screen width.
+            sh (int): Screen height.
+
+        Returns:
+            tuple: (x, y) arrays of the positions after the step.
+        """
+        pos = self.pos
+        vel = self.vel
+        x = pos[:, 0].copy()
+        y = pos[:, 1].copy()
+        w, h = self.width, self.height
+        remaining = np.ones(self.count)
+        now = GameClock.current().get_ticks()
+        played = set()
+
+        # Walls the balls bounce off: (axis, limit, direction)
+        walls = [(1, 0, -1)]
+        if self.game_mode == "BRICK":
+            walls += [(0, 0, -1), (0, sw - w, 1)]
+        else:
+            walls += [(1, sh - h, 1)]
+
+        for _ in range(self.max_impacts):
+            if len(active) == 0:
+                break
+            ax, ay = x[active], y[active]
+            dx = vel[active, 0] * dt * remaining[active]
+            dy = vel[active, 1] * dt * remaining[active]
+
+            best_t = np.full(len(active), np.inf)
+            best_axis = np.zeros(len(active), dtype=np.int8)
+            best_brick = np.full(len(active), -1, dtype=np.intp)
+            best_paddle = np.full(len(active), -1, dtype=np.intp)
+
+            for axis, limit, direction in walls:
+                t = wall_time(ay if axis else ax, dy if axis else dx,
+                              limit, direction)
+                closer = t < best_t
+                best_t[closer] = t[closer]
+                best_axis[closer] = axis
+
+            field = self.brick_field
+            if field is not None and field.alive_count:
+                # Candidate bricks come from the cells of the swept box
+                left = np.floor(np.minimum(ax, ax + dx)).astype(np.int32)
+                top = np.floor(np.minimum(ay, ay + dy)).astype(np.int32)
+                right = np.ceil(np.maximum(ax, ax + dx) + w).astype(np.int32)
+                bottom = np.ceil(np.maximum(ay, ay + dy) + h).astype(np.int32)
+                balls, bricks = field.grid.candidates(left, top, right, bottom)
+                if len(bricks):
+                    t, axis = sweep_aabb_many(
+                        ax[balls], ay[balls], w, h, dx[balls], dy[balls],
+                        field.x[bricks], field.y[bricks],
+                        field.w[bricks], field.h[bricks])
+                    # Earliest impact per ball
+                    order = np.lexsort((t, balls))
+                    balls, first = np.unique(balls[order], return_index=True)
+                    t = t[order][first]
+                    closer = t < best_t[balls]
+                    balls = balls[closer]
+                    best_t[balls] = t[closer]
+                    best_axis[balls] = axis[order][first][closer]
+                    best_brick[balls] = bricks[order][first][closer]
+
+            for index, paddle in enumerate(self.paddles):
+                r = paddle.rect
+                t, axis = sweep_aabb_many(ax, ay, w, h, dx, dy,
+                                          r.x, r.y, r.width, r.height)
+                closer = t < best_t
+                best_t[closer] = t[closer]
+                best_axis[closer] = axis[closer]
+                best_brick[closer] = -1
+                best_paddle[closer] = index
+
+            # Advance every ball to its first impact (or the full step)
+            hit = best_t <= 1
+            t = np.where(hit, best_t, 1.0)
+            x[active] = ax + dx * t
+            y[active] = ay + dy * t
+            remaining[active] *= 1 - t
+
+            active, best_axis = active[hit], best_axis[hit]
+            best_brick, best_paddle = best_brick[hit], best_paddle[hit]
+
+            # Reflect off walls and bricks along the face that was hit
+            reflect = best_paddle < 0
+            flip = active[reflect]
+            flip_axis = best_axis[reflect]
+            vel[flip, flip_axis] = -vel[flip, flip_axis]
+            if (best_brick >= 0).any():
+                self._brick_hits.append(best_brick[best_brick >= 0])
+                played.add(("wall_hit", 0.4))
+            if (reflect & (best_brick < 0)).any():
+                played.add(("wall_hit", 0.3))
+
+            # Paddles bounce as in bounce_paddle off their main face (side
+            # in Pong, top in Brick Breaker), and reflect off the others
+            for index, paddle in enumerate(self.paddles):
+                on_paddle = best_paddle == index
+                balls = active[on_paddle]
+                if len(balls) == 0:
+                    continue
+                axis = best_axis[on_paddle]
+                if self.game_mode == "PONG":
+                    main = axis == 0
+                else:
+                    main = (axis == 1) & (vel[balls, 1] > 0)
+                side, side_axis = balls[~main], axis[~main]
+                vel[side, side_axis] = -vel[side, side_axis]
+                balls = balls[main]
+                if self.game_mode == "PONG":
+                    vel[balls, 0] = -vel[balls, 0]
+                    vel[balls, 1] += getattr(paddle, 'velocity_y', 0) * 0.5
+                else:
+                    vel[balls, 1] = -np.abs(vel[balls, 1])
+                    vel[balls, 0] += getattr(paddle, 'velocity_x', 0) * 0.5
+                self.last_bounce_time[balls] = now
+                played.add(("paddle_hit", 0.5))
+
+        for name, volume in played:
+            self.sound_manager.play(name, volume)
+        return x, y
+
+    def _cooled_down(self, candidates, now):
+        """Filter ball indices whose bounce cooldown has expired."""
+        ready = now - self.last_bounce_time[candidates] >= self.bounce_cooldown
+        candidates = candidates[ready]
+        self.last_bounce_time[candidates] = now
+        return candidates
+
+    def bounce_paddle(self, raquette):
+        """Bounce every ball overlapping a paddle.
+
+        Same rules as Ball.bounce_paddle, applied to all balls at once.
+
+        Args:
+            raquette (Raquette): The paddle to test against.
+        """
+        if self.count == 0:
+            return
+        left, top, right, bottom = self.get_rects()
+        paddle = raquette.rect
+        hit = np.nonzero((left < paddle.right) & (right > paddle.left)
+                         & (top < paddle.bottom) & (bottom > paddle.top))[0]
+        if len(hit) == 0:
+            return
+        hit = self._cooled_down(hit, GameClock.current().get_ticks())
+        if len(hit) == 0:
+            return
+
+        vel = self.vel
+        pos = self.pos
+        if self.game_mode == "PONG":
+            vel[hit, 0] = -vel[hit, 0]
+            vel[hit, 1] += getattr(raquette, 'velocity_y', 0) * 0.5
+            going_right = vel[hit, 0] > 0
+            pos[hit, 0] = np.where(going_right, paddle.right,
+                                   paddle.left - self.width)
+        else:
+            vel[hit, 1] = -np.abs(vel[hit, 1])
+            vel[hit, 0] += getattr(raquette, 'velocity_x', 0) * 0.5
+            pos[hit, 0] = left[hit]
+            pos[hit, 1] = paddle.top - self.height
+        pos[hit, 1] = np.trunc(pos[hit, 1])
+
+        self.sound_manager.play("paddle_hit", 0.5)
+
+    def get_prompt(self):
+        """Return the rendered "PRESS SPACE" prompt surface."""
+        text_cache = TextCache()
+        return text_cache.render(text_cache.get_font(None, 36),
+                                 "PRESS SPACE", (255, 255, 255))
+
+    def get_draw_rects(self):
+        """Areas covered by every ball and the prompts of waiting ones."""
+        if self.count == 0:
+            return []
+        alpha = GameClock.current().alpha
+        drawn = self.prev_pos + (self.pos - self.prev_pos) * alpha
+        w, h = self.width + 1, self.height + 1
+        rects = [pygame.Rect(int(px), int(py), w, h)
+                 for px, py in drawn.tolist()]
+        waiting = np.nonzero(self.waiting)[0]
+        if len(waiting):
+            text = self.get_prompt()
+            center_x = FrameContext.current().width // 2
+            rects.extend(text.get_rect(center=(center_x, self.pos[i, 1] - 30))
+                         for i in waiting)
+        return rects
+
+    def render(self, screen):
+        """Draw every ball, plus the launch prompt for waiting balls.
+
+        Balls are drawn between their last two simulation positions.
+
+        Args:
+            screen (pygame.Surface): The surface to render to.
+        """
+        if self.count == 0:
+            return
+        sprite = self.background
+        alpha = GameClock.current().alpha
+        drawn = self.prev_pos + (self.pos - self.prev_pos) * alpha
+        screen.blits([(sprite, (px, py)) for px, py in drawn.tolist()],
+                     doreturn=False)
+
+        waiting = np.nonzero(self.waiting)[0]
+        if len(waiting):
+            text = self.get_prompt()
+            for index in waiting:
+                text_rect = text.get_rect(center=(
+                    screen.get_width() // 2, self.pos[index, 1] - 30))
+                screen.blit(text, text_rect)
@@ -10,6 +10,7 @@ __version__ = "1.0"
 
 import pygame
 from .GameObject import GameObject
+from .TextCache import TextCache
 
 
 class Brick(GameObject):
@@ -32,6 +33,8 @@ class Brick(GameObject):
 
     Class Attributes:
         BRICK_TYPES (dict): Maps brick type to (color, health, points).
+        SPRITES (dict): Atlas of brick appearances shared by every brick,
+            keyed by (color, health, width, height).
     """
 
     # Brick type definitions: (color, health, points)
@@ -45,6 +48,8 @@ class Brick(GameObject):
         "gray": ((128, 128, 128), 5, 50),
     }
 
+    SPRITES = {}
+
     def __init__(self, x, y, width=80, height=30, brick_type="red"):
         """Initialize a brick at the specified position.
 
@@ -86,57 +91,88 @@ class Brick(GameObject):
         self.rect.topleft = (int(x), int(y))
 
     def create_surface(self):
-        """Create and render the brick's visual appearance.
+        """Look up the brick's visual appearance for its current health.
 
         Generates a colored rectangle with 3D border effects (highlights
         on top/left, shadows on bottom/right). If health is greater than 1,
         displays health value as white text in the center.
         """
+        self.background = self.get_sprite(
+            self.width, self.height, self.color, self.health)
+
+    @classmethod
+    def get_sprite(cls, width, height, color, health):
+        """Return the shared surface for a brick appearance.
+
+        Each appearance is rasterized once and converted to the display's
+        pixel format; every brick showing it references the same surface.
+
+        Args:
+            width (int): Brick width in pixels.
+            height (int): Brick height in pixels.
+            color (tuple): RGB fill color.
+            health (int): Health value shown when greater than 1.
+
+        Returns:
+            pygame.Surface: The brick appearance (must not be drawn on).
+        """
+        key = (color, health, width, height)
+        sprite = cls.SPRITES.get(key)
+        if sprite is None:
+            sprite = cls.draw_surface(width, height, color, health)
+            if not pygame.display.get_surface():
+                # Can't convert yet: don't keep a slow-to-blit surface
+                return sprite
+            sprite = sprite.convert()
+            cls.SPRITES[key] = sprite
+        return sprite
+
+    @staticmethod
+    def draw_surface(width, height, color, health):
+        """Rasterize a brick appearance.
+
+        Args:
+            width (int): Brick width in pixels.
+            height (int): Brick height in pixels.
+            color (tuple): RGB fill color.
+            health (int): Health value shown when greater than 1.
+
+        Returns:
+            pygame.Surface: The rendered brick.
+        """
         # Create main brick surface
-        self.background = pygame.Surface((self.width, self.height))
+        surface = pygame.Surface((width, height))
 
         # Fill with brick color
-        self.background.fill(self.color)
+        surface.fill(color)
 
         # Add border for 3D effect
         border_color = tuple(min(c + 40, 255)
-                             for c in self.color)  # Lighter border
+                             for c in color)  # Lighter border
         shadow_color = tuple(max(c - 40, 0)
-                             for c in self.color)  # Darker shadow
+                             for c in color)  # Darker shadow
 
         # Draw highlights (top and left)
-        pygame.draw.line(self.background, border_color,
-                         (0, 0), (self.width - 1, 0), 2)  # Top
-        pygame.draw.line(self.background, border_color,
-                         (0, 0), (0, self.height - 1), 2)  # Left
+        pygame.draw.line(surface, border_color,
+                         (0, 0), (width - 1, 0), 2)  # Top
+        pygame.draw.line(surface, border_color,
+                         (0, 0), (0, height - 1), 2)  # Left
 
         # Draw shadows (bottom and right)
-        pygame.draw.line(
-            self.background,
-            shadow_color,
-            (0,
-             self.height - 1),
-            (self.width - 1,
-             self.height - 1),
-            2)  # Bottom
-        pygame.draw.line(
-            self.background,
-            shadow_color,
-            (self.width - 1,
-             0),
-            (self.width - 1,
-             self.height - 1),
-            2)  # Right
+        pygame.draw.line(surface, shadow_color,
+                         (0, height - 1), (width - 1, height - 1), 2)  # Bottom
+        pygame.draw.line(surface, shadow_color,
+                         (width - 1, 0), (width - 1, height - 1), 2)  # Right
 
         # Add health indicator if health > 1
-        if self.health > 1:
-            font = pygame.font.Font(None, 20)
-            text = font.render(str(self.health), True, (255, 255, 255))
-            text_rect = text.get_rect(
-                center=(
-                    self.width // 2,
-                    self.height // 2))
-            self.background.blit(text, text_rect)
+        if health > 1:
+            text_cache = TextCache()
+            text = text_cache.render(text_cache.get_font(None, 20),
+                                     str(health), (255, 255, 255))
+            text_rect = text.get_rect(center=(width // 2, height // 2))
+            surface.blit(text, text_rect)
+
+        return surface
 
     def take_damage(self, damage=1):
         """Apply damage to the brick and check if destroyed.
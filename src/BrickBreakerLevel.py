@@ -10,24 +10,39 @@ __version__ = "1.0"
 
 import pygame
 import os
-from .Scene import Scene
+from .Level import Level
 from .Raquette import Raquette
-from .Ball import Ball
-from .Brick import Brick
+from .BallSystem import BallSystem
+from .BrickField import BrickField
 from .MenuButton import MenuButton
+from .GameClock import GameClock
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .TextCache import TextCache
+from .LevelCompiler import LevelCompiler
+from .FrameProfiler import FrameProfiler
+from .Tracer import Tracer
 
 
-class BrickBreakerLevel(Scene):
-    def __init__(self, players=1, level_number=1):
+class BrickBreakerLevel(Level):
+    def __init__(self, players=1, level_number=1, brick_field=None):
+        """Initialize the level.
+
+        Args:
+            players (int): Number of players (1 or 2).
+            level_number (int): Level to load (1-based).
+            brick_field (BrickField): Bricks of the level already loaded
+                (e.g. by a LevelPrefetcher); loaded from the level file
+                when None.
+        """
         super().__init__()
-        self.paused = False
         self.num_players = players
         self.level_number = level_number
 
         # Get screen dimensions
-        screen = pygame.display.get_surface()
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
+        frame = FrameContext.current()
+        screen_width = frame.width
+        screen_height = frame.height
 
         # Pause cooldown to prevent rapid toggling
         self.last_key_pressed = 0
@@ -43,14 +58,11 @@ class BrickBreakerLevel(Scene):
             self.add_object(self.p2)
 
         # Create balls for brick breaker (support multiple balls)
-        self.balls = []
-        initial_ball = Ball(game_mode="BRICK")
-        initial_ball.reset()
-        self.balls.append(initial_ball)
+        self.balls = BallSystem(game_mode="BRICK")
+        self.balls.spawn()
         self.menu_button = MenuButton("MAIN_MENU", "Menu principal")
         # Position button in center
-        screen = pygame.display.get_surface()
-        sw, sh = screen.get_size()
+        sw, sh = frame.size
         btn_x = (sw - self.menu_button.rect.width) // 2
         btn_y = (sh + 100) // 2  # Below pause text
         self.menu_button.setPosition((btn_x, btn_y))
@@ -62,15 +74,20 @@ class BrickBreakerLevel(Scene):
         self.score = 0
 
         # Load level and create bricks
-        self.bricks = []
-        self._load_level(level_number)
+        if brick_field is None:
+            self.brick_field = BrickField()
+            self._load_level(level_number)
+        else:
+            self.brick_field = brick_field
 
         # Add objects to scene
         self.add_object(self.p1)
-        for ball in self.balls:
-            self.add_object(ball)
-        for brick in self.bricks:
-            self.add_object(brick)
+        self.add_object(self.balls)
+        self.add_object(self.brick_field)
+
+        # Balls are swept against the bricks and paddles every step
+        paddles = [self.p1, self.p2] if players == 2 else [self.p1]
+        self.balls.set_colliders(self.brick_field, paddles)
 
         self.paused = False
 
@@ -81,7 +98,7 @@ class BrickBreakerLevel(Scene):
             level_number: Level number to load (1-based)
         """
         # Format level filename with leading zeros
-        level_file = f"levels/level_{level_number:03d}.txt"
+        level_file = LevelCompiler.level_path(level_number)
 
         if not os.path.exists(level_file):
             print(
@@ -89,73 +106,12 @@ class BrickBreakerLevel(Scene):
             return
 
         try:
-            with open(level_file, 'r') as f:
-                lines = f.readlines()
-
-            # Get screen dimensions for brick positioning
-            screen = pygame.display.get_surface()
-            screen_width = screen.get_width()
-            screen_height = screen.get_height()
-
-            # Parse level data
-            brick_width = 80
-            brick_height = 30
-            spacing_x = 5
-            spacing_y = 5
-            margin_y = 10  # Top margin
-
-            # Filter out comment lines and empty lines first
-            brick_rows = []
-            max_row_length = 0
-            for line in lines:
-                line = line.rstrip()  # Keep leading spaces but remove trailing
-                if line and not line.startswith(
-                        '#'):  # Skip empty lines and comments
-                    brick_rows.append(line)
-                    max_row_length = max(max_row_length, len(line))
-
-            # Calculate total width needed for the longest row
-            total_width_needed = max_row_length * \
-                (brick_width + spacing_x) - spacing_x
-
-            # Check if bricks fit on screen, if not scale them down
-            available_width = screen_width - 20  # 10px margin on each side
-            if total_width_needed > available_width:
-                # Scale down brick width to fit
-                scale_factor = available_width / total_width_needed
-                brick_width = int(brick_width * scale_factor)
-                spacing_x = int(spacing_x * scale_factor)
-                total_width_needed = max_row_length * \
-                    (brick_width + spacing_x) - spacing_x
-
-            # Calculate horizontal offset to center the brick grid
-            margin_x = (screen_width - total_width_needed) // 2
-
-            # Limit number of rows to prevent overflow
-            max_rows = (screen_height - margin_y -
-                        200) // (brick_height + spacing_y)
-            if len(brick_rows) > max_rows:
-                print(
-                    f"Warning: Level has {
-                        len(brick_rows)} rows, limiting to {max_rows} to fit screen")
-                brick_rows = brick_rows[:max_rows]
-
-            for row_idx, line in enumerate(brick_rows):
-                for col_idx, char in enumerate(line):
-                    if char == ' ' or char == '.':  # Empty space
-                        continue
-
-                    # Determine brick type based on character
-                    brick_type = self.get_brick_type(char)
-
-                    # Calculate position - centered horizontally
-                    x = margin_x + col_idx * (brick_width + spacing_x)
-                    y = margin_y + row_idx * (brick_height + spacing_y)
-
-                    # Create brick
-                    brick = Brick(x, y, brick_width, brick_height, brick_type)
-                    self.bricks.append(brick)
-
+            # Parsed and laid out once per screen size, then loaded from
+            # the compiled level cache
+            with Tracer.current().span("load_level", "level",
+                                       {"level": level_number}):
+                self.brick_field = LevelCompiler.load_field(
+                    level_file, FrameContext.current().size)
         except Exception as e:
             print(f"Error loading level {level_number}: {e}")
 
@@ -168,31 +124,20 @@ class BrickBreakerLevel(Scene):
         Returns:
             Brick type string
         """
-        brick_map = {
-            'R': 'red',
-            'O': 'orange',
-            'Y': 'yellow',
-            'G': 'green',
-            'B': 'blue',
-            'P': 'purple',
-            'X': 'gray',
-        }
-        return brick_map.get(char.upper(), 'red')
+        return LevelCompiler.get_brick_type(char)
 
     def update_keys(self):
-        now = pygame.time.get_ticks()
+        now = GameClock.current().get_ticks()
         if now - self.last_key_pressed < self.key_cooldown:
             return
-        key = pygame.key.get_pressed()
+        key = InputState.current()
         if key[pygame.K_ESCAPE]:
             self.paused = not self.paused
             self.last_key_pressed = now
         if key[pygame.K_h]:
             self.is_hanihilator = not self.is_hanihilator
         if key[pygame.K_F10]:
-            for brick in self.bricks:
-                self.remove_object(brick)
-            self.bricks.clear()
+            self.brick_field.clear()
             # Trigger level complete
             return ("LEVEL_COMPLETE", self.level_number, self.score)
 
@@ -204,6 +149,8 @@ class BrickBreakerLevel(Scene):
         # Handle pause state with cooldown
 
         if self.paused:
+            # Nothing moves: draw every object where it stopped
+            self.save_state()
             # Update menu button
             result = self.menu_button.update()
             if result == "MAIN_MENU":
@@ -211,63 +158,45 @@ class BrickBreakerLevel(Scene):
             return None
         # Format level filename with leading zeros
         if self.is_hanihilator:
-            ball = Ball(game_mode="BRICK", has_to_wait=False)
-            ball.setPosition((self.p1.rect.centerx, self.p1.rect.top - 20))
-            self.balls.append(ball)
-            self.add_object(ball)
+            self.balls.spawn(
+                has_to_wait=False,
+                position=(self.p1.rect.centerx, self.p1.rect.top - 20))
 
         if self.paused:
             # Draw pause text
-            font = pygame.font.Font(None, 74)
-            screen = pygame.display.get_surface()
-            pause_text = font.render("PAUSED", True, (255, 255, 255))
-            pause_rect = pause_text.get_rect(
-                center=(screen.get_width() // 2, screen.get_height() // 2)
-            )
-            screen.blit(pause_text, pause_rect)
+            frame = FrameContext.current()
+            text_cache = TextCache()
+            pause_text = text_cache.render(text_cache.get_font(None, 74),
+                                           "PAUSED", (255, 255, 255))
+            pause_rect = pause_text.get_rect(center=frame.bounds.center)
+            frame.surface.blit(pause_text, pause_rect)
             return None
 
-        # Check paddle collision for all balls
-        for ball in self.balls:
-            if ball.rect.colliderect(self.p1.rect):
-                ball.bounce_paddle(self.p1)
-
-            if self.num_players == 2 and ball.rect.colliderect(self.p2.rect):
-                ball.bounce_paddle(self.p2)
+        # Catch paddles that moved into a ball (the ball's own sweep
+        # handles balls moving into paddles)
+        profiler = FrameProfiler.current()
+        start = profiler.start()
+        self.balls.bounce_paddle(self.p1)
+        if self.num_players == 2:
+            self.balls.bounce_paddle(self.p2)
+        profiler.stop("collision", start)
 
         # Update all objects
         super().update()
 
-        # Check brick collisions and remove destroyed bricks
-        bricks_to_remove = []
-        for ball in self.balls:
-            for brick in self.bricks:
-                if not brick.is_destroyed() and ball.rect.colliderect(brick.rect):
-                    ball.bounce_brick(brick)
-                    if brick.take_damage():
-                        # Brick destroyed
-                        bricks_to_remove.append(brick)
-                        self.score += brick.get_points()
-
-        # Remove destroyed bricks
-        for brick in bricks_to_remove:
-            self.bricks.remove(brick)
-            self.remove_object(brick)
+        # Apply the brick impacts found by the swept ball step in one batch
+        start = profiler.start()
+        self.score += self.brick_field.apply_damage(
+            self.balls.take_brick_hits())
+        profiler.stop("collision", start)
 
         # Check if all bricks are destroyed (level complete)
-        if len(self.bricks) == 0:
+        if self.brick_field.is_cleared():
             return ("LEVEL_COMPLETE", self.level_number, self.score)
 
-        # Check if any balls fell off bottom (lose life)
-        balls_to_remove = []
-        for ball in self.balls:
-            if ball.scored_bottom:
-                balls_to_remove.append(ball)
-
-        # Remove balls that fell off
-        for ball in balls_to_remove:
-            self.balls.remove(ball)
-            self.remove_object(ball)
+        # Remove balls that fell off bottom (lose life)
+        if self.balls.scored_bottom.any():
+            self.balls.remove(self.balls.scored_bottom)
 
         # If no balls left, lose a life and spawn new ball
         if len(self.balls) == 0:
@@ -277,13 +206,17 @@ class BrickBreakerLevel(Scene):
                 return ("GAME_OVER", self.score)
 
             # Spawn new ball
-            new_ball = Ball(game_mode="BRICK")
-            new_ball.reset()
-            self.balls.append(new_ball)
-            self.add_object(new_ball)
+            self.balls.spawn()
 
         return self.update_keys()
 
+    def get_object_counts(self):
+        """Object counts, with the balls and bricks left."""
+        counts = super().get_object_counts()
+        counts["balls"] = len(self.balls)
+        counts["bricks"] = len(self.brick_field)
+        return counts
+
     def render(self, screen):
         # Always render game objects first
         super().render(screen)
@@ -297,8 +230,9 @@ class BrickBreakerLevel(Scene):
             screen.blit(overlay, (0, 0))
 
             # Pause text
-            font = pygame.font.Font(None, 74)
-            pause_text = font.render("PAUSED", True, (255, 255, 255))
+            text_cache = TextCache()
+            pause_text = text_cache.render(text_cache.get_font(None, 74),
+                                           "PAUSED", (255, 255, 255))
             pause_rect = pause_text.get_rect(center=(
                 screen.get_width() // 2, screen.get_height() // 2 - 50))
             screen.blit(pause_text, pause_rect)
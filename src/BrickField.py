@@ -0,0 +1,266 @@
+"""BrickField.py
+
+Created on 2025-10-21
+
+Array-backed brick storage for Brick Breaker.
+Keeps every brick of a level in NumPy arrays so collision, damage,
+scoring and the level-complete check run as batched operations, and
+draws them from a single pre-rendered layer.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import numpy as np
+import pygame
+from .GameObject import GameObject
+from .Brick import Brick
+from .BrickGrid import BrickGrid
+
+
+class BrickField(GameObject):
+    """Struct-of-arrays store for all the bricks of a level.
+
+    Brick properties come from Brick.BRICK_TYPES; a brick's type id is the
+    position of its type name in TYPE_NAMES.
+
+    Attributes:
+        x (numpy.ndarray): Left edge of each brick.
+        y (numpy.ndarray): Top edge of each brick.
+        w (numpy.ndarray): Width of each brick.
+        h (numpy.ndarray): Height of each brick.
+        type_id (numpy.ndarray): Brick type id of each brick.
+        health (numpy.ndarray): Current health of each brick.
+        alive (numpy.ndarray): True for bricks not yet destroyed.
+        row (numpy.ndarray): Grid row of each brick.
+        col (numpy.ndarray): Grid column of each brick.
+        grid (BrickGrid): Spatial index over the brick grid.
+        alive_count (int): Number of bricks still alive.
+        layer (pygame.Surface): Every brick composited at load time
+            (None until first rendered).
+        layer_rect (pygame.Rect): Screen area covered by the layer.
+
+    Class Attributes:
+        TYPE_NAMES (list): Brick type names indexed by type id.
+        TYPE_HEALTH (numpy.ndarray): Starting health per type id.
+        TYPE_POINTS (numpy.ndarray): Points per type id.
+        LAYER_KEY (tuple): Transparent color key of the layer surface.
+    """
+
+    TYPE_NAMES = list(Brick.BRICK_TYPES)
+    TYPE_HEALTH = np.array([Brick.BRICK_TYPES[name][1]
+                           for name in TYPE_NAMES], dtype=np.int16)
+    TYPE_POINTS = np.array([Brick.BRICK_TYPES[name][2]
+                           for name in TYPE_NAMES], dtype=np.int32)
+    # Not used by any brick color, so it can mark the gaps between bricks
+    LAYER_KEY = (255, 0, 255)
+
+    def __init__(self, cells=(), origin_x=0, origin_y=0, brick_width=80,
+                 brick_height=30, spacing_x=5, spacing_y=5):
+        """Build the field from a parsed level layout.
+
+        Args:
+            cells (iterable): (row, col, brick_type) tuples, one per brick.
+            origin_x (int): X coordinate of column 0.
+            origin_y (int): Y coordinate of row 0.
+            brick_width (int): Brick width in pixels.
+            brick_height (int): Brick height in pixels.
+            spacing_x (int): Horizontal gap between bricks.
+            spacing_y (int): Vertical gap between bricks.
+        """
+        super().__init__()
+        cells = list(cells)
+        self._build(np.array([c[0] for c in cells], dtype=np.int32),
+                    np.array([c[1] for c in cells], dtype=np.int32),
+                    np.array([self.get_type_id(c[2]) for c in cells],
+                             dtype=np.int8),
+                    origin_x, origin_y, brick_width, brick_height,
+                    spacing_x, spacing_y)
+
+    @classmethod
+    def from_grid(cls, type_grid, origin_x=0, origin_y=0, brick_width=80,
+                  brick_height=30, spacing_x=5, spacing_y=5):
+        """Build the field straight from a grid of brick type ids.
+
+        Bricks are numbered in row-major order, like the cells of the
+        level file.
+
+        Args:
+            type_grid (numpy.ndarray): (rows, cols) array of type ids,
+                -1 for empty cells.
+            origin_x (int): X coordinate of column 0.
+            origin_y (int): Y coordinate of row 0.
+            brick_width (int): Brick width in pixels.
+            brick_height (int): Brick height in pixels.
+            spacing_x (int): Horizontal gap between bricks.
+            spacing_y (int): Vertical gap between bricks.
+
+        Returns:
+            BrickField: The new field.
+        """
+        field = cls.__new__(cls)
+        GameObject.__init__(field)
+        rows, cols = np.nonzero(type_grid >= 0)
+        field._build(rows.astype(np.int32), cols.astype(np.int32),
+                     type_grid[rows, cols].astype(np.int8),
+                     origin_x, origin_y, brick_width, brick_height,
+                     spacing_x, spacing_y)
+        return field
+
+    def _build(self, row, col, type_id, origin_x, origin_y, brick_width,
+               brick_height, spacing_x, spacing_y):
+        """Fill the brick arrays, the grid index and the layer bounds."""
+        count = len(type_id)
+        pitch_x = brick_width + spacing_x
+        pitch_y = brick_height + spacing_y
+
+        self.row = row
+        self.col = col
+        self.type_id = type_id
+        self.x = (origin_x + self.col * pitch_x).astype(np.int32)
+        self.y = (origin_y + self.row * pitch_y).astype(np.int32)
+        self.w = np.full(count, brick_width, dtype=np.int32)
+        self.h = np.full(count, brick_height, dtype=np.int32)
+        self.health = self.TYPE_HEALTH[self.type_id].copy()
+        self.alive = np.ones(count, dtype=bool)
+        self.alive_count = count
+
+        rows = int(self.row.max()) + 1 if count else 0
+        cols = int(self.col.max()) + 1 if count else 0
+        self.grid = BrickGrid(origin_x, origin_y, pitch_x, pitch_y, rows, cols)
+        self.grid.cells[self.row, self.col] = np.arange(count, dtype=np.int32)
+
+        # Static layer holding every brick; only bricks that change are
+        # repainted on it
+        if count:
+            left, top = int(self.x.min()), int(self.y.min())
+            right = int((self.x + self.w).max())
+            bottom = int((self.y + self.h).max())
+            self.layer_rect = pygame.Rect(left, top, right - left, bottom - top)
+        else:
+            self.layer_rect = pygame.Rect(origin_x, origin_y, 0, 0)
+        self.layer = None
+        self._dirty = set()
+
+    @classmethod
+    def get_type_id(cls, brick_type):
+        """Convert a brick type name to its type id (red if unknown)."""
+        if brick_type in Brick.BRICK_TYPES:
+            return cls.TYPE_NAMES.index(brick_type)
+        return cls.TYPE_NAMES.index("red")
+
+    def __len__(self):
+        return self.alive_count
+
+    def is_cleared(self):
+        """Check whether every brick has been destroyed.
+
+        Returns:
+            bool: True when no brick is left alive.
+        """
+        return self.alive_count == 0
+
+    def get_rect(self, index):
+        """Build a pygame.Rect for one brick.
+
+        Args:
+            index (int): Brick index.
+
+        Returns:
+            pygame.Rect: The brick's collision rectangle.
+        """
+        return pygame.Rect(int(self.x[index]), int(self.y[index]),
+                           int(self.w[index]), int(self.h[index]))
+
+    def apply_damage(self, bricks, damage=1):
+        """Damage a batch of bricks and retire the destroyed ones.
+
+        A brick listed several times takes damage once per occurrence.
+
+        Args:
+            bricks (numpy.ndarray): Indices of the bricks that were hit.
+            damage (int): Damage applied per hit (default: 1).
+
+        Returns:
+            int: Points earned for the bricks destroyed by this batch.
+        """
+        if len(bricks) == 0:
+            return 0
+        np.subtract.at(self.health, bricks, damage)
+
+        destroyed = np.unique(bricks)
+        destroyed = destroyed[self.alive[destroyed]
+                              & (self.health[destroyed] <= 0)]
+        self.alive[destroyed] = False
+        self.alive_count -= len(destroyed)
+        self.grid.remove(self.row[destroyed], self.col[destroyed])
+        self._dirty.update(np.unique(bricks).tolist())
+
+        return int(self.TYPE_POINTS[self.type_id[destroyed]].sum())
+
+    def clear(self):
+        """Destroy every brick at once (no points awarded)."""
+        self.alive.fill(False)
+        self.alive_count = 0
+        self.grid.clear()
+        if self.layer is not None:
+            self.layer.fill(self.LAYER_KEY)
+        self._dirty.clear()
+
+    def get_sprite(self, type_id, health, width, height):
+        """Return the brick atlas surface for a brick appearance."""
+        color = Brick.BRICK_TYPES[self.TYPE_NAMES[type_id]][0]
+        return Brick.get_sprite(width, height, color, health)
+
+    def build_layer(self):
+        """Composite every alive brick into the static layer surface."""
+        self.layer = pygame.Surface(self.layer_rect.size)
+        if pygame.display.get_surface():
+            self.layer = self.layer.convert()
+        self.layer.fill(self.LAYER_KEY)
+        self.layer.set_colorkey(self.LAYER_KEY)
+        for i in np.nonzero(self.alive)[0]:
+            self.paint(i)
+        self._dirty.clear()
+
+    def paint(self, index):
+        """Repaint one brick's area of the layer (erase it if destroyed).
+
+        Args:
+            index (int): Brick index.
+        """
+        x = int(self.x[index]) - self.layer_rect.x
+        y = int(self.y[index]) - self.layer_rect.y
+        w, h = int(self.w[index]), int(self.h[index])
+        if self.alive[index]:
+            sprite = self.get_sprite(int(self.type_id[index]),
+                                     int(self.health[index]), w, h)
+            self.layer.blit(sprite, (x, y))
+        else:
+            self.layer.fill(self.LAYER_KEY, (x, y, w, h))
+
+    def get_draw_rects(self):
+        """Area covered by the brick layer (nothing once cleared)."""
+        return [self.layer_rect] if self.alive_count else []
+
+    def get_changed_rects(self):
+        """Bricks damaged or destroyed since the last frame."""
+        return [self.get_rect(index) for index in self._dirty]
+
+    def render(self, screen):
+        """Draw all bricks with one blit of the pre-rendered layer.
+
+        Bricks damaged or destroyed since the last frame are repainted
+        on the layer first.
+
+        Args:
+            screen (pygame.Surface): The surface to render to.
+        """
+        if self.layer is None:
+            self.build_layer()
+        elif self._dirty:
+            for index in self._dirty:
+                self.paint(index)
+            self._dirty.clear()
+        if self.alive_count:
+            screen.blit(self.layer, self.layer_rect)
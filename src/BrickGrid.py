@@ -0,0 +1,118 @@
+"""BrickGrid.py
+
+Created on 2025-10-21
+
+Uniform grid spatial index for Brick Breaker bricks.
+Maps level grid cells to the index of the brick occupying them so
+collision checks only look at the few cells a rect overlaps.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import numpy as np
+
+
+class BrickGrid:
+    """Spatial index keyed on the level's brick grid.
+
+    The grid pitch is the brick size plus spacing, exactly as computed by
+    BrickBreakerLevel._load_level, so every brick lives in a single cell.
+    Cells store brick indices into a BrickField, -1 meaning empty.
+
+    Attributes:
+        origin_x (int): X coordinate of the left edge of column 0.
+        origin_y (int): Y coordinate of the top edge of row 0.
+        cell_width (int): Horizontal pitch (brick width + spacing).
+        cell_height (int): Vertical pitch (brick height + spacing).
+        cells (numpy.ndarray): (rows, cols) array of brick indices.
+    """
+
+    def __init__(self, origin_x=0, origin_y=0, cell_width=85, cell_height=35,
+                 rows=0, cols=0):
+        """Initialize an empty grid.
+
+        Args:
+            origin_x (int): X coordinate of the grid origin.
+            origin_y (int): Y coordinate of the grid origin.
+            cell_width (int): Horizontal pitch in pixels.
+            cell_height (int): Vertical pitch in pixels.
+            rows (int): Number of grid rows.
+            cols (int): Number of grid columns.
+        """
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cell_width = max(1, cell_width)
+        self.cell_height = max(1, cell_height)
+        self.cells = np.full((rows, cols), -1, dtype=np.int32)
+
+    def insert(self, index, row, col):
+        """Register a brick index in the given grid cell.
+
+        Args:
+            index (int): Brick index in the owning BrickField.
+            row (int): Grid row of the brick.
+            col (int): Grid column of the brick.
+        """
+        self.cells[row, col] = index
+
+    def remove(self, rows, cols):
+        """Empty the given cells in O(1) per brick.
+
+        Args:
+            rows (numpy.ndarray): Grid rows of the removed bricks.
+            cols (numpy.ndarray): Grid columns of the removed bricks.
+        """
+        self.cells[rows, cols] = -1
+
+    def clear(self):
+        """Remove every brick from the index."""
+        self.cells.fill(-1)
+
+    def candidates(self, left, top, right, bottom):
+        """Find brick indices in the cells overlapped by a batch of rects.
+
+        Args:
+            left (numpy.ndarray): Left edges of the query rects.
+            top (numpy.ndarray): Top edges of the query rects.
+            right (numpy.ndarray): Right edges (exclusive) of the rects.
+            bottom (numpy.ndarray): Bottom edges (exclusive) of the rects.
+
+        Returns:
+            tuple: (rect_indices, brick_indices) arrays, one entry per
+                non-empty cell overlapped by a rect.
+        """
+        rows, cols = self.cells.shape
+        if rows == 0 or cols == 0 or len(left) == 0:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+
+        col_start = (left - self.origin_x) // self.cell_width
+        col_end = (right - 1 - self.origin_x) // self.cell_width
+        row_start = (top - self.origin_y) // self.cell_height
+        row_end = (bottom - 1 - self.origin_y) // self.cell_height
+
+        # Rects are usually smaller than a cell, so the span is tiny
+        col_span = int((col_end - col_start).max()) + 1
+        row_span = int((row_end - row_start).max()) + 1
+
+        found_rects = []
+        found_bricks = []
+        for dr in range(row_span):
+            row = row_start + dr
+            row_ok = (row <= row_end) & (row >= 0) & (row < rows)
+            for dc in range(col_span):
+                col = col_start + dc
+                ok = row_ok & (col <= col_end) & (col >= 0) & (col < cols)
+                hit = np.nonzero(ok)[0]
+                if len(hit) == 0:
+                    continue
+                bricks = self.cells[row[hit], col[hit]]
+                occupied = bricks >= 0
+                found_rects.append(hit[occupied])
+                found_bricks.append(bricks[occupied])
+
+        if not found_rects:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        return np.concatenate(found_rects), np.concatenate(found_bricks)
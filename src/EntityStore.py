@@ -0,0 +1,253 @@
+"""EntityStore.py
+
+Created on 2025-10-29
+
+Storage for the game objects of a scene.
+Entities are addressed by generational handles, removed in O(1) by
+swapping the last entity into the gap, and destroyed through a queue
+flushed at the end of the tick so a scene can safely iterate while its
+objects die. Per-type and per-tag indexes answer queries without
+scanning every entity.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+from collections import namedtuple
+
+
+# A slot index plus the generation of the entity that owned it; a handle
+# becomes stale once its entity is removed and the slot reused
+Handle = namedtuple("Handle", ["slot", "generation"])
+
+
+class EntityStore:
+    """Dense entity storage with generational handles.
+
+    Storage is unordered (swap-remove), but iteration and queries return
+    entities in the order they were added, which is also their draw
+    order. The ordered views are cached and only rebuilt after an
+    entity is added or removed.
+
+    Attributes:
+        pending (dict): Handles queued for destruction by destroy(), in
+            queue order.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        # Dense arrays, indexed by position
+        self._entities = []
+        self._dense_slot = []
+        self._sequence = []
+        # Sparse arrays, indexed by slot
+        self._slot_dense = []
+        self._generations = []
+        self._tags = []
+        self._free = []
+        self._slot_of = {}
+        self._next_sequence = 0
+        # Indexes: class or tag -> set of slots
+        self._by_type = {}
+        self._by_tag = {}
+        # Cached ordered views, cleared when the store changes
+        self._views = {}
+        self.pending = {}
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, entity):
+        return id(entity) in self._slot_of
+
+    def __iter__(self):
+        return iter(self.ordered())
+
+    def add(self, entity, tags=()):
+        """Add an entity.
+
+        Args:
+            entity: The object to store.
+            tags (iterable): Tags to index the entity under.
+
+        Returns:
+            Handle: Handle addressing the entity.
+        """
+        if id(entity) in self._slot_of:
+            return self.handle_of(entity)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._generations)
+            self._generations.append(0)
+            self._slot_dense.append(-1)
+            self._tags.append(())
+
+        self._slot_dense[slot] = len(self._entities)
+        self._entities.append(entity)
+        self._dense_slot.append(slot)
+        self._sequence.append(self._next_sequence)
+        self._next_sequence += 1
+        self._slot_of[id(entity)] = slot
+
+        for cls in type(entity).__mro__:
+            self._by_type.setdefault(cls, set()).add(slot)
+        self._tags[slot] = tuple(tags)
+        for tag in self._tags[slot]:
+            self._by_tag.setdefault(tag, set()).add(slot)
+
+        self._views.clear()
+        return Handle(slot, self._generations[slot])
+
+    def get(self, handle):
+        """Return the entity a handle refers to.
+
+        Args:
+            handle (Handle): Handle returned by add().
+
+        Returns:
+            The entity, or None if it has been removed since.
+        """
+        slot, generation = handle
+        if (slot < len(self._generations)
+                and self._generations[slot] == generation
+                and self._slot_dense[slot] >= 0):
+            return self._entities[self._slot_dense[slot]]
+        return None
+
+    def handle_of(self, entity):
+        """Return the handle of a stored entity (None if not stored)."""
+        slot = self._slot_of.get(id(entity))
+        if slot is None:
+            return None
+        return Handle(slot, self._generations[slot])
+
+    def _resolve(self, target):
+        """Slot of an entity or handle, or None if not stored."""
+        if isinstance(target, Handle):
+            return target.slot if self.get(target) is not None else None
+        return self._slot_of.get(id(target))
+
+    def remove(self, target):
+        """Remove an entity immediately.
+
+        The last entity is moved into the freed position, so removal is
+        O(1). Use destroy() while iterating over the store.
+
+        Args:
+            target: The entity or its Handle.
+
+        Returns:
+            bool: True if something was removed.
+        """
+        slot = self._resolve(target)
+        if slot is None:
+            return False
+
+        dense = self._slot_dense[slot]
+        entity = self._entities[dense]
+        last = len(self._entities) - 1
+        if dense != last:
+            # Swap the last entity into the gap
+            moved_slot = self._dense_slot[last]
+            self._entities[dense] = self._entities[last]
+            self._dense_slot[dense] = moved_slot
+            self._sequence[dense] = self._sequence[last]
+            self._slot_dense[moved_slot] = dense
+        self._entities.pop()
+        self._dense_slot.pop()
+        self._sequence.pop()
+
+        del self._slot_of[id(entity)]
+        for cls in type(entity).__mro__:
+            self._by_type[cls].discard(slot)
+        for tag in self._tags[slot]:
+            self._by_tag[tag].discard(slot)
+        self._tags[slot] = ()
+
+        # Invalidate outstanding handles and recycle the slot
+        self._slot_dense[slot] = -1
+        self._generations[slot] += 1
+        self._free.append(slot)
+        self._views.clear()
+        return True
+
+    def destroy(self, target):
+        """Queue an entity for removal at the next flush().
+
+        Args:
+            target: The entity or its Handle.
+        """
+        slot = self._resolve(target)
+        if slot is not None:
+            self.pending.setdefault(Handle(slot, self._generations[slot]))
+
+    def flush(self):
+        """Remove every entity queued by destroy().
+
+        Returns:
+            int: Number of entities removed.
+        """
+        removed = 0
+        pending, self.pending = self.pending, {}
+        for handle in pending:
+            # Skip entities already removed by remove() in the meantime
+            removed += self.remove(handle)
+        return removed
+
+    def clear(self):
+        """Remove every entity (outstanding handles become stale)."""
+        for entity in list(self._entities):
+            self.remove(entity)
+        self.pending = {}
+
+    def _ordered_slots(self, slots):
+        """Entities of a set of slots, in the order they were added."""
+        dense = sorted((self._slot_dense[slot] for slot in slots),
+                       key=self._sequence.__getitem__)
+        return [self._entities[i] for i in dense]
+
+    def ordered(self):
+        """Every entity in the order it was added.
+
+        Returns:
+            list: A cached snapshot; safe to iterate while entities are
+                added or destroyed.
+        """
+        view = self._views.get(None)
+        if view is None:
+            view = self._ordered_slots(self._dense_slot)
+            self._views[None] = view
+        return view
+
+    def query(self, cls):
+        """Entities that are instances of a class, in insertion order.
+
+        Args:
+            cls (type): Class to look for (subclasses match too).
+
+        Returns:
+            list: A cached snapshot of the matching entities.
+        """
+        key = ("type", cls)
+        view = self._views.get(key)
+        if view is None:
+            view = self._ordered_slots(self._by_type.get(cls, ()))
+            self._views[key] = view
+        return view
+
+    def query_tag(self, tag):
+        """Entities added with a tag, in insertion order.
+
+        Args:
+            tag (str): Tag given to add().
+
+        Returns:
+            list: A cached snapshot of the matching entities.
+        """
+        key = ("tag", tag)
+        view = self._views.get(key)
+        if view is None:
+            view = self._ordered_slots(self._by_tag.get(tag, ()))
+            self._views[key] = view
+        return view
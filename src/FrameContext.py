@@ -0,0 +1,72 @@
+"""FrameContext.py
+
+Created on 2025-10-27
+
+Display surface and screen size shared by every game object.
+Built once from the display and reused frame after frame, so hot paths
+no longer query pygame.display.get_surface() and get_size() on their
+own. It is only rebuilt after the display mode changes.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import pygame
+
+
+class FrameContext:
+    """Screen information for the current frame.
+
+    Attributes:
+        surface (pygame.Surface): The display surface, or None when no
+            display mode has been set yet.
+        width (int): Screen width in pixels.
+        height (int): Screen height in pixels.
+        size (tuple): (width, height).
+        bounds (pygame.Rect): The visible area of the frame.
+        frame (int): Number of frames begun with this context.
+    """
+
+    _current = None
+
+    def __init__(self, surface):
+        """Initialize the context.
+
+        Args:
+            surface (pygame.Surface): The display surface (may be None).
+        """
+        self.surface = surface
+        self.size = surface.get_size() if surface else (0, 0)
+        self.width, self.height = self.size
+        self.bounds = pygame.Rect((0, 0), self.size)
+        self.frame = 0
+
+    @classmethod
+    def current(cls):
+        """Return the context, building it from the display if needed.
+
+        A context without a display surface is not kept, so the next call
+        picks up the display once it exists.
+        """
+        context = cls._current
+        if context is None:
+            context = cls(pygame.display.get_surface())
+            if context.surface is not None:
+                cls._current = context
+        return context
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the context after the display mode (resolution) changed."""
+        cls._current = None
+
+    @classmethod
+    def begin_frame(cls):
+        """Get the context for a new frame.
+
+        Returns:
+            FrameContext: The context shared by every object this frame.
+        """
+        context = cls.current()
+        context.frame += 1
+        return context
@@ -0,0 +1,236 @@
+"""FrameProfiler.py
+
+Created on 2025-11-03
+
+Per-phase frame profiler and its on-screen HUD (F3).
+Splits every frame into input, scene update, collision, render and
+flip/tick wait, keeps a rolling history of frame times and draws it as
+a graph with 60 and 240 FPS budget lines, next to the p99 and worst
+frame times and the object counts of the scene.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import time
+import numpy as np
+import pygame
+from .TextCache import TextCache
+
+
+class FrameProfiler:
+    """Rolling per-phase frame timings.
+
+    The main loop calls begin_frame(), then mark() after each phase and
+    end_frame() once the frame is presented. Collision is measured
+    inside the update with start()/stop() and reported separately from
+    the rest of the update. Nothing is measured while disabled.
+
+    Attributes:
+        enabled (bool): True while the HUD is shown.
+        history (numpy.ndarray): (HISTORY, len(PHASES)) phase durations
+            in milliseconds, used as a ring buffer.
+        frames (int): Number of frames recorded.
+        phases (dict): Seconds spent in each phase so far this frame.
+        counts (dict): Object counts of the scene, shown by the HUD.
+        notes (list): Extra lines of text shown by the HUD.
+
+    Class Attributes:
+        PHASES (tuple): Phase names, in frame order.
+        COLORS (tuple): HUD color of each phase.
+        BUDGETS (tuple): Frame budgets drawn on the graph, in ms.
+        HISTORY (int): Number of frames kept.
+        HUD_RECT (pygame.Rect): Screen area covered by the HUD.
+    """
+
+    PHASES = ("input", "update", "collision", "render", "flip")
+    COLORS = ((120, 120, 255), (80, 200, 80), (255, 160, 0),
+              (220, 80, 220), (110, 110, 110))
+    BUDGETS = (1000 / 60, 1000 / 240)
+    HISTORY = 240
+    HUD_RECT = pygame.Rect(10, 10, 260, 210)
+    # Frame time at the top of the graph, in ms
+    GRAPH_SCALE = 2 * 1000 / 60
+    # The text is refreshed a few times per second to stay readable
+    TEXT_REFRESH = 15
+
+    _current = None
+
+    def __init__(self):
+        self.enabled = False
+        self.history = np.zeros((self.HISTORY, len(self.PHASES)))
+        self.frames = 0
+        self.phases = dict.fromkeys(self.PHASES, 0.0)
+        self.counts = {}
+        self.notes = []
+        self._mark = 0.0
+        # False until a frame is begun while enabled
+        self._in_frame = False
+        self._lines = []
+        self._panel = None
+
+    @classmethod
+    def current(cls):
+        """Return the installed profiler, creating a disabled one if needed."""
+        if cls._current is None:
+            cls._current = cls()
+        return cls._current
+
+    def install(self):
+        """Make this profiler the one returned by FrameProfiler.current().
+
+        Returns:
+            FrameProfiler: self, for chaining.
+        """
+        FrameProfiler._current = self
+        return self
+
+    def set_enabled(self, enabled):
+        """Start or stop profiling; the history restarts when enabled."""
+        if enabled and not self.enabled:
+            self.history.fill(0.0)
+            self.frames = 0
+            self._lines = []
+        self.enabled = enabled
+        self._in_frame = False
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        if self.enabled:
+            for phase in self.phases:
+                self.phases[phase] = 0.0
+            self._in_frame = True
+            self._mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Charge the time since the previous mark to a phase.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        if self._in_frame:
+            now = time.perf_counter()
+            self.phases[phase] += now - self._mark
+            self._mark = now
+
+    def start(self):
+        """Start timing a nested section (see stop())."""
+        return time.perf_counter() if self._in_frame else 0.0
+
+    def stop(self, phase, start):
+        """Charge a nested section to a phase.
+
+        Args:
+            phase (str): One of PHASES.
+            start (float): Value returned by start().
+        """
+        if self._in_frame:
+            self.phases[phase] += time.perf_counter() - start
+
+    def end_frame(self):
+        """Record the frame in the history."""
+        if not self._in_frame:
+            return
+        # Collision runs inside the update: report the update without it
+        self.phases["update"] = max(
+            0.0, self.phases["update"] - self.phases["collision"])
+        row = self.history[self.frames % self.HISTORY]
+        for i, phase in enumerate(self.PHASES):
+            row[i] = self.phases[phase] * 1000.0
+        self.frames += 1
+
+    def get_stats(self):
+        """Summarize the recorded frames.
+
+        Returns:
+            dict: "frame" (last frame time), "p99" and "worst" frame times
+                and "phases" (mean time per phase), in milliseconds.
+        """
+        count = min(self.frames, self.HISTORY)
+        if count == 0:
+            return {"frame": 0.0, "p99": 0.0, "worst": 0.0,
+                    "phases": dict.fromkeys(self.PHASES, 0.0)}
+        recorded = self.history[:count]
+        totals = recorded.sum(axis=1)
+        means = recorded.mean(axis=0)
+        return {
+            "frame": float(totals[(self.frames - 1) % self.HISTORY]),
+            "p99": float(np.percentile(totals, 99)),
+            "worst": float(totals.max()),
+            "phases": {phase: float(means[i])
+                       for i, phase in enumerate(self.PHASES)},
+        }
+
+    def build_lines(self, fps):
+        """Text lines of the HUD.
+
+        Args:
+            fps (float): Frames per second measured by the clock.
+
+        Returns:
+            list: (text, color) pairs.
+        """
+        stats = self.get_stats()
+        lines = [(f"FPS: {int(fps)}  frame {stats['frame']:.1f} ms",
+                  (255, 255, 255)),
+                 (f"p99 {stats['p99']:.1f} ms  worst {stats['worst']:.1f} ms",
+                  (255, 255, 255))]
+        for phase, color in zip(self.PHASES, self.COLORS):
+            lines.append((f"{phase:<9} {stats['phases'][phase]:6.2f} ms", color))
+        if self.counts:
+            lines.append(("  ".join(f"{name} {value}"
+                                    for name, value in self.counts.items()),
+                          (200, 200, 200)))
+        for note in self.notes:
+            lines.append((note, (200, 200, 200)))
+        return lines
+
+    def render(self, screen, fps):
+        """Draw the HUD: stats, phase breakdown and frame-time graph.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            fps (float): Frames per second measured by the clock.
+        """
+        rect = self.HUD_RECT
+        if self._panel is None:
+            self._panel = pygame.Surface(rect.size)
+            self._panel.set_alpha(180)
+            self._panel.fill((0, 0, 0))
+        screen.blit(self._panel, rect)
+
+        if not self._lines or self.frames % self.TEXT_REFRESH == 0:
+            self._lines = self.build_lines(fps)
+        text_cache = TextCache()
+        font = text_cache.get_font(TextCache.MENU_FONT, 14)
+        y = rect.y + 4
+        for text, color in self._lines:
+            surface = text_cache.render(font, text, color)
+            screen.blit(surface, (rect.x + 6, y))
+            y += 14
+
+        # Frame-time graph, newest frame on the right
+        graph = pygame.Rect(rect.x + 6, y + 4, rect.width - 12,
+                            rect.bottom - y - 10)
+        if graph.height <= 0:
+            return
+        count = min(self.frames, self.HISTORY, graph.width)
+        if count:
+            indices = (np.arange(self.frames - count, self.frames)
+                       % self.HISTORY)
+            totals = self.history[indices].sum(axis=1)
+            heights = np.minimum(
+                totals / self.GRAPH_SCALE * graph.height, graph.height)
+            x0 = graph.right - count
+            for i in range(count):
+                height = int(heights[i])
+                if height:
+                    color = ((220, 60, 60) if totals[i] > self.BUDGETS[0]
+                             else (80, 200, 80))
+                    pygame.draw.line(screen, color,
+                                     (x0 + i, graph.bottom - 1),
+                                     (x0 + i, graph.bottom - height))
+        for budget in self.BUDGETS:
+            y = graph.bottom - int(budget / self.GRAPH_SCALE * graph.height)
+            pygame.draw.line(screen, (255, 255, 0),
+                             (graph.left, y), (graph.right - 1, y))
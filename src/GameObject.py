@@ -9,12 +9,15 @@ __author__ = "carras_a"
 __version__ = "1.0"
 
 import pygame
+from .GameClock import GameClock
 
 
 class GameObject():
     def __init__(self):
         self.is_dead = False
         self.position = (100, 100)
+        # Position at the start of the current tick, for interpolation
+        self.prev_position = None
 
     def kill(self):
         self.is_dead = True
@@ -28,6 +31,38 @@ class GameObject():
     def setPosition(self, position):
         self.position = position
 
+    def save_state(self):
+        """Remember the current position before a simulation tick."""
+        self.prev_position = self.position
+
+    def get_render_position(self):
+        """Position interpolated between the last two simulation ticks."""
+        if self.prev_position is None:
+            return self.position
+        alpha = GameClock.current().alpha
+        px, py = self.prev_position
+        x, y = self.position
+        return (px + (x - px) * alpha, py + (y - py) * alpha)
+
+    def get_draw_rects(self):
+        """Screen areas the next render() call will cover.
+
+        Used by the dirty-rect render mode. Objects that cannot tell
+        return None, which makes the scene redraw the whole screen.
+
+        Returns:
+            list or None: pygame.Rect areas, or None if unknown.
+        """
+        return None
+
+    def get_changed_rects(self):
+        """Areas whose content changed although the object did not move.
+
+        Returns:
+            list: pygame.Rect areas to redraw this frame.
+        """
+        return []
+
     def handle_event(self, event):
         pass
 
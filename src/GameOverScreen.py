@@ -11,6 +11,7 @@ __version__ = "1.0"
 import pygame
 from .Scene import Scene
 from .MenuButton import MenuButton
+from .TextCache import TextCache
 
 
 class GameOverScreen(Scene):
@@ -36,16 +37,11 @@ class GameOverScreen(Scene):
             self.screen_width = 800
             self.screen_height = 600
 
-        # Load fonts
-        try:
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 80)
-            self.label_font = pygame.font.Font(None, 40)
-        except Exception:
-            # Fallback to default font
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 80)
-            self.label_font = pygame.font.Font(None, 40)
+        # Load fonts (shared with the rest of the game)
+        text_cache = TextCache()
+        self.title_font = text_cache.get_font(None, 100)
+        self.score_font = text_cache.get_font(None, 80)
+        self.label_font = text_cache.get_font(None, 40)
 
         # Create buttons using MenuButton
         self.play_again_button = MenuButton("PLAY_BRICK_GAME", "Rejouer")
@@ -57,29 +53,31 @@ class GameOverScreen(Scene):
 
     def render(self, screen):
         """Render the game over screen."""
+        text_cache = TextCache()
         # Fill background with dark color
         screen.fill((20, 20, 40))
 
         # Render "GAME OVER" text
         game_over_text = "GAME OVER"
         game_over_color = (220, 50, 50)
-        game_over_surface = self.title_font.render(
-            game_over_text, True, game_over_color)
+        game_over_surface = text_cache.render(
+            self.title_font, game_over_text, game_over_color)
         game_over_rect = game_over_surface.get_rect(
             center=(self.screen_width // 2, 150))
         screen.blit(game_over_surface, game_over_rect)
 
         # Render "SCORE" label
         score_label = "SCORE"
-        label_surface = self.label_font.render(
-            score_label, True, (200, 200, 200))
+        label_surface = text_cache.render(
+            self.label_font, score_label, (200, 200, 200))
         label_rect = label_surface.get_rect(
             center=(self.screen_width // 2, 250))
         screen.blit(label_surface, label_rect)
 
         # Render final score
         score_text = str(self.score)
-        score_surface = self.score_font.render(score_text, True, (255, 215, 0))
+        score_surface = text_cache.render(
+            self.score_font, score_text, (255, 215, 0))
         score_rect = score_surface.get_rect(
             center=(self.screen_width // 2, 320))
         screen.blit(score_surface, score_rect)
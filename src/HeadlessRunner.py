@@ -0,0 +1,244 @@
+"""HeadlessRunner.py
+
+Created on 2025-10-25
+
+Headless, faster-than-real-time simulation of the game levels.
+Runs PongLevel or BrickBreakerLevel on the SDL dummy video and audio
+drivers with a synthetic clock and scripted input, as fast as the CPU
+allows, and reports the simulation throughput.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import os
+import random
+import time
+import numpy as np
+import pygame
+from .GameClock import GameClock
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .Tracer import Tracer
+from .SoundManager import SoundManager
+
+
+def autopilot(tick, scene):
+    """Default input script: launch every ball and keep it in play.
+
+    Holds SPACE so waiting balls are launched. Pong levels run AI vs AI;
+    in Brick Breaker the first paddle is steered with its own keys,
+    through the same input path as a player, to where the next falling
+    ball will reach it.
+
+    Args:
+        tick (int): Index of the tick about to be simulated.
+        scene (Scene): The level being simulated.
+
+    Returns:
+        tuple: The keys held during this tick.
+    """
+    keys = (pygame.K_SPACE,)
+    balls = scene.balls if hasattr(scene, 'balls') else None
+    if balls is None or len(balls) == 0:
+        return keys
+
+    # Aim where the first falling ball will cross the top of the paddle,
+    # unfolding its bounces off the side walls
+    paddle = scene.p1
+    pos, vel = balls.pos, balls.vel
+    arrival = np.full(len(balls), np.inf)
+    falling = vel[:, 1] > 0
+    arrival[falling] = ((paddle.rect.top - balls.height - pos[falling, 1])
+                        / vel[falling, 1])
+    arrival[arrival < 0] = np.inf
+    if np.isinf(arrival).all():
+        target = pos[:, 0].mean() + balls.width / 2
+    else:
+        first = arrival.argmin()
+        span = FrameContext.current().width - balls.width
+        x = (pos[first, 0] + vel[first, 0] * arrival[first]) % (2 * span)
+        target = (2 * span - x if x > span else x) + balls.width / 2
+
+    # Hold left or right until the paddle is within one tick of the target
+    step = paddle.speed * GameClock.current().dt
+    offset = target - paddle.rect.centerx
+    if offset < -step:
+        keys += (paddle.keys[0],)
+    elif offset > step:
+        keys += (paddle.keys[1],)
+    return keys
+
+
+def key_script(schedule):
+    """Build an input script that replays a recorded key stream.
+
+    Args:
+        schedule (dict): Maps a tick index to the keys held from that
+            tick on, until the next entry.
+
+    Returns:
+        callable: A script(tick, scene) usable by HeadlessRunner.
+    """
+    changes = sorted(schedule.items())
+    held = {"keys": (), "next": 0}
+
+    def script(tick, scene):
+        while held["next"] < len(changes) and changes[held["next"]][0] <= tick:
+            held["keys"] = changes[held["next"]][1]
+            held["next"] += 1
+        return held["keys"]
+    return script
+
+
+class HeadlessRunner:
+    """Steps a level with a synthetic clock and scripted input.
+
+    Attributes:
+        mode (str): "pong" or "brick".
+        level_number (int): Brick Breaker level to load.
+        tick_rate (int): Simulation ticks per second.
+        size (tuple): Virtual screen size (width, height).
+        script (callable): Called as script(tick, scene) before each tick;
+            returns the keys held during that tick.
+        render (bool): Also render every tick to the dummy display.
+        seed (int): Random seed, for reproducible runs.
+        clock (GameClock): Synthetic clock driving the simulation.
+    """
+
+    def __init__(self, mode="pong", level_number=1, tick_rate=120,
+                 size=(1280, 720), script=autopilot, render=False, seed=0):
+        """Initialize the runner.
+
+        Args:
+            mode (str): "pong" or "brick".
+            level_number (int): Brick Breaker level to load.
+            tick_rate (int): Simulation ticks per second.
+            size (tuple): Virtual screen size (width, height).
+            script (callable): Input script, or None for no input.
+            render (bool): Also render every tick.
+            seed (int): Random seed.
+        """
+        self.mode = mode
+        self.level_number = level_number
+        self.tick_rate = tick_rate
+        self.size = size
+        self.script = script
+        self.render = render
+        self.seed = seed
+        self.clock = None
+        self.scene = None
+
+    @staticmethod
+    def init_display(size):
+        """Initialize pygame on the dummy drivers with a virtual screen.
+
+        Args:
+            size (tuple): Virtual screen size (width, height).
+
+        Returns:
+            pygame.Surface: The dummy display surface.
+        """
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        screen = pygame.display.set_mode(size)
+        FrameContext.invalidate()
+        return screen
+
+    def build_scene(self):
+        """Create the level to simulate.
+
+        Returns:
+            Scene: A PongLevel (AI vs AI) or a BrickBreakerLevel.
+        """
+        if self.mode == "brick":
+            from .BrickBreakerLevel import BrickBreakerLevel
+            return BrickBreakerLevel(players=1, level_number=self.level_number)
+        from .PongLevel import PongLevel
+        return PongLevel(players=0, difficulty="HARD")
+
+    def run(self, ticks=10000):
+        """Simulate a number of ticks, or until the level ends.
+
+        Args:
+            ticks (int): Maximum number of ticks to simulate.
+
+        Returns:
+            dict: Ticks simulated, wall time, ticks per second, simulated
+                seconds and the level's final result (None if still
+                running).
+        """
+        screen = pygame.display.get_surface() or self.init_display(self.size)
+        random.seed(self.seed)
+        self.clock = GameClock(self.tick_rate).install()
+        self.scene = self.build_scene()
+        state = InputState().install()
+
+        tracer = Tracer.current()
+        sounds = SoundManager()
+        name = type(self.scene).__name__
+        update_span, render_span = f"{name}.update", f"{name}.render"
+        result = None
+        done = 0
+        start = time.perf_counter()
+        for tick in range(ticks):
+            pygame.event.pump()
+            keys = self.script(tick, self.scene) if self.script else ()
+            state = InputState.from_keys(keys or (), state).install()
+            self.clock.advance()
+            span_start = tracer.start()
+            result = self.scene.update()
+            sounds.flush()
+            tracer.complete(update_span, "scene", span_start)
+            done += 1
+            if self.render:
+                span_start = tracer.start()
+                screen.fill("BLACK")
+                self.scene.render(screen)
+                tracer.complete(render_span, "scene", span_start)
+            if isinstance(result, tuple) or result == "MAIN_MENU":
+                break
+            result = None
+        elapsed = time.perf_counter() - start
+
+        return {
+            "mode": self.mode,
+            "level": self.level_number if self.mode == "brick" else None,
+            "ticks": done,
+            "seconds": elapsed,
+            "ticks_per_second": done / elapsed if elapsed > 0 else 0.0,
+            "simulated_seconds": done / self.tick_rate,
+            "result": result,
+            "ball_pool": (self.scene.balls.get_stats()
+                          if hasattr(self.scene, 'balls') else None),
+            "sounds": sounds.get_stats(),
+        }
+
+
+def main(args):
+    """Run a headless simulation from parsed command line arguments.
+
+    Args:
+        args (argparse.Namespace): Arguments parsed by main.py.
+    """
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    runner = HeadlessRunner(mode=args.headless, level_number=args.level,
+                            tick_rate=args.tick_rate, size=(width, height),
+                            render=args.render, seed=args.seed)
+    HeadlessRunner.init_display(runner.size)
+    report = runner.run(args.ticks)
+    pygame.quit()
+
+    print(f"{report['mode']}: {report['ticks']} ticks "
+          f"({report['simulated_seconds']:.1f} s simulated) in "
+          f"{report['seconds']:.3f} s -> "
+          f"{report['ticks_per_second']:.0f} ticks/s")
+    if report["result"] is not None:
+        print(f"Level ended: {report['result']}")
+    if report["ball_pool"] is not None:
+        print("Ball pool: " + ", ".join(
+            f"{key} {value}" for key, value in report["ball_pool"].items()))
+    print("Sounds: " + ", ".join(
+        f"{key} {value}" for key, value in report["sounds"].items()))
+    return report
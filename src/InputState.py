@@ -0,0 +1,196 @@
+"""InputState.py
+
+Created on 2025-10-26
+
+Immutable snapshot of the keyboard and mouse for one frame.
+The Game captures a single snapshot per frame from the event queue and
+installs it; game objects read it through InputState.current() instead
+of polling pygame.key and pygame.mouse themselves. Snapshots can also be
+built from scripted key sets, which makes input recordable and
+replayable.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import pygame
+
+
+class KeySet(frozenset):
+    """Frozen set of held keys, indexable like pygame.key.get_pressed()."""
+
+    def __getitem__(self, key):
+        return key in self
+
+
+class InputState:
+    """Keyboard and mouse state for one frame.
+
+    Edge-triggered fields (pressed, released, mouse_pressed,
+    mouse_released, mouse_rel) describe what happened since the previous
+    snapshot and are only seen by the first simulation tick of a frame;
+    later ticks get the held() version of the snapshot.
+
+    Attributes:
+        keys: Held keys, indexable by pygame key constant.
+        pressed (frozenset): Keys that went down this frame.
+        released (frozenset): Keys that went up this frame.
+        mouse_pos (tuple): Mouse position (x, y).
+        mouse_buttons (tuple): Held state of the left, middle and right
+            mouse buttons.
+        mouse_rel (tuple): Mouse movement since the previous snapshot.
+        mouse_pressed (frozenset): Mouse buttons (0 = left) that went
+            down this frame.
+        mouse_released (frozenset): Mouse buttons that went up this frame.
+    """
+
+    __slots__ = ("keys", "pressed", "released", "mouse_pos",
+                 "mouse_buttons", "mouse_rel", "mouse_pressed",
+                 "mouse_released")
+
+    _current = None
+
+    def __init__(self, keys=KeySet(), pressed=frozenset(),
+                 released=frozenset(), mouse_pos=(0, 0),
+                 mouse_buttons=(False, False, False), mouse_rel=(0, 0),
+                 mouse_pressed=frozenset(), mouse_released=frozenset()):
+        """Initialize the snapshot.
+
+        Args:
+            keys: Held keys, either pygame.key.get_pressed() or a KeySet.
+            pressed (frozenset): Keys that went down this frame.
+            released (frozenset): Keys that went up this frame.
+            mouse_pos (tuple): Mouse position.
+            mouse_buttons (tuple): Held mouse buttons.
+            mouse_rel (tuple): Mouse movement since the last snapshot.
+            mouse_pressed (frozenset): Mouse buttons that went down.
+            mouse_released (frozenset): Mouse buttons that went up.
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, "keys", keys)
+        setattr_(self, "pressed", frozenset(pressed))
+        setattr_(self, "released", frozenset(released))
+        setattr_(self, "mouse_pos", tuple(mouse_pos))
+        setattr_(self, "mouse_buttons", tuple(mouse_buttons))
+        setattr_(self, "mouse_rel", tuple(mouse_rel))
+        setattr_(self, "mouse_pressed", frozenset(mouse_pressed))
+        setattr_(self, "mouse_released", frozenset(mouse_released))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("InputState is immutable")
+
+    def __getitem__(self, key):
+        """Held state of a key, so a snapshot can replace get_pressed()."""
+        return bool(self.keys[key])
+
+    @classmethod
+    def current(cls):
+        """Return the installed snapshot (an empty one if none is)."""
+        if cls._current is None:
+            cls._current = cls()
+        return cls._current
+
+    def install(self):
+        """Make this snapshot the one returned by InputState.current().
+
+        Returns:
+            InputState: self, for chaining.
+        """
+        InputState._current = self
+        return self
+
+    @classmethod
+    def capture(cls, events, carry=None):
+        """Build the snapshot for a frame from pygame's state and events.
+
+        Args:
+            events (list): Events pulled from the queue this frame.
+            carry (InputState): Previous snapshot. Its edges are kept if
+                no simulation tick has consumed them yet (e.g. while the
+                clock is paused).
+
+        Returns:
+            InputState: The new snapshot.
+        """
+        pressed = set()
+        released = set()
+        mouse_pressed = set()
+        mouse_released = set()
+        rel_x, rel_y = pygame.mouse.get_rel()
+        if carry is not None:
+            pressed.update(carry.pressed)
+            released.update(carry.released)
+            mouse_pressed.update(carry.mouse_pressed)
+            mouse_released.update(carry.mouse_released)
+            rel_x += carry.mouse_rel[0]
+            rel_y += carry.mouse_rel[1]
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                pressed.add(event.key)
+            elif event.type == pygame.KEYUP:
+                released.add(event.key)
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pressed.add(event.button - 1)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                mouse_released.add(event.button - 1)
+
+        return cls(pygame.key.get_pressed(), pressed, released,
+                   pygame.mouse.get_pos(), pygame.mouse.get_pressed(),
+                   (rel_x, rel_y), mouse_pressed, mouse_released)
+
+    @classmethod
+    def from_keys(cls, keys, previous=None, mouse_pos=(0, 0),
+                  mouse_buttons=(False, False, False)):
+        """Build a snapshot from a scripted set of held keys.
+
+        Edges are derived by comparing with the previous snapshot.
+
+        Args:
+            keys (iterable): pygame key constants held this frame.
+            previous (InputState): Snapshot of the previous frame.
+            mouse_pos (tuple): Mouse position.
+            mouse_buttons (tuple): Held mouse buttons.
+
+        Returns:
+            InputState: The new snapshot.
+        """
+        keys = KeySet(keys)
+        before = previous.keys if previous is not None else KeySet()
+        if not isinstance(before, KeySet):
+            before = KeySet()
+        buttons_before = (previous.mouse_buttons if previous is not None
+                          else (False, False, False))
+        mouse_rel = ((mouse_pos[0] - previous.mouse_pos[0],
+                      mouse_pos[1] - previous.mouse_pos[1])
+                     if previous is not None else (0, 0))
+        return cls(keys, keys - before, before - keys, mouse_pos,
+                   mouse_buttons, mouse_rel,
+                   {i for i, b in enumerate(mouse_buttons)
+                    if b and not buttons_before[i]},
+                   {i for i, b in enumerate(mouse_buttons)
+                    if not b and buttons_before[i]})
+
+    def held(self):
+        """Same held keys and buttons, without this frame's edges.
+
+        Returns:
+            InputState: The snapshot seen by the later ticks of a frame.
+        """
+        if not (self.pressed or self.released or self.mouse_pressed
+                or self.mouse_released or any(self.mouse_rel)):
+            return self
+        return InputState(self.keys, mouse_pos=self.mouse_pos,
+                          mouse_buttons=self.mouse_buttons)
+
+    def is_down(self, key):
+        """Check whether a key is held."""
+        return bool(self.keys[key])
+
+    def was_pressed(self, key):
+        """Check whether a key went down this frame."""
+        return key in self.pressed
+
+    def was_released(self, key):
+        """Check whether a key went up this frame."""
+        return key in self.released
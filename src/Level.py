@@ -0,0 +1,41 @@
+"""Level.py
+
+Created on 2025-11-07
+
+Base class of the playable levels (Pong and Brick Breaker).
+Holds the pause state and the dirty-rect rendering rules they share.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+from .Scene import Scene
+
+
+class Level(Scene):
+    """A scene that can be paused with an overlay drawn on top.
+
+    Attributes:
+        paused (bool): True while the pause overlay is shown.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.paused = False
+
+    def get_render_key(self):
+        """The pause overlay covers the whole screen when toggled."""
+        return self.paused
+
+    def get_dirty_rects(self):
+        """The animated pause menu is always redrawn in full."""
+        if self.paused:
+            super().get_dirty_rects()
+            return None
+        return super().get_dirty_rects()
+
+    def render_area(self, screen, rect, objects):
+        """Only the objects meeting a dirty area are drawn again (the
+        pause overlay is always drawn in full redraws)."""
+        for object in objects:
+            object.render(screen)
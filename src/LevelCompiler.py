@@ -0,0 +1,344 @@
+"""LevelCompiler.py
+
+Created on 2025-10-31
+
+Compiles Brick Breaker level files into a binary cache.
+A level text file is parsed once into a grid of brick type ids; the
+brick layout (size, spacing, centering, row limit) is computed once per
+screen size and stored next to it. The compiled file is validated
+against the source file's mtime and size and checksummed, and it loads
+straight into a BrickField without parsing the text again.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import os
+import struct
+import threading
+import zlib
+from collections import namedtuple
+import numpy as np
+from .BrickField import BrickField
+from .Tracer import Tracer
+
+
+# Brick placement for one screen size
+LevelLayout = namedtuple("LevelLayout", [
+    "origin_x", "origin_y", "brick_width", "brick_height",
+    "spacing_x", "spacing_y", "rows"])
+
+
+class CompiledLevel:
+    """A parsed level and its layouts.
+
+    Attributes:
+        source (str): Path of the level text file.
+        mtime_ns (int): Modification time of the source when compiled.
+        source_size (int): Size in bytes of the source when compiled.
+        grid (numpy.ndarray): (rows, cols) int8 array of brick type ids,
+            -1 for empty cells.
+        layouts (dict): LevelLayout keyed by (screen_width, screen_height).
+    """
+
+    def __init__(self, source, mtime_ns, source_size, grid, layouts=None):
+        self.source = source
+        self.mtime_ns = mtime_ns
+        self.source_size = source_size
+        self.grid = grid
+        self.layouts = layouts if layouts is not None else {}
+
+    def compute_layout(self, screen_size):
+        """Fit the grid to a screen: scale, center and limit the rows.
+
+        Args:
+            screen_size (tuple): (width, height) of the screen.
+
+        Returns:
+            LevelLayout: Brick placement for that screen.
+        """
+        screen_width, screen_height = screen_size
+        brick_width = 80
+        brick_height = 30
+        spacing_x = 5
+        spacing_y = 5
+        margin_y = 10  # Top margin
+        row_count, max_row_length = self.grid.shape
+
+        # Calculate total width needed for the longest row
+        total_width_needed = max_row_length * \
+            (brick_width + spacing_x) - spacing_x
+
+        # Check if bricks fit on screen, if not scale them down
+        available_width = screen_width - 20  # 10px margin on each side
+        if total_width_needed > available_width:
+            # Scale down brick width to fit
+            scale_factor = available_width / total_width_needed
+            brick_width = int(brick_width * scale_factor)
+            spacing_x = int(spacing_x * scale_factor)
+            total_width_needed = max_row_length * \
+                (brick_width + spacing_x) - spacing_x
+
+        # Calculate horizontal offset to center the brick grid
+        margin_x = (screen_width - total_width_needed) // 2
+
+        # Limit number of rows to prevent overflow
+        max_rows = (screen_height - margin_y -
+                    200) // (brick_height + spacing_y)
+        if row_count > max_rows:
+            print(f"Warning: Level has {row_count} rows, "
+                  f"limiting to {max_rows} to fit screen")
+            row_count = max(0, max_rows)
+
+        return LevelLayout(margin_x, margin_y, brick_width, brick_height,
+                           spacing_x, spacing_y, row_count)
+
+    def get_layout(self, screen_size):
+        """Return the layout for a screen size, computing it if needed.
+
+        Args:
+            screen_size (tuple): (width, height) of the screen.
+
+        Returns:
+            tuple: (LevelLayout, created) where created is True when the
+                layout was not compiled yet.
+        """
+        screen_size = tuple(screen_size)
+        layout = self.layouts.get(screen_size)
+        if layout is not None:
+            return layout, False
+        layout = self.compute_layout(screen_size)
+        self.layouts[screen_size] = layout
+        return layout, True
+
+    def build_field(self, screen_size):
+        """Create the BrickField of this level for a screen size.
+
+        Args:
+            screen_size (tuple): (width, height) of the screen.
+
+        Returns:
+            BrickField: The level's bricks.
+        """
+        layout, _ = self.get_layout(screen_size)
+        return BrickField.from_grid(
+            self.grid[:layout.rows], layout.origin_x, layout.origin_y,
+            layout.brick_width, layout.brick_height,
+            layout.spacing_x, layout.spacing_y)
+
+
+class LevelCompiler:
+    """Parses level files and keeps their compiled form on disk.
+
+    Compiled levels are also kept in memory, so replaying a level only
+    checks the source file's mtime.
+
+    Class Attributes:
+        CACHE_DIR (str): Directory of the compiled level files.
+        MAGIC (bytes): Signature of a compiled level file.
+        VERSION (int): Format version; older files are recompiled.
+        BRICK_CHARS (dict): Brick type name per level file character.
+        LEVELS (dict): CompiledLevel keyed by source path.
+    """
+
+    CACHE_DIR = "levels/.cache"
+    MAGIC = b"BTLV"
+    VERSION = 1
+    # magic, version, layout count, source mtime_ns, source size,
+    # brick types checksum, payload checksum, grid rows, grid cols
+    HEADER = struct.Struct("<4sHHqqIIHH")
+    # screen width, screen height, then the LevelLayout fields
+    LAYOUT = struct.Struct("<9i")
+    # Compiled files become stale when the brick types change
+    TYPES_CHECKSUM = zlib.crc32(",".join(BrickField.TYPE_NAMES).encode())
+
+    BRICK_CHARS = {
+        'R': 'red',
+        'O': 'orange',
+        'Y': 'yellow',
+        'G': 'green',
+        'B': 'blue',
+        'P': 'purple',
+        'X': 'gray',
+    }
+
+    LEVELS = {}
+
+    @staticmethod
+    def level_path(level_number):
+        """Path of the text file of a level (1-based)."""
+        return f"levels/level_{level_number:03d}.txt"
+
+    @classmethod
+    def get_brick_type(cls, char):
+        """Convert a level file character to a brick type name."""
+        return cls.BRICK_CHARS.get(char.upper(), 'red')
+
+    @classmethod
+    def cache_path(cls, source):
+        """Path of the compiled file for a level file."""
+        name = os.path.splitext(os.path.basename(source))[0]
+        return os.path.join(cls.CACHE_DIR, name + ".bin")
+
+    @classmethod
+    def parse(cls, source):
+        """Parse a level text file into a compiled level (no layouts).
+
+        Args:
+            source (str): Path of the level file.
+
+        Returns:
+            CompiledLevel: The parsed level.
+        """
+        stat = os.stat(source)
+        with open(source, 'r') as f:
+            lines = f.readlines()
+
+        # Keep leading spaces but remove trailing; skip empty lines and
+        # comments
+        brick_rows = [line.rstrip() for line in lines]
+        brick_rows = [line for line in brick_rows
+                      if line and not line.startswith('#')]
+        max_row_length = max((len(line) for line in brick_rows), default=0)
+
+        grid = np.full((len(brick_rows), max_row_length), -1, dtype=np.int8)
+        for row_idx, line in enumerate(brick_rows):
+            for col_idx, char in enumerate(line):
+                if char == ' ' or char == '.':  # Empty space
+                    continue
+                grid[row_idx, col_idx] = BrickField.get_type_id(
+                    cls.get_brick_type(char))
+        return CompiledLevel(source, stat.st_mtime_ns, stat.st_size, grid)
+
+    @classmethod
+    def encode(cls, level):
+        """Serialize a compiled level.
+
+        Args:
+            level (CompiledLevel): The level to serialize.
+
+        Returns:
+            bytes: The compiled file contents.
+        """
+        payload = bytearray(level.grid.tobytes())
+        for size, layout in level.layouts.items():
+            payload += cls.LAYOUT.pack(*size, *layout)
+        rows, cols = level.grid.shape
+        header = cls.HEADER.pack(
+            cls.MAGIC, cls.VERSION, len(level.layouts), level.mtime_ns,
+            level.source_size, cls.TYPES_CHECKSUM, zlib.crc32(payload),
+            rows, cols)
+        return header + bytes(payload)
+
+    @classmethod
+    def decode(cls, data, source):
+        """Deserialize a compiled level, checking it is still valid.
+
+        Args:
+            data (bytes): The compiled file contents.
+            source (str): Path of the level file it was compiled from.
+
+        Returns:
+            CompiledLevel: The level, or None if the data is corrupt, from
+                another format version or older than the source file.
+        """
+        if len(data) < cls.HEADER.size:
+            return None
+        (magic, version, layout_count, mtime_ns, source_size, types_checksum,
+         checksum, rows, cols) = cls.HEADER.unpack_from(data)
+        if (magic != cls.MAGIC or version != cls.VERSION
+                or types_checksum != cls.TYPES_CHECKSUM):
+            return None
+
+        stat = os.stat(source)
+        if mtime_ns != stat.st_mtime_ns or source_size != stat.st_size:
+            return None
+
+        payload = memoryview(data)[cls.HEADER.size:]
+        if (len(payload) != rows * cols + layout_count * cls.LAYOUT.size
+                or zlib.crc32(payload) != checksum):
+            return None
+
+        grid = np.frombuffer(payload, dtype=np.int8, count=rows * cols)
+        layouts = {}
+        for width, height, *fields in cls.LAYOUT.iter_unpack(
+                payload[rows * cols:]):
+            layouts[(width, height)] = LevelLayout(*fields)
+        return CompiledLevel(source, mtime_ns, source_size,
+                             grid.reshape(rows, cols), layouts)
+
+    @classmethod
+    def save(cls, level):
+        """Write a compiled level to the cache directory.
+
+        The cache is optional: a read-only install just recompiles.
+
+        Args:
+            level (CompiledLevel): The level to write.
+        """
+        path = cls.cache_path(level.source)
+        try:
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            # Write then rename so a crash never leaves a partial file;
+            # the temporary name is per thread as levels are also
+            # compiled by the prefetch worker
+            temporary = f"{path}.{threading.get_ident()}.tmp"
+            with open(temporary, 'wb') as f:
+                f.write(cls.encode(level))
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"Warning: could not write level cache {path}: {e}")
+
+    @classmethod
+    def load(cls, source):
+        """Return the compiled form of a level file.
+
+        Uses the in-memory copy or the cache file while they match the
+        source, and recompiles (and rewrites the cache) otherwise.
+
+        Args:
+            source (str): Path of the level file.
+
+        Returns:
+            CompiledLevel: The compiled level.
+        """
+        level = cls.LEVELS.get(source)
+        if level is not None:
+            stat = os.stat(source)
+            if (level.mtime_ns == stat.st_mtime_ns
+                    and level.source_size == stat.st_size):
+                return level
+
+        tracer = Tracer.current()
+        level = None
+        try:
+            with tracer.span("read_compiled_level", "level",
+                             {"source": source}):
+                with open(cls.cache_path(source), 'rb') as f:
+                    level = cls.decode(f.read(), source)
+        except OSError:
+            pass
+        if level is None:
+            with tracer.span("compile_level", "level", {"source": source}):
+                level = cls.parse(source)
+                cls.save(level)
+        cls.LEVELS[source] = level
+        return level
+
+    @classmethod
+    def load_field(cls, source, screen_size):
+        """Create the BrickField of a level file for a screen size.
+
+        Args:
+            source (str): Path of the level file.
+            screen_size (tuple): (width, height) of the screen.
+
+        Returns:
+            BrickField: The level's bricks.
+        """
+        level = cls.load(source)
+        _, created = level.get_layout(screen_size)
+        if created:
+            # Keep the new layout for the next start at this resolution
+            cls.save(level)
+        return level.build_field(screen_size)
@@ -0,0 +1,111 @@
+"""LevelPrefetcher.py
+
+Created on 2025-11-01
+
+Loads the bricks of the next Brick Breaker level in the background.
+The Game starts a prefetch as soon as a level is cleared, while the
+victory screen is shown, so "Niveau suivant" can swap the prepared
+level in without reading or parsing its file on the spot.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import threading
+from .LevelCompiler import LevelCompiler
+
+
+class LevelPrefetcher:
+    """Builds one level's BrickField on a worker thread.
+
+    Only pure data is prepared off the main thread: the compiled level
+    and the brick arrays (file I/O and numpy). Surfaces, fonts and the
+    shared sprite and text caches are not thread-safe, so the brick
+    layer is drawn on the main thread by take(), and the scene itself
+    is created there too.
+
+    Attributes:
+        key (tuple): (level_number, screen_size) being prefetched, or
+            None.
+        result (dict): Filled by the worker with "field" (the prepared
+            BrickField) or "error" (the exception it raised). Each
+            prefetch gets its own dict, so a cancelled worker can never
+            hand its level to a later one.
+        hits (int): Levels swapped in from a prefetch.
+        misses (int): Levels that had to be loaded synchronously.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.result = None
+        self.thread = None
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, level_number, screen_size):
+        """Start preparing a level in the background.
+
+        Args:
+            level_number (int): Level to prefetch (1-based).
+            screen_size (tuple): Screen size the level is laid out for.
+        """
+        key = (level_number, tuple(screen_size))
+        if key == self.key:
+            return
+        self.key = key
+        self.result = {}
+        self.thread = threading.Thread(
+            target=self._run, args=(*key, self.result),
+            name="LevelPrefetch", daemon=True)
+        self.thread.start()
+
+    @staticmethod
+    def _run(level_number, screen_size, result):
+        """Worker: load the level's bricks (no pygame calls here)."""
+        try:
+            result["field"] = LevelCompiler.load_field(
+                LevelCompiler.level_path(level_number), screen_size)
+        except Exception as e:
+            result["error"] = e
+
+    def is_ready(self):
+        """Check whether the prefetched level is available."""
+        return self.result is not None and "field" in self.result
+
+    def take(self, level_number, screen_size):
+        """Hand over the prefetched bricks of a level.
+
+        A prefetch still running for the same level is waited for, since
+        it is already ahead of a synchronous load. The brick layer is
+        then drawn here, on the main thread. The prefetch is consumed
+        either way.
+
+        Args:
+            level_number (int): Level about to start.
+            screen_size (tuple): Current screen size.
+
+        Returns:
+            BrickField: The prepared bricks, or None when that level was
+                not prefetched (or failed), meaning the caller must load
+                it itself.
+        """
+        field = None
+        if self.key == (level_number, tuple(screen_size)):
+            self.thread.join()
+            field = self.result.get("field")
+            if "error" in self.result:
+                print(f"Warning: could not prefetch level {level_number}: "
+                      f"{self.result['error']}")
+        self.cancel()
+        if field is None:
+            self.misses += 1
+        else:
+            field.build_layer()
+            self.hits += 1
+        return field
+
+    def cancel(self):
+        """Forget the current prefetch (a running worker is left to end)."""
+        self.key = None
+        self.result = None
+        self.thread = None
@@ -12,6 +12,9 @@ __version__ = "1.0"
 import pygame
 from .Scene import Scene
 from .MenuButton import MenuButton
+from .GameClock import GameClock
+from .InputState import InputState
+from .TextCache import TextCache
 
 
 class Menu(Scene):
@@ -22,7 +25,7 @@ class Menu(Scene):
         self.title_font = None
         # Keyboard navigation
         self.selected_index = 0
-        self.last_key_time = pygame.time.get_ticks()
+        self.last_key_time = GameClock.current().get_ticks()
         self.key_delay = 150  # ms between nav events
         self.using_keyboard = False  # Track if keyboard was last input
 
@@ -33,14 +36,13 @@ class Menu(Scene):
             button.set_selected(False)
 
     def get_menu_buttons(self):
-        # Return the list of MenuButton instances in renderable_objects
-        return [
-            obj for obj in self.renderable_objects if isinstance(
-                obj, MenuButton)]
+        # Return the MenuButton instances of the scene (indexed by type)
+        return self.find(MenuButton)
 
     def update(self):
         # Handle keyboard navigation and selection
-        now = pygame.time.get_ticks()
+        now = GameClock.current().get_ticks()
+        keys = InputState.current()
         buttons = self.get_menu_buttons()
 
         if not buttons:
@@ -51,7 +53,7 @@ class Menu(Scene):
             0, min(self.selected_index, len(buttons) - 1))
 
         # Check if mouse moved
-        rel = pygame.mouse.get_rel()
+        rel = keys.mouse_rel
         if abs(rel[0]) > 0 or abs(rel[1]) > 0:
             # Mouse movement detected, switch to mouse mode
             if self.using_keyboard:
@@ -59,7 +61,6 @@ class Menu(Scene):
                 buttons[self.selected_index].set_selected(False)
 
         # Handle keyboard input
-        keys = pygame.key.get_pressed()
         if now - self.last_key_time > self.key_delay:
             if keys[pygame.K_UP] or keys[pygame.K_w]:
                 # Switch to keyboard mode and move up
@@ -92,26 +93,18 @@ class Menu(Scene):
         """Render title and layout buttons vertically centered"""
         sw, sh = screen.get_width(), screen.get_height()
 
+        text_cache = TextCache()
         if not self.title_font:
-            try:
-                self.title_font = pygame.font.Font(
-                    "assets/fonts/Vanilla Pancake.ttf", 80)
-            except Exception:
-                self.title_font = pygame.font.Font(None, 80)
-
-        title_surface = self.title_font.render(
-            self.title, True, (255, 255, 255))
+            self.title_font = text_cache.get_font(TextCache.MENU_FONT, 80)
+
+        title_surface = text_cache.render(
+            self.title_font, self.title, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(sw // 2, 100))
         screen.blit(title_surface, title_rect)
         title_height = 150  # Reserve space for title
 
         # Layout buttons vertically centered (below title)
-        buttons = list(
-            filter(
-                lambda obj: isinstance(
-                    obj,
-                    MenuButton),
-                self.renderable_objects))
+        buttons = self.get_menu_buttons()
         if not buttons:
             return super().render(screen)
 
@@ -10,11 +10,18 @@ __version__ = "1.0"
 
 
 from .GameObject import GameObject
+from .GameClock import GameClock
+from .InputState import InputState
+from .TextCache import TextCache
+from .AssetManager import AssetManager
 import pygame
 import random
 
 
 class MenuButton(GameObject):
+    # Scale animation is drawn in steps of this size (1.00, 1.01 ... 1.06)
+    SCALE_STEP = 0.01
+
     def __init__(self, return_state=None, text=""):
         super().__init__()
         # State to return when the button is clicked
@@ -23,12 +30,12 @@ class MenuButton(GameObject):
 
         # Click delay for sensitive actions (like EXIT)
         self.click_delay = 500 if return_state == "EXIT" else 150  # 500ms delay for exit
-        self.last_click_time = pygame.time.get_ticks()
+        self.last_click_time = GameClock.current().get_ticks()
 
         # Load a random background image (safe fallback)
         try:
-            self.background = pygame.image.load(
-                f"assets/images/Button_0{random.randint(1, 3)}.png").convert_alpha()
+            self.background = AssetManager().load_image(
+                f"assets/images/Button_0{random.randint(1, 3)}.png")
         except Exception as e:
             # If image can't be loaded, create a placeholder surface
             print(f"Warning: could not load button image: {e}")
@@ -40,12 +47,8 @@ class MenuButton(GameObject):
 
         # Load font from assets (Vanilla Pancake). Size based on button height.
         font_size = max(12, int(self.rect.height * 0.5))
-        try:
-            self.font = pygame.font.Font(
-                "assets/fonts/Vanilla Pancake.ttf", font_size)
-        except Exception:
-            # Fallback to default font if custom font can't be loaded
-            self.font = pygame.font.Font(None, font_size)
+        # (falls back to the default font if it can't be loaded)
+        self.font = TextCache().get_font(TextCache.MENU_FONT, font_size)
 
         # Click handling
         self.was_pressed = False  # Debounce previous mouse state
@@ -57,10 +60,15 @@ class MenuButton(GameObject):
         self.scale = 1.0
         self.target_scale = 1.0
         self.scale_speed = 0.18
+        # Composited button images keyed by (highlighted, scale step),
+        # rebuilt when the label changes
+        self.frames = {}
 
     def set_label(self, text):
         """Set the button label text."""
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self.frames.clear()
         return
 
     def update(self):
@@ -71,9 +79,10 @@ class MenuButton(GameObject):
         except Exception:
             pass
 
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        current_time = pygame.time.get_ticks()
+        mouse = InputState.current()
+        mouse_pos = mouse.mouse_pos
+        mouse_pressed = mouse.mouse_buttons[0]
+        current_time = GameClock.current().get_ticks()
 
         clicked = False
         # Update hover state
@@ -102,53 +111,78 @@ class MenuButton(GameObject):
             return self.return_state
         return None
 
-    def render(self, screen):
-        # Draw scaled button (scale around center)
-        try:
-            sw = max(1, int(self.rect.width * self.scale))
-            sh = max(1, int(self.rect.height * self.scale))
+    def get_frame(self):
+        """Return the button image for the current state and scale.
+
+        The scaled background, label shadow and label are composited once
+        per (highlighted, quantized scale) pair and reused afterwards.
+
+        Returns:
+            tuple: (surface, offset) where offset is the image's top-left
+                relative to the button rect's top-left.
+        """
+        highlighted = self.is_selected or self.is_hovered
+        step = round((self.scale - 1.0) / self.SCALE_STEP)
+        key = (highlighted, step)
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = self.build_frame(highlighted, 1.0 + step * self.SCALE_STEP)
+            self.frames[key] = frame
+        return frame
+
+    def build_frame(self, highlighted, scale):
+        """Composite the background, shadow and label into one image.
+
+        Args:
+            highlighted (bool): Hovered or selected (blue label).
+            scale (float): Background scale factor.
+
+        Returns:
+            tuple: (surface, offset) as returned by get_frame().
+        """
+        width, height = self.rect.size
+        center = (width // 2, height // 2)
+        sw = max(1, int(width * scale))
+        sh = max(1, int(height * scale))
+        if (sw, sh) == (width, height):
+            scaled = self.background
+        else:
             scaled = pygame.transform.smoothscale(self.background, (sw, sh))
-            blit_x = self.rect.centerx - sw // 2
-            blit_y = self.rect.centery - sh // 2
-            screen.blit(scaled, (blit_x, blit_y))
+        layers = [(scaled, scaled.get_rect(
+            topleft=(center[0] - sw // 2, center[1] - sh // 2)))]
+
+        if getattr(self, 'text', None):
+            text_cache = TextCache()
+            # Choose text color based on state (lighter blue for hover)
+            text_color = (0, 100, 200) if highlighted else (0, 0, 0)
+            text_surface = text_cache.render(self.font, self.text, text_color)
+            text_rect = text_surface.get_rect(center=center)
+            # shadow (slightly darker version of text color)
+            shadow_color = tuple(max(0, c - 50) for c in text_color)
+            shadow_surf = text_cache.render(self.font, self.text, shadow_color)
+            layers.append((shadow_surf, text_rect.move(2, 2)))
+            layers.append((text_surface, text_rect))
+
+        bounds = layers[0][1].unionall([rect for _, rect in layers[1:]])
+        image = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for surface, rect in layers:
+            image.blit(surface, rect.move(-bounds.x, -bounds.y))
+        if pygame.display.get_surface():
+            # Match the display's pixel format for faster blits
+            image = image.convert_alpha()
+        return image, bounds.topleft
 
-            # Draw text centered on scaled rect
-            if getattr(self, 'text', None):
-                try:
-                    # Choose text color based on state
-                    if self.is_selected or self.is_hovered:
-                        text_color = (0, 100, 200)  # Lighter blue for hover
-                    else:
-                        text_color = (0, 0, 0)  # Black for normal state
-
-                    text_surface = self.font.render(
-                        self.text, True, text_color)
-                except Exception:
-                    fallback_font = pygame.font.Font(
-                        None, max(12, int(self.rect.height * 0.5)))
-                    text_surface = fallback_font.render(
-                        self.text, True, (255, 255, 255))
-
-                text_rect = text_surface.get_rect(
-                    center=(self.rect.centerx, self.rect.centery))
-                # shadow (slightly darker version of text color)
-                try:
-                    shadow_color = tuple(max(0, c - 50) for c in text_color)
-                    shadow_surf = self.font.render(
-                        self.text, True, shadow_color)
-                    shadow_rect = text_rect.copy()
-                    shadow_rect.x += 2
-                    shadow_rect.y += 2
-                    screen.blit(shadow_surf, shadow_rect)
-                except Exception:
-                    pass
-                screen.blit(text_surface, text_rect)
+    def render(self, screen):
+        # Draw the prebuilt image for the current state and scale
+        try:
+            image, (dx, dy) = self.get_frame()
+            screen.blit(image, (self.rect.x + dx, self.rect.y + dy))
         except Exception:
-            # Fallback to original draw if scaling fails
+            # Fallback to original draw if compositing fails
             screen.blit(self.background, self.rect)
             if getattr(self, 'text', None):
-                text_surface = self.font.render(
-                    self.text, True, (255, 255, 255))
+                text_surface = TextCache().render(
+                    self.font, self.text, (255, 255, 255))
                 text_rect = text_surface.get_rect(center=self.rect.center)
                 screen.blit(text_surface, text_rect)
 
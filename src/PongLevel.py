@@ -10,17 +10,21 @@ __version__ = "1.0"
 
 
 import pygame
-from .Scene import Scene
+from .Level import Level
 from .Raquette import Raquette
 from .Ball import Ball
 from .ScoreDisplay import ScoreDisplay
 from .MenuButton import MenuButton
+from .GameClock import GameClock
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .TextCache import TextCache
+from .FrameProfiler import FrameProfiler
 
 
-class PongLevel(Scene):
+class PongLevel(Level):
     def __init__(self, players=2, difficulty="MEDIUM"):
         super().__init__()
-        self.paused = False
         self.num_players = players
 
         # Pause cooldown to prevent rapid toggling
@@ -30,19 +34,21 @@ class PongLevel(Scene):
         # Create pause menu button
         self.menu_button = MenuButton("MAIN_MENU", "Menu principal")
         # Position button in center
-        screen = pygame.display.get_surface()
-        sw, sh = screen.get_size()
+        frame = FrameContext.current()
+        sw, sh = frame.size
         btn_x = (sw - self.menu_button.rect.width) // 2
         btn_y = (sh + 100) // 2  # Below pause text
         self.menu_button.setPosition((btn_x, btn_y))
         self.menu_button.rect.topleft = (btn_x, btn_y)
 
         # Create paddles and position them
-        screen_width = pygame.display.get_surface().get_width()
-        screen_height = pygame.display.get_surface().get_height()
+        screen_width, screen_height = frame.size
 
-        # Left paddle - always player 1
-        self.p1 = Raquette("PONG_P1")
+        # Left paddle - player 1, or AI when nobody plays (AI vs AI)
+        if players == 0:
+            self.p1 = Raquette("PONG_IA_LEFT", difficulty.upper())
+        else:
+            self.p1 = Raquette("PONG_P1")
 
         # Right paddle - player 2 or AI depending on player count
         if players == 2:
@@ -54,7 +60,12 @@ class PongLevel(Scene):
         self.ball = Ball()
         self.ball.reset()  # This will position the ball in the center
 
+        # Ball is swept against both paddles while it moves
+        self.ball.set_paddles([self.p1, self.p2])
+
         # Set ball reference for AI paddles
+        if self.p1.is_ai:
+            self.p1.set_ball(self.ball)
         if self.p2.is_ai:
             self.p2.set_ball(self.ball)
 
@@ -67,7 +78,7 @@ class PongLevel(Scene):
         self.score_display = ScoreDisplay(
             lambda: self.p1_score,  # Pass lambdas to get current score values
             lambda: self.p2_score,
-            isIA=(players == 1)
+            isIA=(players < 2)
         )
 
         # Add all objects to scene (order matters for rendering)
@@ -78,25 +89,30 @@ class PongLevel(Scene):
 
     def update(self):
         # Handle pause state with cooldown
-        now = pygame.time.get_ticks()
-        if pygame.key.get_pressed()[
+        now = GameClock.current().get_ticks()
+        if InputState.current()[
                 pygame.K_ESCAPE] and now - self.last_pause_time >= self.pause_cooldown:
             self.paused = not self.paused
             self.last_pause_time = now
 
         if self.paused:
+            # Nothing moves: draw every object where it stopped
+            self.save_state()
             # Update menu button
             result = self.menu_button.update()
             if result == "MAIN_MENU":
                 return "MAIN_MENU"
             return None
 
-        # Handle ball collisions with paddles BEFORE updating positions
-        # This prevents the ball from moving through paddles
+        # Handle paddles that moved into the ball BEFORE updating positions
+        # (the ball's swept movement handles the ball moving into them)
+        profiler = FrameProfiler.current()
+        start = profiler.start()
         if self.ball.rect.colliderect(self.p1.rect):
             self.ball.bounce_paddle(self.p1)
         elif self.ball.rect.colliderect(self.p2.rect):
             self.ball.bounce_paddle(self.p2)
+        profiler.stop("collision", start)
 
         # Update all objects (ball movement, paddle movement, etc.)
         super().update()
@@ -125,6 +141,12 @@ class PongLevel(Scene):
 
         return None
 
+    def get_object_counts(self):
+        """Object counts, with the ball."""
+        counts = super().get_object_counts()
+        counts["balls"] = 1
+        return counts
+
     def render(self, screen):
         # Always render game objects first
         super().render(screen)
@@ -138,8 +160,9 @@ class PongLevel(Scene):
             screen.blit(overlay, (0, 0))
 
             # Pause text
-            font = pygame.font.Font(None, 74)
-            pause_text = font.render("PAUSED", True, (255, 255, 255))
+            text_cache = TextCache()
+            pause_text = text_cache.render(text_cache.get_font(None, 74),
+                                           "PAUSED", (255, 255, 255))
             pause_rect = pause_text.get_rect(
                 center=(
                     screen.get_width() // 2,
@@ -11,6 +11,10 @@ __version__ = "1.0"
 
 import pygame
 from .GameObject import GameObject
+from .GameClock import GameClock
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .AssetManager import AssetManager
 
 
 class Raquette(GameObject):
@@ -46,7 +50,7 @@ class Raquette(GameObject):
                 self.keys = [pygame.K_UP, pygame.K_DOWN]
             case "PONG_P1":
                 self.keys = [pygame.K_w, pygame.K_s]
-            case "PONG_IA":
+            case "PONG_IA" | "PONG_IA_LEFT":
                 self.keys = []
                 self.is_ai = True
                 if difficulty == "EASY":
@@ -64,9 +68,9 @@ class Raquette(GameObject):
             case _:
                 self.keys = []
 
+        assets = AssetManager()
         try:
-            self.original = pygame.image.load(
-                r"assets/images/Raquette.png").convert_alpha()
+            self.original = assets.load_image(r"assets/images/Raquette.png")
         except Exception as e:
 
             # If image can't be loaded, create a placeholder surface
@@ -84,22 +88,27 @@ class Raquette(GameObject):
         else:
             self.rotation = 0
 
-        w = max(1, int(self.original.get_width() * self.scale))
-        h = max(1, int(self.original.get_height() * self.scale))
-        scaled = pygame.transform.smoothscale(self.original, (w, h))
-        self.background = pygame.transform.rotate(scaled, self.rotation)
+        try:
+            # Shared with every other raquette of the same orientation
+            self.background = assets.get_image(
+                r"assets/images/Raquette.png", self.scale, self.rotation)
+        except Exception:
+            w = max(1, int(self.original.get_width() * self.scale))
+            h = max(1, int(self.original.get_height() * self.scale))
+            scaled = pygame.transform.smoothscale(self.original, (w, h))
+            self.background = pygame.transform.rotate(scaled, self.rotation)
 
         self.rect = self.background.get_rect()
         # Try to place the raquette depending on game mode and input type
         self._pending_place = False
-        screen = pygame.display.get_surface()
-        if screen:
-            sw, sh = screen.get_size()
+        frame = FrameContext.current()
+        if frame.surface:
+            sw, sh = frame.size
             margin = 20
 
             if self.game_mode == "PONG":
                 # Pong mode: vertical positioning, left or right side
-                if self.input_type == "PONG_P1":
+                if self.input_type in ("PONG_P1", "PONG_IA_LEFT"):
                     x = margin  # P1 on left side
                 else:
                     x = sw - self.rect.width - margin  # P2/IA on right side
@@ -120,8 +129,6 @@ class Raquette(GameObject):
             self.speed = self.ai_params["speed"]
         else:
             self.speed = 500
-        # Time tracking for delta-time
-        self._last_time = pygame.time.get_ticks()
         # Track paddle velocity for ball bounce calculations
         self.velocity_y = 0  # Current vertical velocity (for pong)
         self.velocity_x = 0  # Current horizontal velocity (for brick breaker)
@@ -145,11 +152,11 @@ class Raquette(GameObject):
         error_margin = self.ai_params["error_margin"]
 
         # Only react if ball is in our reaction zone
-        screen = pygame.display.get_surface()
-        if not screen:
+        frame = FrameContext.current()
+        if not frame.surface:
             return
 
-        sw, sh = screen.get_size()
+        sw, sh = frame.size
         ball_x = self.ball_ref.rect.centerx
 
         # Determine which side we're on and if ball is coming towards us
@@ -216,21 +223,18 @@ class Raquette(GameObject):
             dt: Delta time in seconds
         """
 
-        try:
-            keys = pygame.key.get_pressed()
-        except Exception:
-            keys = None
+        keys = InputState.current()
 
         # If placement was pending (no surface at init), place now
         if getattr(self, '_pending_place', False):
             try:
-                screen = pygame.display.get_surface()
-                if screen:
-                    sw, sh = screen.get_size()
+                frame = FrameContext.current()
+                if frame.surface:
+                    sw, sh = frame.size
                     margin = 20
 
                     if self.game_mode == "PONG":
-                        if self.input_type == "PONG_P1":
+                        if self.input_type in ("PONG_P1", "PONG_IA_LEFT"):
                             x = margin  # P1 on left side
                         else:
                             x = sw - self.rect.width - margin  # P2/IA on right side
@@ -272,9 +276,9 @@ class Raquette(GameObject):
 
         # Clamp to screen bounds if a display surface exists
         try:
-            screen = pygame.display.get_surface()
-            if screen:
-                sw, sh = screen.get_size()
+            frame = FrameContext.current()
+            if frame.surface:
+                sw, sh = frame.size
                 if self.movement_axis == "vertical":
                     # Ensure the raquette stays within vertical bounds
                     y = max(0, min(y, sh - self.rect.height))
@@ -298,13 +302,8 @@ class Raquette(GameObject):
         return
 
     def update(self):
-        # Compute delta time (in seconds)
-        now = pygame.time.get_ticks()
-        dt = (now - getattr(self, '_last_time', now)) / 1000.0
-        # Clamp unreasonable dt values
-        if dt > 0.5:
-            dt = 0.5
-        self._last_time = now
+        # Fixed simulation timestep (in seconds)
+        dt = GameClock.current().dt
 
         if self.is_ai:
             self.ai_update_position(dt)
@@ -312,10 +311,17 @@ class Raquette(GameObject):
             self.updatePosition(dt)
         return None
 
+    def get_draw_rects(self):
+        """Area covered by the raquette at its interpolated position."""
+        x, y = self.get_render_position()
+        w, h = self.background.get_size()
+        # One extra pixel covers the rounding of the fractional position
+        return [pygame.Rect(int(x), int(y), w + 1, h + 1)]
+
     def render(self, screen):
-        # Draw the transformed raquette at its position (top-left)
+        # Draw the transformed raquette at its interpolated position
         try:
-            screen.blit(self.background, self.position)
+            screen.blit(self.background, self.get_render_position())
         except Exception:
             # If position is not set or blit fails, fall back to (0,0)
             screen.blit(self.background, (0, 0))
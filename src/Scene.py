@@ -11,12 +11,18 @@ __version__ = "1.0"
 
 
 from .GameObject import GameObject
+from .EntityStore import EntityStore
+from .MenuButton import MenuButton
 
 
 class Scene:
+    # Past these, a dirty-rect frame costs more than a full redraw
+    MAX_DIRTY_RECTS = 32
+    MAX_DIRTY_AREA = 0.5  # fraction of the visible area
+
     def __init__(self):
-        """Initialize the scene with an empty list of renderable objects."""
-        self.renderable_objects = []
+        """Initialize the scene with an empty store of renderable objects."""
+        self.entities = EntityStore()
         self.returnable_states = ["EXIT",
                                   "SETTINGS",
                                   "MAIN_MENU",
@@ -25,8 +31,15 @@ class Scene:
                                   "PLAY_BRICK_GAME",
                                   "START_PONG",
                                   "NEXT_LEVEL"]
+        # Areas each object covered in the last frame (dirty-rect mode)
+        self.drawn_rects = {}
         pass
 
+    @property
+    def renderable_objects(self):
+        """Objects of the scene in the order they were added."""
+        return self.entities.ordered()
+
     def render(self, screen):
         """Render all objects in the scene."""
         for object in self.renderable_objects:
@@ -35,32 +48,186 @@ class Scene:
                 object.render(screen)
         pass
 
+    def get_render_key(self):
+        """State whose change requires a full-screen redraw.
+
+        Scenes with overlays (e.g. a pause screen) return the state that
+        toggles them.
+        """
+        return None
+
+    def get_dirty_rects(self):
+        """Collect the screen areas that changed since the last frame.
+
+        An object's previous and current areas are dirty when it moved,
+        appeared or disappeared, along with any area it reports as
+        changed in place.
+
+        Returns:
+            list or None: Dirty pygame.Rect areas, or None when an object
+                cannot report its areas and the whole screen must be
+                redrawn.
+        """
+        dirty = []
+        known = True
+        previous = self.drawn_rects
+        current = {}
+        for object in self.renderable_objects:
+            rects = object.get_draw_rects()
+            if rects is None:
+                known = False
+                continue
+            key = id(object)
+            current[key] = rects
+            old = previous.get(key)
+            if old != rects:
+                dirty.extend(rects)
+                if old:
+                    dirty.extend(old)
+            dirty.extend(object.get_changed_rects())
+        # Objects removed since the last frame leave their area behind
+        for key, old in previous.items():
+            if key not in current:
+                dirty.extend(old)
+        self.drawn_rects = current
+        return dirty if known else None
+
+    def render_dirty(self, screen, bounds, background="BLACK", extra=()):
+        """Redraw only the areas that changed since the last frame.
+
+        Each dirty area is cleared and redrawn with the area as clip by
+        render_area(), so overlapping objects are restored too. Many or
+        large dirty areas fall back to a full redraw (see
+        MAX_DIRTY_RECTS and MAX_DIRTY_AREA).
+
+        Args:
+            screen (pygame.Surface): The surface to render to.
+            bounds (pygame.Rect): The visible area of the screen.
+            background: Color used to clear the dirty areas.
+            extra (iterable): Additional areas to redraw (e.g. overlays
+                drawn by the Game on top of the scene).
+
+        Returns:
+            list or None: The redrawn areas, to pass to
+                pygame.display.update(), or None if the scene needs a
+                full redraw instead.
+        """
+        dirty = self.get_dirty_rects()
+        if dirty is None:
+            return None
+        dirty.extend(extra)
+        # Merging is quadratic in the number of areas: bail out early
+        if len(dirty) > 4 * self.MAX_DIRTY_RECTS:
+            return None
+        rects = []
+        for rect in dirty:
+            rect = rect.clip(bounds)
+            if not rect.width or not rect.height:
+                continue
+            # Merge with any area it overlaps to avoid drawing twice
+            hits = rect.collidelistall(rects)
+            for index in reversed(hits):
+                rect.union_ip(rects.pop(index))
+            rects.append(rect)
+        if len(rects) > self.MAX_DIRTY_RECTS:
+            return None
+        area = sum(rect.width * rect.height for rect in rects)
+        if area > self.MAX_DIRTY_AREA * bounds.width * bounds.height:
+            return None
+
+        drawn = [(object, self.drawn_rects[id(object)])
+                 for object in self.renderable_objects
+                 if self.drawn_rects.get(id(object))]
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.fill(background)
+            self.render_area(screen, rect, [
+                object for object, object_rects in drawn
+                if rect.collidelist(object_rects) != -1])
+        screen.set_clip(None)
+        return rects
+
+    def render_area(self, screen, rect, objects):
+        """Redraw one dirty area, the screen being clipped to it.
+
+        The whole scene is rendered under the clip, which suits scenes
+        that draw more than their objects (titles, backgrounds). Scenes
+        that only draw their objects override it to draw just those
+        meeting the area.
+
+        Args:
+            screen (pygame.Surface): The surface to render to.
+            rect (pygame.Rect): The dirty area.
+            objects (list): Objects whose drawn areas meet rect, in
+                render order.
+        """
+        self.render(screen)
+
     def update(self):
         """Update all objects in the scene.
         If any object returns a state change, propagate it up.
+        Objects that died or were removed during the tick leave the scene
+        once every object has been updated.
         """
+        result = None
+        # renderable_objects is a snapshot: removals can't skip objects
         for object in self.renderable_objects:
             if object.is_dead:
                 # Remove dead objects (Usefull for bricks that are destroyed)
                 self.remove_object(object)
             else:
+                object.save_state()
                 return_state = object.update()
                 if return_state in self.returnable_states:
-                    return return_state
-        return None
+                    result = return_state
+                    break
+        self.entities.flush()
+        return result
+
+    def save_state(self):
+        """Snap every object to its current position.
+
+        Rendering stops interpolating between the last two ticks, e.g.
+        while the scene is paused and its objects are not updated.
+        """
+        for object in self.renderable_objects:
+            object.save_state()
+
+    def add_object(self, object, tags=()):
+        """Add object to scene if it is a GameObject.
 
-    def add_object(self, object):
-        """Add object to scene if it is a GameObject."""
+        Args:
+            object (GameObject): The object to add.
+            tags (iterable): Tags to find it with find_tagged().
+
+        Returns:
+            Handle: The object's handle in the scene (None if not added).
+        """
         if isinstance(object, GameObject):
-            self.renderable_objects.append(object)
-        return
+            return self.entities.add(object, tags)
+        return None
 
     def remove_object(self, object):
-        """Remove object from scene and delete it to free memory."""
-        if object in self.renderable_objects:
-            self.renderable_objects.remove(object)
-            del object
-        pass
+        """Remove object from scene at the end of the current tick."""
+        self.entities.destroy(object)
+
+    def find(self, cls):
+        """Objects of the scene that are instances of cls."""
+        return self.entities.query(cls)
+
+    def find_tagged(self, tag):
+        """Objects of the scene added with a tag."""
+        return self.entities.query_tag(tag)
+
+    def get_object_counts(self):
+        """Object counts shown by the profiler HUD.
+
+        Returns:
+            dict: Number of objects and buttons; levels add their balls
+                and bricks.
+        """
+        return {"objects": len(self.entities),
+                "buttons": len(self.find(MenuButton))}
 
     def handle_event(self, event):
         """Handle incoming events by forwarding them to child objects."""
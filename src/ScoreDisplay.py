@@ -7,8 +7,9 @@ Displays the score at the top center of the screen as a GameObject.
 __author__ = "carras_a"
 __version__ = "1.0"
 
-import pygame
 from .GameObject import GameObject
+from .FrameContext import FrameContext
+from .TextCache import TextCache
 
 
 class ScoreDisplay(GameObject):
@@ -25,23 +26,49 @@ class ScoreDisplay(GameObject):
         self.p2_name = isIA and "IA" or "Player 2"
         self.p1_score_ref = p1_score_ref
         self.p2_score_ref = p2_score_ref
-        self.font = pygame.font.Font(None, 48)
+        self.font = TextCache().get_font(None, 48)
+        # Score text is only rendered again when it changes
+        self.text = None
+        self.surface = None
+        self.reported_text = None
 
     def update(self):
         """No update logic needed for score display."""
         return None
 
+    def get_score_surface(self):
+        """Return the rendered score text, rendering it if it changed."""
+        # Get current scores (using callable if they're functions/lambdas)
+        p1_score = self.p1_score_ref() if callable(
+            self.p1_score_ref) else self.p1_score_ref
+        p2_score = self.p2_score_ref() if callable(
+            self.p2_score_ref) else self.p2_score_ref
+
+        score_text = f"{self.p1_name} - {p1_score}  |   {p2_score} - {self.p2_name}"
+        if score_text != self.text:
+            self.text = score_text
+            self.surface = TextCache().render(
+                self.font, score_text, (255, 255, 255))
+        return self.surface
+
+    def get_draw_rects(self):
+        """Area covered by the score text."""
+        return [self.get_score_surface().get_rect(
+            midtop=(FrameContext.current().width // 2, 10))]
+
+    def get_changed_rects(self):
+        """The score area, when the text changed since the last frame."""
+        surface = self.get_score_surface()
+        if self.text == self.reported_text:
+            return []
+        self.reported_text = self.text
+        return [surface.get_rect(
+            midtop=(FrameContext.current().width // 2, 10))]
+
     def render(self, screen):
         """Render the combined score at top-center."""
         if screen:
-            # Get current scores (using callable if they're functions/lambdas)
-            p1_score = self.p1_score_ref() if callable(
-                self.p1_score_ref) else self.p1_score_ref
-            p2_score = self.p2_score_ref() if callable(
-                self.p2_score_ref) else self.p2_score_ref
-
-            score_text = f"{self.p1_name} - {p1_score}  |   {p2_score} - {self.p2_name}"
-            score_surf = self.font.render(score_text, True, (255, 255, 255))
+            score_surf = self.get_score_surface()
             score_rect = score_surf.get_rect(
                 midtop=(screen.get_width() // 2, 10))
             screen.blit(score_surf, score_rect)
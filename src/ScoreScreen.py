@@ -11,6 +11,7 @@ __version__ = "1.0"
 import pygame
 from .Scene import Scene
 from .MenuButton import MenuButton
+from .TextCache import TextCache
 
 
 class ScoreScreen(Scene):
@@ -40,16 +41,11 @@ class ScoreScreen(Scene):
             self.screen_width = 800
             self.screen_height = 600
 
-        # Load fonts
-        try:
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 60)
-            self.info_font = pygame.font.Font(None, 36)
-        except Exception:
-            # Fallback to default font
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 60)
-            self.info_font = pygame.font.Font(None, 36)
+        # Load fonts (shared with the rest of the game)
+        text_cache = TextCache()
+        self.title_font = text_cache.get_font(None, 100)
+        self.score_font = text_cache.get_font(None, 60)
+        self.info_font = text_cache.get_font(None, 36)
 
         # Create buttons using MenuButton properly
         self.play_again_button = MenuButton("PLAY_PONG", "Rejouer")
@@ -61,25 +57,26 @@ class ScoreScreen(Scene):
 
     def render(self, screen):
         """Render the score screen."""
+        text_cache = TextCache()
         # Fill background with dark color
         screen.fill((20, 20, 40))
 
         # Render winner text
         winner_text = f"PLAYER {self.winner[1]} WINS!"  # Extract number from "PONG_P1" or "PONG_P2"
         winner_color = (255, 215, 0) if self.winner == "PONG_P1" else (255, 100, 100)
-        winner_surface = self.title_font.render(winner_text, True, winner_color)
+        winner_surface = text_cache.render(self.title_font, winner_text, winner_color)
         winner_rect = winner_surface.get_rect(center=(self.screen_width // 2, 150))
         screen.blit(winner_surface, winner_rect)
 
         # Render final scores
         score_text = f"{self.p1_score}  -  {self.p2_score}"
-        score_surface = self.score_font.render(score_text, True, (255, 255, 255))
+        score_surface = text_cache.render(self.score_font, score_text, (255, 255, 255))
         score_rect = score_surface.get_rect(center=(self.screen_width // 2, 250))
         screen.blit(score_surface, score_rect)
 
         # Render player labels
-        p1_label = self.info_font.render("Player 1", True, (200, 200, 200))
-        p2_label = self.info_font.render("Player 2", True, (200, 200, 200))
+        p1_label = text_cache.render(self.info_font, "Player 1", (200, 200, 200))
+        p2_label = text_cache.render(self.info_font, "Player 2", (200, 200, 200))
 
         p1_rect = p1_label.get_rect(center=(self.screen_width // 2 - 100, 300))
         p2_rect = p2_label.get_rect(center=(self.screen_width // 2 + 100, 300))
@@ -4,6 +4,7 @@ Created on 2025-10-17
 
 Settings menu with editable options:
 - FPS Limit
+- Physics tick rate
 - Sound ON/OFF
 - Difficulty
 
@@ -23,6 +24,9 @@ class SettingsMenu(Menu):
         # Internal settings state
         self.fps_options = [30, 60, 120, 240]
         self.fps_index = self.fps_options.index(settings[0]) if settings else 1
+        self.tick_options = [30, 60, 120, 240]
+        self.tick_index = self.tick_options.index(
+            settings[2]) if settings and len(settings) > 2 else 2
         self.sound_on = settings[1] if settings else True
         self.difficulties = ["Easy", "Normal", "Hard"]
         self.diff_index = 1
@@ -30,6 +34,8 @@ class SettingsMenu(Menu):
         # Buttons
         self.fps_button = MenuButton(
             "FPS", f"FPS: {self.fps_options[self.fps_index]}")
+        self.tick_button = MenuButton(
+            "TICK", f"Physics: {self.tick_options[self.tick_index]} Hz")
         self.sound_button = MenuButton(
             "SOUND", f"Sound: {
                 'ON' if self.sound_on else 'OFF'}")
@@ -37,6 +43,7 @@ class SettingsMenu(Menu):
 
         # Add to scene in order
         self.add_object(self.fps_button)
+        self.add_object(self.tick_button)
         self.add_object(self.sound_button)
         self.add_object(self.back_button)
 
@@ -44,6 +51,8 @@ class SettingsMenu(Menu):
         """Update button labels and handle cycling on click."""
         # Update button labels
         self.fps_button.set_label(f"FPS: {self.fps_options[self.fps_index]}")
+        self.tick_button.set_label(
+            f"Physics: {self.tick_options[self.tick_index]} Hz")
         self.sound_button.set_label(
             f"Sound: {'ON' if self.sound_on else 'OFF'}")
 
@@ -55,6 +64,9 @@ class SettingsMenu(Menu):
         if self.fps_button.update() == "FPS":
             # Cycle to next FPS option
             self.fps_index = (self.fps_index + 1) % len(self.fps_options)
+        # Check physics tick rate button click
+        elif self.tick_button.update() == "TICK":
+            self.tick_index = (self.tick_index + 1) % len(self.tick_options)
         # Check Sound button click
         elif self.sound_button.update() == "SOUND":
             # Toggle sound
@@ -63,7 +75,8 @@ class SettingsMenu(Menu):
         else:
             # Check back button (and any other objects)
             for obj in self.renderable_objects:
-                if obj != self.fps_button and obj != self.sound_button:
+                if obj not in (self.fps_button, self.tick_button,
+                               self.sound_button):
                     obj_result = obj.update()
                     if obj_result:
                         result = obj_result
@@ -3,16 +3,61 @@
 Created on 2025-10-17
 
 Manages sound effects and music for the game.
-
+Sound requests are coalesced per frame and played by a small voice
+manager: each sound has a cap on how many copies play at once, important
+cues play on reserved mixer channels, and the volume of every play is
+set on its channel rather than on the shared Sound.
+The mixer is opened with a small buffer for low latency, and the sound
+files are decoded on a background thread at startup.
 """
 __author__ = "carras_a"
 __version__ = "1.0"
 
 import os
+import threading
 import pygame
+from .Tracer import Tracer
 
 
 class SoundManager:
+    """Singleton loading the sound effects and managing their voices.
+
+    play() only queues a request; flush(), called once per frame,
+    plays every queued sound once, at the combined volume of the
+    requests made for it during the frame. Sounds are decoded by a
+    loader thread, and requests for a sound not loaded yet are ignored.
+
+    Attributes:
+        sounds (dict): Loaded sounds keyed by name (file name without
+            extension).
+        pending (dict): Combined volume of each sound requested since
+            the last flush().
+        voices (dict): Channels playing each sound, by name.
+        played (int): Sounds started.
+        coalesced (int): Requests merged into another one of the same
+            frame.
+        dropped (int): Sounds not played because their voice cap was
+            reached or no channel was free.
+
+    Class Attributes:
+        MAX_VOICES (dict): Maximum copies of a sound playing at once.
+        DEFAULT_MAX_VOICES (int): Cap for sounds not in MAX_VOICES.
+        RESERVED (tuple): Sounds that get a reserved channel each, so
+            they are never starved by the other effects.
+        FREQUENCY (int): Mixer sample rate used by pre_init().
+        BUFFER (int): Mixer buffer size in samples used by pre_init();
+            smaller means lower latency but more risk of crackling.
+    """
+
+    MAX_VOICES = {
+        "wall_hit": 3,
+        "paddle_hit": 2,
+    }
+    DEFAULT_MAX_VOICES = 4
+    RESERVED = ("paddle_hit",)
+    FREQUENCY = 44100
+    BUFFER = 256
+
     _instance = None
     _initialized = False
 
@@ -24,11 +69,86 @@ class SoundManager:
     def __init__(self):
         if not SoundManager._initialized:
             self.sounds = {}
-            self._load_sounds()
+            self.pending = {}
+            self.voices = {}
+            self.played = 0
+            self.coalesced = 0
+            self.dropped = 0
+            self.reserved_channels = {}
+            self._reserve_channels()
+            # Decode in the background so the first level does not wait
+            self.loader = threading.Thread(
+                target=self._load_sounds, name="SoundLoader", daemon=True)
+            self.loader.start()
             SoundManager._initialized = True
 
+    @classmethod
+    def pre_init(cls, frequency=None, buffer=None):
+        """Configure the mixer before pygame.init() opens it.
+
+        Args:
+            frequency (int): Sample rate in Hz (defaults to FREQUENCY).
+            buffer (int): Buffer size in samples, a power of two
+                (defaults to BUFFER).
+        """
+        if frequency:
+            cls.FREQUENCY = int(frequency)
+        if buffer:
+            cls.BUFFER = int(buffer)
+        pygame.mixer.pre_init(cls.FREQUENCY, -16, 2, cls.BUFFER)
+
+    def get_latency(self):
+        """Output latency of the mixer buffer.
+
+        pygame does not report the buffer size the audio device accepted,
+        so the latency is computed from the configured buffer and the
+        sample rate the mixer actually opened with.
+
+        Returns:
+            dict: frequency (Hz), buffer (samples) and latency_ms, or
+                None when the mixer is not initialized.
+        """
+        init = pygame.mixer.get_init()
+        if not init:
+            return None
+        frequency = init[0]
+        return {"frequency": frequency, "buffer": self.BUFFER,
+                "latency_ms": self.BUFFER / frequency * 1000.0}
+
+    def is_loaded(self):
+        """Check whether the loader thread has decoded every sound."""
+        return not self.loader.is_alive()
+
+    def wait_until_loaded(self, timeout=None):
+        """Block until every sound is decoded (or the timeout expires).
+
+        Args:
+            timeout (float): Maximum wait in seconds (None: no limit).
+
+        Returns:
+            bool: True if loading is complete.
+        """
+        self.loader.join(timeout)
+        return self.is_loaded()
+
+    def _reserve_channels(self):
+        """Keep one mixer channel aside for each important cue."""
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_reserved(len(self.RESERVED))
+        for index, name in enumerate(self.RESERVED):
+            self.reserved_channels[name] = pygame.mixer.Channel(index)
+
     def _load_sounds(self):
         """Load all sound effects from the assets/sounds directory"""
+        with Tracer.current().span("load_sounds", "asset"):
+            self._load_sound_files()
+
+    def _load_sound_files(self):
+        """Decode every .wav file of the assets/sounds directory"""
+        if not pygame.mixer.get_init():
+            # No audio device: play() stays a no-op
+            return
         sounds_dir = os.path.join("assets", "sounds")
 
         # Create directory if it doesn't exist
@@ -41,19 +161,88 @@ class SoundManager:
             if filename.endswith(".wav"):
                 name = os.path.splitext(filename)[0]
                 try:
+                    # Published once fully decoded, so play() never sees
+                    # a partial sound
                     self.sounds[name] = pygame.mixer.Sound(
                         os.path.join(sounds_dir, filename))
                 except Exception as e:
                     print(f"Warning: could not load sound {filename}: {e}")
 
     def play(self, sound_name, volume=1.0):
-        """Play a sound effect by name"""
-        if sound_name in self.sounds:
-            sound = self.sounds[sound_name]
-            sound.set_volume(volume)
-            sound.play()
+        """Request a sound effect by name; it starts at the next flush().
+
+        Requests for the same sound in one frame are merged into a single
+        play at their summed volume (capped at 1.0).
+
+        Args:
+            sound_name (str): Name of the sound.
+            volume (float): Volume of this request, 0.0 to 1.0.
+        """
+        if sound_name not in self.sounds:
+            return
+        if sound_name in self.pending:
+            self.coalesced += 1
+            volume += self.pending[sound_name]
+        self.pending[sound_name] = min(1.0, volume)
+
+    def flush(self):
+        """Play the sounds requested since the last flush.
+
+        Returns:
+            int: Number of sounds started.
+        """
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, {}
+        started = 0
+        for name, volume in pending.items():
+            started += self._start(name, volume)
+        return started
+
+    def _start(self, name, volume):
+        """Start one voice of a sound, within its cap.
+
+        Returns:
+            bool: True if the sound was started.
+        """
+        sound = self.sounds[name]
+        # Forget the channels that finished or moved on to another sound
+        voices = [channel for channel in self.voices.get(name, ())
+                  if channel.get_busy() and channel.get_sound() is sound]
+        self.voices[name] = voices
+
+        channel = self.reserved_channels.get(name)
+        if channel is None or channel.get_busy():
+            # Cues whose reserved channel is busy share the other ones
+            cap = self.MAX_VOICES.get(name, self.DEFAULT_MAX_VOICES)
+            channel = (pygame.mixer.find_channel() if len(voices) < cap
+                       else None)
+        if channel is None:
+            self.dropped += 1
+            return False
+
+        channel.play(sound)
+        # Per-play volume lives on the channel, the Sound stays at 1.0
+        channel.set_volume(volume)
+        voices.append(channel)
+        self.played += 1
+        return True
+
+    def get_stats(self):
+        """Return voice counters.
+
+        Returns:
+            dict: played, coalesced and dropped sounds, and the number
+                of voices currently playing.
+        """
+        playing = sum(
+            1 for channels in self.voices.values() for channel in channels
+            if channel.get_busy())
+        return {"played": self.played, "coalesced": self.coalesced,
+                "dropped": self.dropped, "playing": playing}
 
     def stop(self, sound_name):
         """Stop a sound effect"""
         if sound_name in self.sounds:
+            self.pending.pop(sound_name, None)
             self.sounds[sound_name].stop()
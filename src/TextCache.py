@@ -0,0 +1,133 @@
+"""TextCache.py
+
+Created on 2025-10-28
+
+Shared font registry and rendered-text cache.
+Fonts are loaded once per (path, size) and rendered text surfaces are
+kept in a bounded LRU cache, so text that does not change is not
+rasterized again every frame.
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """Singleton holding every font and recently rendered text surface.
+
+    Attributes:
+        capacity (int): Maximum number of text surfaces kept.
+        fonts (dict): Loaded fonts keyed by (path, size).
+        surfaces (OrderedDict): Rendered surfaces keyed by
+            (font, text, color, antialias), least recently used first.
+        hits (int): Renders answered from the cache.
+        misses (int): Renders that had to rasterize the text.
+        evictions (int): Surfaces dropped to stay within capacity.
+
+    Class Attributes:
+        MENU_FONT (str): Path of the game's menu font.
+    """
+
+    MENU_FONT = "assets/fonts/Vanilla Pancake.ttf"
+
+    _instance = None
+    _initialized = False
+
+    def __new__(cls, capacity=256):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, capacity=256):
+        if not TextCache._initialized:
+            self.capacity = capacity
+            self.fonts = {}
+            self.surfaces = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            TextCache._initialized = True
+
+    def get_font(self, path=None, size=24):
+        """Return the shared font for a file and size.
+
+        Falls back to pygame's default font when the file cannot be
+        loaded; the fallback is remembered so the file is tried once.
+
+        Args:
+            path (str): Font file, or None for pygame's default font.
+            size (int): Font size in pixels.
+
+        Returns:
+            pygame.font.Font: The font.
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(path, size)
+            except Exception:
+                if path is None:
+                    raise
+                font = self.get_font(None, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """Render text, reusing the surface if it was rendered recently.
+
+        The returned surface is shared: callers must not draw on it.
+
+        Args:
+            font (pygame.font.Font): Font from get_font().
+            text (str): Text to render.
+            color: Text color.
+            antialias (bool): Smooth the glyph edges (default: True).
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        if not isinstance(color, (tuple, str)):
+            color = tuple(color)
+        key = (font, text, color, antialias)
+        surfaces = self.surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        surfaces[key] = surface
+        if len(surfaces) > self.capacity:
+            surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def get_stats(self):
+        """Return cache usage counters.
+
+        Returns:
+            dict: fonts, surfaces, capacity, hits, misses, evictions and
+                hit_rate (0.0 to 1.0).
+        """
+        lookups = self.hits + self.misses
+        return {
+            "fonts": len(self.fonts),
+            "surfaces": len(self.surfaces),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """Drop every cached text surface and reset the counters."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
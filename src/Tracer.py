@@ -0,0 +1,201 @@
+"""Tracer.py
+
+Created on 2025-11-04
+
+Opt-in timeline tracing in the Chrome Trace Event format.
+Spans (frames, ticks, scene updates and renders, level and asset loads,
+scene transitions) are appended to a bounded in-memory ring buffer; a
+writer thread drains it to a JSON file that chrome://tracing and
+Perfetto (ui.perfetto.dev) can open. Tracing is off unless a Tracer
+with an output file is installed (python main.py --trace trace.json).
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class Tracer:
+    """Records spans and instant events for a Chrome trace file.
+
+    The hot path only appends a tuple to a deque; formatting and file
+    writes happen on the writer thread, which wakes every
+    flush_interval seconds or when the buffer is half full. If the
+    writer falls behind, the oldest events are dropped and counted.
+
+    Attributes:
+        path (str): Output file, or None when tracing is disabled.
+        enabled (bool): True while events are recorded.
+        events (collections.deque): Ring buffer of events not yet written.
+        capacity (int): Maximum number of buffered events.
+        recorded (int): Events recorded so far.
+        written (int): Events written to the file so far.
+    """
+
+    _current = None
+
+    def __init__(self, path=None, capacity=65536, flush_interval=1.0):
+        """Initialize the tracer and start writing if a path is given.
+
+        Args:
+            path (str): Trace file to write, or None to disable tracing.
+            capacity (int): Maximum number of buffered events.
+            flush_interval (float): Seconds between two writes.
+        """
+        self.path = path
+        self.enabled = path is not None
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.events = deque(maxlen=capacity)
+        self.recorded = 0
+        self.written = 0
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._thread_names = {}
+        self._wake = threading.Event()
+        self._closing = False
+        self._file = None
+        self._writer = None
+        if self.enabled:
+            self._file = open(path, "w")
+            self._file.write("[\n")
+            self._writer = threading.Thread(
+                target=self._run, name="TraceWriter", daemon=True)
+            self._writer.start()
+
+    @classmethod
+    def current(cls):
+        """Return the installed tracer (a disabled one if none is)."""
+        if cls._current is None:
+            cls._current = cls()
+        return cls._current
+
+    def install(self):
+        """Make this tracer the one returned by Tracer.current().
+
+        Returns:
+            Tracer: self, for chaining.
+        """
+        Tracer._current = self
+        return self
+
+    def start(self):
+        """Timestamp the start of a span (see complete())."""
+        return time.perf_counter() if self.enabled else 0.0
+
+    def _record(self, event):
+        """Buffer an event and wake the writer when half full."""
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        self.events.append(event + (tid,))
+        self.recorded += 1
+        if len(self.events) >= self.capacity // 2:
+            self._wake.set()
+
+    def complete(self, name, category, start, args=None):
+        """Record a span that started at start() and ends now.
+
+        Args:
+            name (str): Span name.
+            category (str): Category ("frame", "game", "scene", "asset").
+            start (float): Value returned by start().
+            args (dict): Extra values shown with the span.
+        """
+        if self.enabled:
+            self._record(("X", name, category, start,
+                          time.perf_counter() - start, args))
+
+    def instant(self, name, category, args=None):
+        """Record a point in time (e.g. a state change).
+
+        Args:
+            name (str): Event name.
+            category (str): Event category.
+            args (dict): Extra values shown with the event.
+        """
+        if self.enabled:
+            self._record(("i", name, category, time.perf_counter(), 0.0,
+                          args))
+
+    @contextmanager
+    def span(self, name, category, args=None):
+        """Context manager recording a span, for code off the hot path.
+
+        Args:
+            name (str): Span name.
+            category (str): Span category.
+            args (dict): Extra values shown with the span.
+        """
+        start = self.start()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, args)
+
+    def _format(self, event):
+        """Convert a buffered event to a Trace Event Format dict."""
+        phase, name, category, start, duration, args, tid = event
+        data = {"name": name, "cat": category, "ph": phase,
+                "ts": (start - self._origin) * 1e6,
+                "pid": self.pid, "tid": tid}
+        if phase == "X":
+            data["dur"] = duration * 1e6
+        else:
+            data["s"] = "t"
+        if args:
+            data["args"] = args
+        return data
+
+    def flush(self):
+        """Write every buffered event to the file (writer thread)."""
+        lines = []
+        events = self.events
+        while events:
+            try:
+                event = events.popleft()
+            except IndexError:
+                break
+            lines.append(json.dumps(self._format(event), default=str))
+        if lines:
+            self._file.write(",\n".join(lines) + ",\n")
+            self.written += len(lines)
+
+    def _run(self):
+        """Writer thread: drain the buffer periodically until closed."""
+        while not self._closing:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def get_dropped(self):
+        """Number of events lost because the buffer was full."""
+        return self.recorded - self.written - len(self.events)
+
+    def close(self):
+        """Stop tracing, write the remaining events and close the file."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._closing = True
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self.pid,
+                     "tid": tid, "args": {"name": name}}
+                    for tid, name in list(self._thread_names.items())]
+        metadata.append({"name": "trace_stats", "cat": "trace", "ph": "i",
+                         "s": "g", "pid": self.pid, "tid": 0,
+                         "ts": (time.perf_counter() - self._origin) * 1e6,
+                         "args": {"recorded": self.recorded,
+                                  "dropped": self.get_dropped()}})
+        self._file.write(",\n".join(json.dumps(m) for m in metadata) + "\n]\n")
+        self._file.close()
+        print(f"Trace written to {self.path} ({self.written} events, "
+              f"{self.get_dropped()} dropped)")
@@ -11,6 +11,7 @@ __version__ = "1.0"
 import pygame
 from .Scene import Scene
 from .MenuButton import MenuButton
+from .TextCache import TextCache
 
 
 class VictoryScreen(Scene):
@@ -40,16 +41,11 @@ class VictoryScreen(Scene):
             self.screen_width = 800
             self.screen_height = 600
 
-        # Load fonts
-        try:
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 60)
-            self.info_font = pygame.font.Font(None, 40)
-        except Exception:
-            # Fallback to default font
-            self.title_font = pygame.font.Font(None, 100)
-            self.score_font = pygame.font.Font(None, 60)
-            self.info_font = pygame.font.Font(None, 40)
+        # Load fonts (shared with the rest of the game)
+        text_cache = TextCache()
+        self.title_font = text_cache.get_font(None, 100)
+        self.score_font = text_cache.get_font(None, 60)
+        self.info_font = text_cache.get_font(None, 40)
 
         # Create buttons
         if has_next_level:
@@ -61,37 +57,39 @@ class VictoryScreen(Scene):
 
     def render(self, screen):
         """Render the victory screen."""
+        text_cache = TextCache()
         # Fill background with dark color
         screen.fill((20, 30, 50))
 
         # Render "LEVEL COMPLETE" text
         victory_text = "LEVEL COMPLETE!"
         victory_color = (50, 255, 100)
-        victory_surface = self.title_font.render(
-            victory_text, True, victory_color)
+        victory_surface = text_cache.render(
+            self.title_font, victory_text, victory_color)
         victory_rect = victory_surface.get_rect(
             center=(self.screen_width // 2, 120))
         screen.blit(victory_surface, victory_rect)
 
         # Render level number
         level_text = f"Level {self.level_number}"
-        level_surface = self.info_font.render(
-            level_text, True, (200, 200, 200))
+        level_surface = text_cache.render(
+            self.info_font, level_text, (200, 200, 200))
         level_rect = level_surface.get_rect(
             center=(self.screen_width // 2, 220))
         screen.blit(level_surface, level_rect)
 
         # Render "SCORE" label
         score_label = "SCORE"
-        label_surface = self.info_font.render(
-            score_label, True, (200, 200, 200))
+        label_surface = text_cache.render(
+            self.info_font, score_label, (200, 200, 200))
         label_rect = label_surface.get_rect(
             center=(self.screen_width // 2, 300))
         screen.blit(label_surface, label_rect)
 
         # Render score
         score_text = str(self.score)
-        score_surface = self.score_font.render(score_text, True, (255, 215, 0))
+        score_surface = text_cache.render(
+            self.score_font, score_text, (255, 215, 0))
         score_rect = score_surface.get_rect(
             center=(self.screen_width // 2, 370))
         screen.blit(score_surface, score_rect)
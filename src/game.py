@@ -9,37 +9,58 @@ __author__ = "carras_a"
 __version__ = "1.0"
 
 
-import pygame
+import importlib
 import os
+import sys
 
-from .MainMenu import MainMenu
-from .SettingsMenu import SettingsMenu
-from .PongMenu import PongMenu
-from .BrickMenu import BrickMenu
+# Scene modules (MainMenu, PongLevel, ...) are imported on first use, see
+# Game.get_scene_class()
 from .Scene import Scene
 from .Menu import Menu
-from .PongLevel import PongLevel
-from .ScoreScreen import ScoreScreen
-from .GameOverScreen import GameOverScreen
-from .VictoryScreen import VictoryScreen
-from .BrickBreakerLevel import BrickBreakerLevel
+from .GameClock import GameClock
+from .InputState import InputState
+from .FrameContext import FrameContext
+from .LevelCompiler import LevelCompiler
+from .LevelPrefetcher import LevelPrefetcher
+from .FrameProfiler import FrameProfiler
+from .Tracer import Tracer
+from .SoundManager import SoundManager
+from .TextCache import TextCache
 
 
 class Game:
+    # Area covered by the FPS overlay (the profiler HUD)
+    FPS_RECT = FrameProfiler.HUD_RECT
+
     def __init__(self):
         """Initialize the main game class."""
         self.screen = None
         self.is_running = False
         self.fps_limit = 240
+        # Simulation runs at a fixed rate, independent of fps_limit
+        self.tick_rate = 120
+        self.max_ticks_per_frame = 8
+        self.game_clock = GameClock(self.tick_rate).install()
+        self.input = InputState().install()
+        self.frame = None
         self.state = 0
-        self.scene = MainMenu()
+        # The first scene is created by start()
+        self.scene = None
         # Store game settings
         self.pong_players = 2
         self.pong_difficulty = "HARD"
         self.brick_current_level = 1
         self.brick_players = 1
         self.brick_score = 0
+        # Next brick level, loaded while the victory screen is shown
+        self.level_prefetcher = LevelPrefetcher()
         self.show_fps = False
+        # Per-phase frame timings, measured while the F3 HUD is shown
+        self.profiler = FrameProfiler().install()
+        # Dirty-rect rendering (opt-in): only changed areas are redrawn
+        self.dirty_rects_enabled = False
+        self.dirty_rects = None
+        self._render_key = None
         self.is_sound_on = True
         self.clock = None
         pass
@@ -59,22 +80,101 @@ class Game:
         self.scene = scene
 
     def start(self):
-        """Start the game loop."""
+        """Start the game loop, on the main menu."""
         self.is_running = True
+        if self.scene is None:
+            self.scene = self.create_scene("MainMenu")
         pass
 
+    @staticmethod
+    def get_scene_class(name):
+        """Return a scene class, importing its module on first use.
+
+        Args:
+            name (str): Class name, which is also its module name.
+
+        Returns:
+            type: The scene class.
+        """
+        module = sys.modules.get(f"{__package__}.{name}")
+        if module is None:
+            with Tracer.current().span("import_scene", "scene",
+                                       {"scene": name}):
+                module = importlib.import_module(f".{name}", __package__)
+        return getattr(module, name)
+
+    def create_scene(self, name, *args, **kwargs):
+        """Create a scene by class name (see get_scene_class())."""
+        return self.get_scene_class(name)(*args, **kwargs)
+
+    def scene_is(self, name):
+        """Check the current scene's class without importing its module.
+
+        Args:
+            name (str): Scene class name.
+
+        Returns:
+            bool: True if the current scene is an instance of that class.
+        """
+        module = sys.modules.get(f"{__package__}.{name}")
+        return module is not None and isinstance(self.scene,
+                                                 getattr(module, name))
+
     def stop(self):
         """Stop the game loop."""
         self.is_running = False
 
+    def begin_frame(self, events):
+        """Prepare the shared per-frame state before simulating.
+
+        Args:
+            events (list): Events pulled from the queue this frame.
+        """
+        self.frame = FrameContext.begin_frame()
+        self.capture_input(events)
+
+    def capture_input(self, events):
+        """Take the input snapshot every object reads during this frame.
+
+        Args:
+            events (list): Events pulled from the queue this frame.
+        """
+        self.input = InputState.capture(events, carry=self.input).install()
+
     def update(self):
-        """Update the game state."""
+        """Advance the game by one fixed simulation tick."""
+        tracer = Tracer.current()
+        start = tracer.start()
+        self.game_clock.advance()
 
         # Get the state and clean up the current scene if needed
-        result = self.scene.update()
+        scene = self.scene
+        scene_start = tracer.start()
+        result = scene.update()
+        # Span names and args are only built while tracing
+        if tracer.enabled:
+            tracer.complete(f"{type(scene).__name__}.update", "scene",
+                            scene_start)
+        # Presses and releases belong to the first tick of the frame only
+        self.input = self.input.held().install()
         if isinstance(self.scene, Menu):
             self.scene.cleanup()
 
+        transition_start = tracer.start()
+        self.handle_result(result)
+        if tracer.enabled and self.scene is not scene:
+            tracer.complete("transition", "scene", transition_start, {
+                "from": type(scene).__name__,
+                "to": type(self.scene).__name__,
+                "result": result})
+        tracer.complete("Game.update", "game", start)
+
+    def handle_result(self, result):
+        """Switch scenes or apply settings according to a scene's result.
+
+        Args:
+            result: Value returned by the current scene's update().
+        """
         # Handle tuple results (for passing data between scenes)
         if isinstance(result, tuple):
             # Case for SCORE_SCREEN (Pong)
@@ -83,13 +183,15 @@ class Game:
                 winner = result[1]
                 p1_score = result[2]
                 p2_score = result[3]
-                self.scene = ScoreScreen(winner, p1_score, p2_score)
+                self.scene = self.create_scene(
+                    "ScoreScreen", winner, p1_score, p2_score)
                 return None
             # Case for GAME_OVER (Brick Breaker)
             if result[0] == "GAME_OVER":
                 # result = ("GAME_OVER", score)
                 score = result[1]
-                self.scene = GameOverScreen(score)
+                self.scene = self.create_scene(
+                    "GameOverScreen", score)
                 return None
             # Case for LEVEL_COMPLETE (Brick Breaker)
             if result[0] == "LEVEL_COMPLETE":
@@ -100,33 +202,39 @@ class Game:
                 self.brick_current_level = level_number + 1
 
                 # Check if next level exists
-                next_level_file = f"levels/level_{
-                    self.brick_current_level:03d}.txt"
+                next_level_file = LevelCompiler.level_path(
+                    self.brick_current_level)
                 has_next_level = os.path.exists(next_level_file)
+                if has_next_level:
+                    self.level_prefetcher.start(
+                        self.brick_current_level, FrameContext.current().size)
 
-                self.scene = VictoryScreen(level_number, score, has_next_level)
+                self.scene = self.create_scene(
+                    "VictoryScreen", level_number, score, has_next_level)
                 return None
             if result[0] == "START_PONG":
                 # Get settings from PongMenu if available
-                if isinstance(self.scene, PongMenu):
+                if self.scene_is("PongMenu"):
                     player_count = self.scene.player_counts[self.scene.player_index]
                     difficulty = self.scene.difficulties[self.scene.diff_index].upper(
                     )
                     self.pong_players = player_count
                     self.pong_difficulty = difficulty
-                self.scene = PongLevel(
+                self.scene = self.create_scene(
+                    "PongLevel",
                     players=self.pong_players,
                     difficulty=self.pong_difficulty)
                 return None
             if result[0] == "START_BRICk":
                 # Get settings from BrickMenu if available
-                if isinstance(self.scene, BrickMenu):
+                if self.scene_is("BrickMenu"):
                     player_count = self.scene.player_counts[self.scene.player_index]
                     self.brick_players = player_count
                 # Reset to level 1 when starting new game
                 self.brick_current_level = 1
                 self.brick_score = 0
-                self.scene = BrickBreakerLevel(
+                self.scene = self.create_scene(
+                    "BrickBreakerLevel",
                     players=self.brick_players, level_number=1)
                 return None
 
@@ -135,62 +243,159 @@ class Game:
             case "EXIT":
                 self.stop()
             case "SETTINGS":
-                self.scene = SettingsMenu((self.fps_limit, self.is_sound_on))
+                self.scene = self.create_scene(
+                    "SettingsMenu",
+                    (self.fps_limit, self.is_sound_on, self.tick_rate))
             case "PLAY_PONG":
-                self.scene = PongMenu()
+                self.scene = self.create_scene("PongMenu")
             case "PLAY_BRICK":
-                self.scene = BrickMenu()
+                self.scene = self.create_scene("BrickMenu")
             case "PLAY_BRICK_GAME":
                 # Reset to level 1
                 self.brick_current_level = 1
                 self.brick_score = 0
-                self.scene = BrickBreakerLevel(players=1, level_number=1)
+                self.scene = self.create_scene(
+                    "BrickBreakerLevel", players=1, level_number=1)
             case "NEXT_LEVEL":
-                # Load next level with current score and player count
-                self.scene = BrickBreakerLevel(
+                # Load next level with current score and player count,
+                # swapping in the prefetched bricks when they are ready
+                brick_field = self.level_prefetcher.take(
+                    self.brick_current_level, FrameContext.current().size)
+                self.scene = self.create_scene(
+                    "BrickBreakerLevel",
                     players=self.brick_players,
-                    level_number=self.brick_current_level)
+                    level_number=self.brick_current_level,
+                    brick_field=brick_field)
             case "MAIN_MENU":
                 # Reset brick breaker progress when returning to menu
                 self.brick_current_level = 1
                 self.brick_score = 0
-                self.scene = MainMenu()
+                self.level_prefetcher.cancel()
+                self.scene = self.create_scene("MainMenu")
             case "SOUND_TOGGLE":
                 self.is_sound_on = not self.is_sound_on
 
-        # If the current scene is the SettingsMenu, apply FPS settings to the
-        # game
-        if isinstance(self.scene, SettingsMenu):
+        # If the current scene is the SettingsMenu, apply FPS and tick rate
+        # settings to the game
+        if self.scene_is("SettingsMenu"):
             self.fps_limit = int(self.scene.fps_options[self.scene.fps_index])
+            tick_rate = int(self.scene.tick_options[self.scene.tick_index])
+            if tick_rate != self.tick_rate:
+                self.tick_rate = tick_rate
+                self.game_clock.set_tick_rate(tick_rate)
 
         return None
 
     def toggle_fps_display(self):
         self.show_fps = not self.show_fps
+        self.profiler.set_enabled(self.show_fps)
         return
 
     def handle_fps_display(self):
-        fps = int(self.clock.get_fps())
-        try:
-            font = pygame.font.Font('assets/fonts/Vanilla Pancake.ttf', 18)
-        except Exception:
-            font = pygame.font.Font(None, 18)
-        text = font.render(f"FPS: {fps}", True, (255, 255, 255))
-        bg = pygame.Surface((text.get_width() + 8, text.get_height() + 6))
-        bg.set_alpha(180)
-        bg.fill((0, 0, 0))
-        self.screen.blit(bg, (10, 10))
-        self.screen.blit(text, (14, 12))
+        """Draw the profiler HUD: FPS, frame phases, graph and counts."""
+        if isinstance(self.scene, Scene):
+            self.profiler.counts = self.scene.get_object_counts()
+        text = TextCache().get_stats()
+        self.profiler.notes = [f"text cache {text['hit_rate']:.0%} hits  "
+                               f"{text['surfaces']}/{text['capacity']}"]
+        latency = SoundManager().get_latency()
+        if latency:
+            self.profiler.notes.append(
+                f"audio latency {latency['latency_ms']:.1f} ms "
+                f"({latency['buffer']} @ {latency['frequency']} Hz)")
+        self.profiler.render(self.screen, self.clock.get_fps())
         return
 
+    def advance(self, frame_time, accumulator):
+        """Run as many fixed simulation ticks as the elapsed time allows.
+
+        The game clock decides how many ticks that is, taking pause,
+        manual stepping and time scale into account.
+
+        Args:
+            frame_time (float): Wall-clock seconds since the last frame.
+            accumulator (float): Simulation time not yet consumed.
+
+        Returns:
+            float: The leftover accumulator for the next frame.
+        """
+        clock = self.game_clock
+        ticks, accumulator = clock.consume(frame_time, accumulator)
+        if ticks > self.max_ticks_per_frame and not clock.paused:
+            # Too far behind: drop the backlog instead of spiralling
+            ticks = self.max_ticks_per_frame
+            accumulator = 0.0
+        for _ in range(ticks):
+            if not self.is_running:
+                break
+            self.update()
+        # Sounds requested by this frame's ticks play once each
+        SoundManager().flush()
+
+        # Render between the last two physics states
+        clock.alpha = 1.0 if clock.paused else min(1.0, accumulator / clock.dt)
+        return accumulator
+
     def render(self):
-        """Render the current scene."""
+        """Render the current scene.
+
+        In dirty-rect mode only the areas that changed are redrawn and
+        listed in self.dirty_rects for pygame.display.update(). The whole
+        screen is redrawn (and self.dirty_rects set to None) on the first
+        frame of a scene, after a resolution change, when the scene's
+        render key changes (e.g. pause) or when an object cannot report
+        its areas.
+        """
+        tracer = Tracer.current()
+        start = tracer.start()
+        self.dirty_rects = None
+        if self.dirty_rects_enabled and self.frame is not None:
+            if self.render_dirty():
+                if tracer.enabled:
+                    tracer.complete("Game.render", "game", start,
+                                    {"dirty_rects": len(self.dirty_rects)})
+                return
+
         # Clear screen for new render
         self.screen.fill("BLACK")
 
         # Check if scene is a Scene instance
         if isinstance(self.scene, Scene):
+            scene_start = tracer.start()
             self.scene.render(self.screen)
+            if tracer.enabled:
+                tracer.complete(f"{type(self.scene).__name__}.render",
+                                "scene", scene_start)
+            if self.dirty_rects_enabled:
+                # Keep the areas drawn this frame for the next dirty pass
+                self.scene.get_dirty_rects()
 
         if self.show_fps and self.clock:
             self.handle_fps_display()
+        tracer.complete("Game.render", "game", start)
+
+    def render_dirty(self):
+        """Redraw only what changed, when the previous frame allows it.
+
+        Returns:
+            bool: True if the frame was rendered, False if a full redraw
+                is needed instead.
+        """
+        if not isinstance(self.scene, Scene):
+            return False
+        key = (self.scene, self.frame.bounds.size, self.frame.surface,
+               self.scene.get_render_key(), self.show_fps)
+        same_frame = key == self._render_key
+        self._render_key = key
+        if not same_frame:
+            return False
+
+        extra = [self.FPS_RECT] if self.show_fps and self.clock else []
+        rects = self.scene.render_dirty(
+            self.screen, self.frame.bounds, extra=extra)
+        if rects is None:
+            return False
+        if extra:
+            self.handle_fps_display()
+        self.dirty_rects = rects
+        return True
@@ -0,0 +1,123 @@
+"""test_paddle_bounce.py
+
+Created on 2025-11-06
+
+Regression tests for swept bounces that used to leave the ball stuck:
+paddle hits on a face other than the paddle's main one (its side in
+Brick Breaker, its top or bottom in Pong), and a ball ending a step
+right on a wall.
+
+    python -m unittest discover tests
+"""
+__author__ = "carras_a"
+__version__ = "1.0"
+
+
+import unittest
+from types import SimpleNamespace
+import pygame
+from src.Ball import Ball
+from src.BallSystem import BallSystem
+from src.GameClock import GameClock
+from src.HeadlessRunner import HeadlessRunner
+from src.InputState import InputState
+
+
+class PaddleFaceTest(unittest.TestCase):
+    """A ball hitting a paddle's secondary face or a wall must bounce
+    off it and keep moving."""
+
+    # Enough ticks to reach the paddle, but not the bottom of the screen
+    TICKS = 5
+
+    @classmethod
+    def setUpClass(cls):
+        HeadlessRunner.init_display((1280, 720))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        GameClock(120).install()
+        InputState().install()
+
+    def run_system(self, game_mode, paddles, position, velocity):
+        """Step a one-ball BallSystem and return its positions."""
+        system = BallSystem(game_mode, max_balls=1)
+        system.spawn(has_to_wait=False, position=position)
+        system.vel[0] = velocity
+        system.set_colliders(paddles=paddles)
+        positions = []
+        for _ in range(self.TICKS):
+            GameClock.current().advance()
+            system.update()
+            positions.append(tuple(system.pos[0]))
+        return positions, tuple(system.vel[0])
+
+    def run_ball(self, game_mode, paddles, position, velocity):
+        """Step a single Ball and return its positions."""
+        ball = Ball(game_mode, has_to_wait=False)
+        ball.setPosition(position)
+        ball.velocity = list(velocity)
+        ball.paddles = paddles
+        positions = []
+        for _ in range(self.TICKS):
+            GameClock.current().advance()
+            ball.update()
+            positions.append(tuple(ball.position))
+        return positions, tuple(ball.velocity)
+
+    def assert_moving(self, positions):
+        """The ball must never stay in place for two ticks in a row."""
+        for before, after in zip(positions, positions[1:]):
+            self.assertNotEqual(before, after)
+
+    def brick_side_hit(self, run):
+        # Falling ball reaching the left side of the paddle
+        paddle = SimpleNamespace(rect=pygame.Rect(570, 680, 120, 20))
+        positions, velocity = run("BRICK", [paddle], (556, 683), (300, 400))
+        self.assert_moving(positions)
+        self.assertLess(velocity[0], 0)
+
+    def pong_top_hit(self, run):
+        # Ball coming down onto the top of a paddle
+        paddle = SimpleNamespace(rect=pygame.Rect(40, 290, 20, 120))
+        positions, velocity = run("PONG", [paddle], (45, 275), (-100, 400))
+        self.assert_moving(positions)
+        self.assertLess(velocity[1], 0)
+
+    def pong_top_wall_hit(self, run):
+        # Bounces off the top wall half way, landing back on y=3
+        positions, velocity = run("PONG", [], (600, 3.0), (100, -720))
+        self.assert_moving(positions)
+        self.assertGreater(velocity[1], 0)
+
+    def brick_left_wall_hit(self, run):
+        positions, velocity = run("BRICK", [], (3.0, 300), (-720, 100))
+        self.assert_moving(positions)
+        self.assertGreater(velocity[0], 0)
+
+    def test_ball_system_brick_side(self):
+        self.brick_side_hit(self.run_system)
+
+    def test_ball_system_pong_top(self):
+        self.pong_top_hit(self.run_system)
+
+    def test_ball_brick_side(self):
+        self.brick_side_hit(self.run_ball)
+
+    def test_ball_pong_top(self):
+        self.pong_top_hit(self.run_ball)
+
+    def test_ball_system_walls(self):
+        self.pong_top_wall_hit(self.run_system)
+        self.brick_left_wall_hit(self.run_system)
+
+    def test_ball_walls(self):
+        self.pong_top_wall_hit(self.run_ball)
+        self.brick_left_wall_hit(self.run_ball)
+
+
+if __name__ == "__main__":
+    unittest.main()